@@ -0,0 +1,125 @@
+"""Generation under a traffic spike, with and without admission control
+
+``--sessions`` threads, each a Streamlit script thread, submit one game at
+the same instant to a shared ``GenerationRunner`` whose backend takes
+``--latency-ms`` per game and handles at most ``--capacity`` games at once
+(further calls wait their turn, as an overloaded service makes them). The
+spike runs twice:
+
+- unbounded: a gate too large to ever turn anyone away, i.e. no admission
+  control; every thread stays blocked until its game is done
+- bounded: the default gate (``INDIC_GAMES_GENERATION_*``) or the
+  ``--workers``/``--queue-depth``/``--queue-timeout`` given
+
+Reports games generated and turned away (by reason), how long an accepted
+submission took and how fast a rejected one got its answer (p50/p95), the
+script-thread seconds spent blocked in all and the gate's own counters.
+
+    python benchmarks/bench_admission.py --sessions 200 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games import admission  # noqa: E402
+from indic_games.backends import GenerationBackend, StaticBackend  # noqa: E402
+from indic_games.catalog import GENRES, LANGUAGES, THEMES  # noqa: E402
+from indic_games.pipeline import GenerationRunner  # noqa: E402
+
+
+class SlowBackend(GenerationBackend):
+    """Default content after ``latency`` seconds, ``capacity`` calls at a time"""
+
+    def __init__(self, latency, capacity):
+        self.latency = latency
+        self.capacity = capacity
+        self._slots = None
+
+    async def generate(self, request):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.capacity)
+        async with self._slots:
+            await asyncio.sleep(self.latency)
+        return StaticBackend._result
+
+
+def spike_requests(count):
+    languages = list(LANGUAGES)
+    return [{
+        'title': f"Spike Game {number}",
+        'genre': GENRES[number % len(GENRES)],
+        'theme': THEMES[number % len(THEMES)],
+        'language': languages[number % len(languages)],
+    } for number in range(count)]
+
+
+def _percentiles(values):
+    values = sorted(values)
+    if not values:
+        return {'p50_ms': 0.0, 'p95_ms': 0.0}
+    return {'p50_ms': round(values[len(values) // 2] * 1000, 2),
+            'p95_ms': round(values[int(len(values) * 0.95) - 1 if len(values) > 1 else 0] * 1000, 2)}
+
+
+def run_spike(gate, sessions, latency, capacity):
+    runner = GenerationRunner(SlowBackend(latency, capacity), gate=gate)
+    requests = spike_requests(sessions)
+    barrier = threading.Barrier(sessions)
+
+    def session(number):
+        barrier.wait()
+        start = time.perf_counter()
+        try:
+            runner.submit(requests[number], session=number).result(timeout=None)
+            outcome = 'generated'
+        except admission.BusyError as e:
+            outcome = e.reason
+        return outcome, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(sessions) as pool:
+        outcomes = list(pool.map(session, range(sessions)))
+    elapsed = time.perf_counter() - start
+    runner.close()
+    rejected = [seconds for outcome, seconds in outcomes if outcome != 'generated']
+    return {
+        'generated': sum(outcome == 'generated' for outcome, _ in outcomes),
+        'rejected': {reason: sum(outcome == reason for outcome, _ in outcomes)
+                     for reason in admission.REJECT_REASONS},
+        'seconds': round(elapsed, 3),
+        'generated_latency': _percentiles([s for outcome, s in outcomes if outcome == 'generated']),
+        'rejected_latency': _percentiles(rejected),
+        'blocked_thread_seconds': round(sum(seconds for _, seconds in outcomes), 3),
+        'gate': gate.stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--latency-ms', type=float, default=200, help="backend time per game")
+    parser.add_argument('--capacity', type=int, default=8, help="games the backend serves at once")
+    parser.add_argument('--workers', type=int, default=admission.GENERATION_WORKERS)
+    parser.add_argument('--queue-depth', type=int, default=admission.GENERATION_QUEUE_DEPTH)
+    parser.add_argument('--queue-timeout', type=float, default=admission.GENERATION_QUEUE_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    load = (args.sessions, args.latency_ms / 1000, args.capacity)
+    unbounded = admission.AdmissionGate(workers=args.sessions, max_queue=0, queue_timeout=None)
+    bounded = admission.AdmissionGate(args.workers, args.queue_depth, args.queue_timeout)
+    print(json.dumps({
+        'unbounded': run_spike(unbounded, *load),
+        'bounded': run_spike(bounded, *load),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""Throughput/latency benchmark for the HTTP API
+
+Starts ``python -m indic_games.api`` in a subprocess (or targets a running
+server with ``--host``/``--port``) and drives it with keep-alive connections.
+Generations the server's admission gate turns away (429/503 with
+``Retry-After``) are counted as ``rejected``, not as errors:
+
+    python benchmarks/bench_api.py --concurrency 64 --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENERATE_BODY = json.dumps({
+    'title': "Krishna's Adventure",
+    'genre': 'adventure',
+    'theme': 'Mythology - Krishna Leela',
+    'language': 'hindi',
+    'description': 'An epic journey of Lord Krishna'
+}).encode('utf-8')
+
+
+def _request(method, path, body=b''):
+    head = (f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+MIXES = {
+    'generate': [_request('POST', '/api/generate-game', GENERATE_BODY)],
+    'languages': [_request('GET', '/api/languages')],
+    'themes': [_request('GET', '/api/themes')],
+    'mixed': [
+        _request('POST', '/api/generate-game', GENERATE_BODY),
+        _request('GET', '/api/languages'),
+        _request('GET', '/api/themes'),
+        _request('GET', '/api/games/missing'),
+    ],
+}
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head[9:12])
+    length = 0
+    for line in head.split(b'\r\n'):
+        if line[:15].lower() == b'content-length:':
+            length = int(line[15:])
+    await reader.readexactly(length)
+    return status
+
+
+BUSY_STATUSES = (429, 503)
+
+
+async def _client(host, port, requests, count, latencies, errors, rejected):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(count):
+            start = time.perf_counter()
+            writer.write(requests[i % len(requests)])
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status in BUSY_STATUSES:
+                rejected.append(status)
+            elif status >= 500:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(host, port, concurrency, total, mix):
+    latencies, errors, rejected = [], [], []
+    per_client = max(1, total // concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, MIXES[mix], per_client, latencies, errors, rejected)
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'mix': mix,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rejected': len(rejected),
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'latency_ms': {
+            f'p{p}': round(_percentile(latencies, p) * 1000, 3) for p in (50, 95, 99)
+        },
+    }
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(host, port, timeout=15):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"API server did not start on {host}:{port}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default=None, help="benchmark an already running server")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=20_000)
+    parser.add_argument('--mix', choices=sorted(MIXES), default='mixed')
+    args = parser.parse_args(argv)
+
+    server = None
+    host, port = args.host, args.port
+    db_dir = tempfile.TemporaryDirectory()
+    if host is None:
+        host, port = '127.0.0.1', _free_port()
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'indic_games.api', '--host', host, '--port', str(port),
+             '--db', os.path.join(db_dir.name, 'bench.db')],
+            cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    try:
+        _wait_for_port(host, port)
+        result = asyncio.run(run(host, port, args.concurrency, args.requests, args.mix))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        db_dir.cleanup()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
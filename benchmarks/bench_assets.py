@@ -0,0 +1,112 @@
+"""Memory and size of exports with game assets, bundled versus concatenated
+
+Builds a synthetic asset tree (a shared logo, a large image per theme
+category that is also copied under a second name, and a font and a
+narration track per language), then exports every prebuilt game in every
+language two ways and reports peak traced memory, output size and time:
+
+- concatenated: each page built as one string with every asset read into
+  memory and base64-inlined, as string templating would do it
+- bundled: ``stream_export_zip`` with an ``AssetBundle``, which mmaps each
+  distinct file once, inlines only small ones and stores the rest once
+
+    python benchmarks/bench_assets.py --image-kb 400 --audio-kb 800
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.assets import MIME_TYPES, AssetLibrary  # noqa: E402
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES  # noqa: E402
+from indic_games.export import render_entry, select_entries, write_export_zip  # noqa: E402
+from indic_games.theme_index import split_theme  # noqa: E402
+
+
+def build_asset_tree(root, image_kb, audio_kb, font_kb):
+    def write(path, size):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size))
+
+    write(os.path.join(root, 'common', 'logo.png'), 4 * 1024)
+    for category in sorted({split_theme(game['theme'])[0].lower() for game in PREBUILT_GAMES}):
+        art = os.path.join(root, 'themes', category, 'cover.webp')
+        write(art, image_kb * 1024)
+        # Same picture under another name, as asset folders tend to have
+        with open(art, 'rb') as src, open(os.path.join(root, 'themes', category, 'cover-copy.webp'), 'wb') as dst:
+            dst.write(src.read())
+    for language in LANGUAGES:
+        write(os.path.join(root, 'languages', language, 'script.woff2'), font_kb * 1024)
+        write(os.path.join(root, 'languages', language, 'narration.mp3'), audio_kb * 1024)
+
+
+def concatenated_page(game, language, library):
+    """One string per page, every asset read and inlined"""
+    page = render_entry(game, language).decode('utf-8')
+    tags = ''
+    for path in library.files_for(game, language):
+        with open(path, 'rb') as f:
+            data = base64.b64encode(f.read()).decode('ascii')
+        mime = MIME_TYPES[os.path.splitext(path)[1].lower()]
+        tags += f'<img src="data:{mime};base64,{data}">' if mime.startswith('image') else \
+            f'<audio src="data:{mime};base64,{data}"></audio>'
+    return page.replace('<!-- game-assets -->', tags)
+
+
+def export_concatenated(out_path, library):
+    with zipfile.ZipFile(out_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for game, language in select_entries(PREBUILT_GAMES, LANGUAGES):
+            archive.writestr(f"{language}/{game['title']}.html", concatenated_page(game, language, library))
+
+
+def export_bundled(out_path, library):
+    with open(out_path, 'wb') as out:
+        write_export_zip(out, PREBUILT_GAMES, LANGUAGES, library=library)
+
+
+def measure(export, out_path, library):
+    tracemalloc.start()
+    start = time.perf_counter()
+    export(out_path, library)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'seconds': round(elapsed, 3),
+        'peak_mb': round(peak / 1e6, 2),
+        'output_mb': round(os.path.getsize(out_path) / 1e6, 2),
+    }
+
+
+def run(image_kb, audio_kb, font_kb):
+    with tempfile.TemporaryDirectory() as tmp:
+        build_asset_tree(os.path.join(tmp, 'assets'), image_kb, audio_kb, font_kb)
+        library = AssetLibrary(os.path.join(tmp, 'assets'))
+        return {
+            'pages': sum(1 for _ in select_entries(PREBUILT_GAMES, LANGUAGES)),
+            'asset_sizes_kb': {'image': image_kb, 'audio': audio_kb, 'font': font_kb},
+            'concatenated': measure(export_concatenated, os.path.join(tmp, 'concat.zip'), library),
+            'bundled': measure(export_bundled, os.path.join(tmp, 'bundled.zip'), library),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--image-kb', type=int, default=400)
+    parser.add_argument('--audio-kb', type=int, default=800)
+    parser.add_argument('--font-kb', type=int, default=12)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.image_kb, args.audio_kb, args.font_kb), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Throughput and latency of generation backend clients against the mock service
+
+Starts ``indic_games.mock_backend`` in-process and sends the same set of
+distinct game requests through several clients:
+
+- sequential: one blocking ``urllib`` POST per request, a new connection
+  each time, as a straightforward synchronous client would do it
+- pooled: ``HttpBackend`` with keep-alive connections and every request
+  concurrent, but one request per batch
+- batched: ``HttpBackend`` with its defaults, coalescing concurrent
+  requests into batches
+- cached: the batched client asked the same requests again
+- flaky: the batched client against a service failing a share of batches
+
+Reports requests per second, per-request p50/p95 latency and the client's
+counters (batches, connections opened, retries, cache hits).
+
+    python benchmarks/bench_backend.py --requests 400 --latency-ms 40
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.backends import HttpBackend, content_request  # noqa: E402
+from indic_games.catalog import GENRES, LANGUAGES, THEMES  # noqa: E402
+from indic_games.memo import MemoCache  # noqa: E402
+from indic_games.mock_backend import start_mock_backend  # noqa: E402
+
+
+def make_requests(count):
+    languages = list(LANGUAGES)
+    return [content_request({
+        'title': f"Game {number}",
+        'genre': GENRES[number % len(GENRES)],
+        'theme': THEMES[number % len(THEMES)],
+        'language': languages[number % len(languages)],
+    }) for number in range(count)]
+
+
+def summarize(elapsed, latencies, extra=None):
+    latencies = sorted(latencies)
+    return {
+        'requests_per_s': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies) * 1000, 2),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        **(extra or {}),
+    }
+
+
+async def run_sequential(url, requests):
+    def post(request):
+        body = json.dumps({'requests': [request]}).encode('utf-8')
+        call = urllib.request.Request(f"{url}/v1/generate", data=body,
+                                      headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(call, timeout=10) as response:
+            return json.loads(response.read())['results'][0]
+
+    loop = asyncio.get_running_loop()
+    latencies = []
+    start = time.perf_counter()
+    for request in requests:
+        sent = time.perf_counter()
+        await loop.run_in_executor(None, post, request)
+        latencies.append(time.perf_counter() - sent)
+    return summarize(time.perf_counter() - start, latencies)
+
+
+async def run_client(backend, requests):
+    async def timed(request):
+        sent = time.perf_counter()
+        await backend.generate(request)
+        return time.perf_counter() - sent
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed(request) for request in requests))
+    return summarize(time.perf_counter() - start, latencies, backend.stats())
+
+
+async def run(count, latency, per_request, fail_rate):
+    requests = make_requests(count)
+    results = {'requests': count, 'service_latency_ms': latency * 1000}
+    server, _ = await start_mock_backend('127.0.0.1', 0, latency=latency, per_request=per_request)
+    flaky_server, _ = await start_mock_backend('127.0.0.1', 0, latency=latency, per_request=per_request,
+                                               fail_rate=fail_rate, seed=1)
+    url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    flaky_url = f"http://127.0.0.1:{flaky_server.sockets[0].getsockname()[1]}"
+    async with server, flaky_server:
+        # The sequential client takes a service round trip per request; cap it
+        results['sequential'] = await run_sequential(url, requests[:min(count, 100)])
+
+        # Each client gets its own memo so none starts warm
+        pooled = HttpBackend(url, batch_size=1, cache=MemoCache(count))
+        results['pooled'] = await run_client(pooled, requests)
+        await pooled.close()
+
+        batched = HttpBackend(url, cache=MemoCache(count))
+        results['batched'] = await run_client(batched, requests)
+        results['cached'] = await run_client(batched, requests)
+        await batched.close()
+
+        flaky = HttpBackend(flaky_url, retries=5, cache=MemoCache(count))
+        results['flaky'] = {'fail_rate': fail_rate, **await run_client(flaky, requests)}
+        await flaky.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--latency-ms', type=float, default=40, help="service cost per batch")
+    parser.add_argument('--per-request-ms', type=float, default=2, help="service cost per request")
+    parser.add_argument('--fail-rate', type=float, default=0.1, help="share of batches failing in the flaky run")
+    args = parser.parse_args(argv)
+    results = asyncio.run(run(args.requests, args.latency_ms / 1000,
+                              args.per_request_ms / 1000, args.fail_rate))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Batch generation throughput versus worker count
+
+Runs a synthetic manifest through ``run_batch`` with 1, 2, 4, ... workers up
+to the core count and reports games per second and speedup over one worker:
+
+    python benchmarks/bench_batch.py --games 200000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.batch import run_batch  # noqa: E402
+
+LANGUAGES = ['english', 'hindi', 'bengali', 'tamil', 'telugu', 'marathi']
+THEMES = ['Mythology - Ramayana', 'Festival - Diwali', 'Architecture - Temples', 'Music - Folk Songs']
+
+
+def manifest(count):
+    for i in range(count):
+        yield i + 1, json.dumps({
+            'title': f"Campaign Game {i}",
+            'genre': 'Quiz',
+            'theme': THEMES[i % len(THEMES)],
+            'language': LANGUAGES[i % len(LANGUAGES)],
+        })
+
+
+class _CountingSink:
+    """Stands in for the output file without paying for disk I/O"""
+
+    def __init__(self):
+        self.written = 0
+
+    def write(self, text):
+        self.written += len(text)
+
+
+def _worker_counts(limit):
+    counts, n = [], 1
+    while n < limit:
+        counts.append(n)
+        n *= 2
+    return counts + [limit]
+
+
+def run(count, max_workers, chunk_size):
+    results = []
+    baseline = None
+    for workers in _worker_counts(max_workers):
+        out = _CountingSink()
+        start = time.perf_counter()
+        generated, errors = run_batch(manifest(count), out, workers, chunk_size)
+        elapsed = time.perf_counter() - start
+        rate = generated / elapsed
+        baseline = baseline or rate
+        results.append({
+            'workers': workers,
+            'games': generated,
+            'errors': errors,
+            'seconds': round(elapsed, 3),
+            'games_per_second': round(rate),
+            'speedup': round(rate / baseline, 2),
+            'output_mb': round(out.written / 1e6, 1),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=64)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.games, args.max_workers, args.chunk_size), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""Work saved by single-flight memoization of identical generation requests
+
+Simulates a campaign: ``--sessions`` threads each submit ``--per-session``
+games through one shared ``GenerationRunner``, drawn from only
+``--distinct`` title/genre/theme/language combinations, with the content
+coming from ``indic_games.mock_backend`` (started in-process). The same
+load runs twice:
+
+- uncoalesced: every submission calls the service itself
+- coalesced: the shared ``MemoCache``, so identical requests in flight
+  wait on one call and later ones are answered from memory
+
+Then every session renders every prebuilt game/language page at once from
+a cold cache, to count how many renders coalescing leaves. Reports service
+calls, wall time, per-job p50/p95 and the memo counters.
+
+    python benchmarks/bench_coalescing.py --sessions 32 --per-session 20 --distinct 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games import render  # noqa: E402
+from indic_games.backends import HttpBackend  # noqa: E402
+from indic_games.catalog import GENRES, LANGUAGES, PREBUILT_GAMES, THEMES  # noqa: E402
+from indic_games.memo import MemoCache  # noqa: E402
+from indic_games.mock_backend import start_mock_backend  # noqa: E402
+from indic_games.pipeline import GenerationRunner  # noqa: E402
+
+
+class Uncoalesced(MemoCache):
+    """Control: computes on every call"""
+
+    def get_or_compute(self, key, compute):
+        return compute()
+
+    async def get_or_compute_async(self, key, compute):
+        return await compute()
+
+
+def campaign_requests(distinct):
+    languages = list(LANGUAGES)
+    return [{
+        'title': f"Campaign Game {number}",
+        'genre': GENRES[number % len(GENRES)],
+        'theme': THEMES[number * 7 % len(THEMES)],
+        'language': languages[number % len(languages)],
+    } for number in range(distinct)]
+
+
+def start_service(latency):
+    """Mock service on a background loop; returns ``(url, api)``"""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    box = {}
+
+    async def start():
+        box['server'], box['api'] = await start_mock_backend('127.0.0.1', 0, latency=latency)
+        started.set()
+
+    threading.Thread(target=lambda: (loop.run_until_complete(start()), loop.run_forever()),
+                     daemon=True).start()
+    started.wait()
+    return f"http://127.0.0.1:{box['server'].sockets[0].getsockname()[1]}", box['api']
+
+
+def run_campaign(url, api, cache, sessions, per_session, distinct):
+    requests = campaign_requests(distinct)
+    runner = GenerationRunner(HttpBackend(url, cache=cache))
+    served_before = api.counters['requests']
+
+    def session(number):
+        latencies = []
+        for turn in range(per_session):
+            start = time.perf_counter()
+            runner.submit(requests[(number + turn) % distinct]).result()
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(sessions) as pool:
+        latencies = sorted(sum(pool.map(session, range(sessions)), []))
+    elapsed = time.perf_counter() - start
+    runner.close()
+    return {
+        'jobs': len(latencies),
+        'service_calls': api.counters['requests'] - served_before,
+        'seconds': round(elapsed, 3),
+        'p50_ms': round(statistics.median(latencies) * 1000, 2),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        'memo': cache.stats(),
+    }
+
+
+def run_prebuilt(sessions):
+    render.artifact_cache.clear()
+    pairs = [(game, language) for game in PREBUILT_GAMES for language in LANGUAGES]
+    barrier = threading.Barrier(sessions)
+
+    def session(_):
+        barrier.wait()
+        for game, language in pairs:
+            render.render_game_html(game, language)
+
+    with ThreadPoolExecutor(sessions) as pool:
+        list(pool.map(session, range(sessions)))
+    stats = render.artifact_cache.stats()
+    return {'calls': sessions * len(pairs), 'renders': stats['misses'], **stats}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=32)
+    parser.add_argument('--per-session', type=int, default=20)
+    parser.add_argument('--distinct', type=int, default=8, help="distinct requests in the campaign")
+    parser.add_argument('--latency-ms', type=float, default=40, help="service cost per batch")
+    args = parser.parse_args(argv)
+
+    url, api = start_service(args.latency_ms / 1000)
+    load = (args.sessions, args.per_session, args.distinct)
+    results = {
+        'uncoalesced': run_campaign(url, api, Uncoalesced(0), *load),
+        'coalesced': run_campaign(url, api, MemoCache(4096, ttl=600), *load),
+        'prebuilt_pages': run_prebuilt(args.sessions),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Bytes saved by minifying and pre-compressing game pages and the app stylesheet
+
+Per prebuilt game, summed over every language, compares the page as the
+unminified template renders it with the page actually served: minified,
+then gzip- and (with the optional ``brotli`` package) brotli-compressed as
+``indic_games.compression`` stores it. Per rerun, compares the stylesheet
+``streamlit_app.py`` sends to the browser before and after minification,
+raw and gzipped. Also reports what a client pays per page to decode each
+variant.
+
+    python benchmarks/bench_compression.py --profile lite
+"""
+
+import argparse
+import ast
+import gzip
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from indic_games import render  # noqa: E402
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES  # noqa: E402
+from indic_games.compression import ENCODINGS, brotli, variants  # noqa: E402
+from indic_games.minify import minify_html  # noqa: E402
+
+DECODERS = {'gzip': gzip.decompress, 'br': brotli.decompress if brotli is not None else None}
+
+
+def unminified_template(profile):
+    page = render._GAME_PAGE
+    if profile == 'lite':
+        page = render._with_styles(page, render._LITE_STYLES)
+    return render.CompiledTemplate(page, render.SHARED_FIELDS)
+
+
+def app_stylesheet():
+    """The ``<style>`` block ``streamlit_app.py`` sends on every rerun, read without running the app"""
+    with open(os.path.join(ROOT, 'streamlit_app.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return next(node.value for node in ast.walk(tree)
+                if isinstance(node, ast.Constant) and isinstance(node.value, str) and '<style>' in node.value)
+
+
+def _saved(before, after):
+    return {'bytes_saved': before - after, 'percent_saved': round(100 * (before - after) / before, 1)}
+
+
+def game_sizes(profile):
+    original = unminified_template(profile)
+    games, decode_seconds, pages = [], dict.fromkeys(ENCODINGS, 0.0), 0
+    for game in PREBUILT_GAMES:
+        sizes = dict.fromkeys(('original', 'minified', *ENCODINGS), 0)
+        for language in LANGUAGES:
+            values = render.game_template_values(game, language)
+            page = render.game_template(profile).render(values)
+            sizes['original'] += len(original.render(values))
+            sizes['minified'] += len(page)
+            for encoding, body in variants(page).items():
+                sizes[encoding] += len(body)
+                start = time.perf_counter()
+                DECODERS[encoding](body)
+                decode_seconds[encoding] += time.perf_counter() - start
+            pages += 1
+        smallest = min(sizes[key] for key in ('minified', *ENCODINGS) if sizes[key])
+        games.append({'title': game['title'], **sizes, **_saved(sizes['original'], smallest)})
+    totals = {key: sum(game[key] for game in games) for key in ('original', 'minified', *ENCODINGS)}
+    return games, totals, {encoding: round(seconds / pages * 1e6, 1) for encoding, seconds in decode_seconds.items()}
+
+
+def rerun_sizes():
+    stylesheet = app_stylesheet().encode('utf-8')
+    minified = minify_html(app_stylesheet()).encode('utf-8')
+    return {
+        'stylesheet_bytes': len(stylesheet),
+        'minified_bytes': len(minified),
+        **_saved(len(stylesheet), len(minified)),
+        # Browsers usually negotiate permessage-deflate on the websocket
+        'gzip_bytes': len(gzip.compress(stylesheet, 9)),
+        'minified_gzip_bytes': len(gzip.compress(minified, 9)),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profile', choices=render.RENDER_PROFILES, default=render.DEFAULT_PROFILE)
+    args = parser.parse_args(argv)
+
+    games, totals, decode_us = game_sizes(args.profile)
+    best = min(totals[key] for key in ('minified', *ENCODINGS))
+    print(json.dumps({
+        'profile': args.profile,
+        'encodings': list(ENCODINGS),
+        'pages': len(PREBUILT_GAMES) * len(LANGUAGES),
+        'per_game': games,
+        'total': {**totals, **_saved(totals['original'], best)},
+        'decode_us_per_page': decode_us,
+        'per_rerun': rerun_sizes(),
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
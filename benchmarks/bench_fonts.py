@@ -0,0 +1,95 @@
+"""Download size and cost of per-script font subsetting
+
+Takes an asset tree with real fonts (``fonts/<script>/`` or
+``languages/<language>/``, e.g. Noto Sans per script) and, per language,
+localizes every prebuilt game: its description becomes the language's
+translation table, so the page shows the script. Each page is built as a
+standalone download twice, with every font embedded whole and with the
+fonts subset to the page's text, and reports:
+
+- font_bytes / subset_bytes: what the fonts weigh, whole and subset
+- page_bytes / subset_page_bytes: the standalone download, whole and subset
+- cold_ms: subsetting one page's fonts the first time
+- warm_ms: the same with the subset already cached (memory, then disk)
+
+Needs the optional ``fontTools`` package (and ``brotli`` for WOFF2).
+
+    python benchmarks/bench_fonts.py --assets assets/
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games import fonts  # noqa: E402
+from indic_games.assets import AssetBundle, AssetLibrary, iter_game_html  # noqa: E402
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES  # noqa: E402
+from indic_games.export import render_entry  # noqa: E402
+from indic_games.translations import get_catalog  # noqa: E402
+
+
+def localized(game, language):
+    return {**game, 'description': ' '.join(dict(get_catalog().table(language)).values())}
+
+
+def standalone(page, paths):
+    with AssetBundle(inline_limit=None) as bundle:
+        return sum(map(len, iter_game_html(page, paths, bundle)))
+
+
+def _font_bytes(paths):
+    return sum(os.path.getsize(path) for path in paths if os.path.splitext(path)[1].lower() in fonts.FONT_EXTENSIONS)
+
+
+def run_language(library, language):
+    sizes = dict.fromkeys(('font_bytes', 'subset_bytes', 'page_bytes', 'subset_page_bytes'), 0)
+    cold, warm = [], []
+    for game in PREBUILT_GAMES:
+        game = localized(game, language)
+        page = render_entry(game, language)
+        paths = library.files_for(game, language)
+        start = time.perf_counter()
+        subset = library.files_for_page(game, language, page)
+        cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        library.files_for_page(game, language, page)
+        warm.append(time.perf_counter() - start)
+        sizes['font_bytes'] += _font_bytes(paths)
+        sizes['subset_bytes'] += _font_bytes(subset)
+        sizes['page_bytes'] += standalone(page, paths)
+        sizes['subset_page_bytes'] += standalone(page, subset)
+    return {
+        'script': LANGUAGES[language]['script'],
+        **{name: round(value / len(PREBUILT_GAMES)) for name, value in sizes.items()},
+        'cold_ms': round(statistics.median(cold) * 1000, 2),
+        'warm_ms': round(statistics.median(warm) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--assets', required=True, help="asset tree with the fonts to subset")
+    parser.add_argument('--language', action='append', dest='languages', help="repeatable")
+    args = parser.parse_args(argv)
+    if fonts.font_subset is None:
+        parser.error("fontTools is not installed")
+
+    library = AssetLibrary(args.assets)
+    # Measure cold subsetting, not what an earlier run left on disk
+    shutil.rmtree(library.subset_dir, ignore_errors=True)
+    results = {language: run_language(library, language) for language in args.languages or LANGUAGES}
+    print(json.dumps({
+        'format': fonts.SUBSET_FORMAT,
+        'per_page': results,
+        'subsets': fonts.subset_cache.stats(),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
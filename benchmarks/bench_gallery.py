@@ -0,0 +1,102 @@
+"""Gallery render cost per rerun at catalog scale
+
+Compares the old gallery loop (one card f-string and one markdown element
+per game, every rerun) with one cached page fragment from GameGallery:
+
+    python benchmarks/bench_gallery.py --games 10000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from indic_games.gallery import GameGallery  # noqa: E402
+from indic_games.theme_index import CatalogIndex  # noqa: E402
+
+SAMPLE_GAMES = [
+    {'title': 'Ramayana Quest', 'genre': 'adventure', 'theme': 'mythology - ramayana',
+     'description': 'Join Prince Rama on his epic journey through exile, the search for Sita, and the battle against Ravana.'},
+    {'title': 'Spice Route Trader', 'genre': 'strategy', 'theme': 'cuisine - spices & herbs',
+     'description': 'Navigate ancient trade routes, discover exotic spices, and build your trading empire across India.'},
+    {'title': 'Temple Architecture Builder', 'genre': 'simulation', 'theme': 'architecture - temples',
+     'description': 'Design and construct magnificent Indian temples while learning about architectural principles.'},
+]
+THEMES = ['Mythology - Ramayana', 'Cuisine - Spices & Herbs', 'Architecture - Temples']
+
+
+def synthetic_games(count):
+    return [
+        dict(SAMPLE_GAMES[i % len(SAMPLE_GAMES)], title=f"{SAMPLE_GAMES[i % len(SAMPLE_GAMES)]['title']} {i}")
+        for i in range(count)
+    ]
+
+
+def legacy_rerun(games):
+    """The markdown payloads the old per-card loop produced on every rerun"""
+    payloads = []
+    for game in games:
+        payloads.append(f"""
+                <div class="animated-card hover-scale" style="border: 2px solid #e5e7eb; border-radius: 10px; padding: 1rem; margin: 1rem 0; background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%);">
+                    <h4 style="color: #374151; margin-bottom: 0.5rem;">🎮 {game['title']}</h4>
+                    <p style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">{game['description']}</p>
+                    <div style="margin-bottom: 1rem;">
+                        <span style="background: #ddd6fe; color: #5b21b6; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.8rem; margin-right: 0.5rem;">{game['genre']}</span>
+                        <span style="background: #fed7d7; color: #c53030; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.8rem;">{game['theme'].split(' - ')[0]}</span>
+                    </div>
+                </div>
+                """)
+    return payloads
+
+
+def _best_ms(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(count):
+    games = synthetic_games(count)
+
+    start = time.perf_counter()
+    gallery = GameGallery(games, CatalogIndex(THEMES))
+    build_ms = (time.perf_counter() - start) * 1000
+
+    legacy = legacy_rerun(games)
+    _, fragment = gallery.page(1)
+    last_page = gallery.page_count()
+    return {
+        'games': count,
+        'gallery_build_ms': round(build_ms, 2),
+        'legacy': {
+            'rerun_ms': round(_best_ms(lambda: legacy_rerun(games)), 3),
+            # Each card was its own markdown plus a button element
+            'elements_per_rerun': 2 * len(legacy),
+            'html_bytes_per_rerun': sum(len(p.encode('utf-8')) for p in legacy),
+        },
+        'paginated': {
+            'rerun_ms': round(_best_ms(lambda: gallery.page(last_page // 2)), 4),
+            'filtered_rerun_ms': round(_best_ms(lambda: gallery.page(2, 'strategy', 'cuisine')), 4),
+            # One fragment, the game selector and the Play button
+            'elements_per_rerun': 3,
+            'html_bytes_per_rerun': len(fragment.encode('utf-8')),
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=10_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.games), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Microbenchmarks for the generator hot paths with regression checks
+
+Times HTML rendering (cached and cold), translation lookups, game-record
+construction in the form-submit path and a full ``main()`` rerun through
+Streamlit's ``AppTest``. Save a baseline once, then compare later runs to
+it; cases slower than the baseline by more than ``--threshold`` are flagged
+and the exit status is 1:
+
+    python benchmarks/bench_hot_paths.py --save
+    python benchmarks/bench_hot_paths.py --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baselines', 'hot_paths.json')
+DEFAULT_THRESHOLD = 0.25
+
+# The app writes to the game store on submit; keep benchmark games out of
+# the real database
+_db_dir = tempfile.TemporaryDirectory()
+os.environ.setdefault('INDIC_GAMES_DB', os.path.join(_db_dir.name, 'bench.db'))
+
+from indic_games.catalog import PREBUILT_GAMES  # noqa: E402
+from indic_games.generator import create_game  # noqa: E402
+from indic_games.render import artifact_cache, generate_game_html  # noqa: E402
+from indic_games.translations import translate_many, translate_text  # noqa: E402
+
+FORM_FIELDS = ("Krishna's Adventure", 'Adventure', 'Mythology - Krishna Leela', 'hindi',
+               'An epic journey of Lord Krishna')
+UI_LABELS = ['Generate Your Game', 'Game Title', 'Genre', 'Cultural Theme', 'Language',
+             'Play Now', 'Download', 'Features', 'Mechanics']
+
+
+def _cold_render():
+    artifact_cache.clear()
+    generate_game_html(PREBUILT_GAMES[0], 'hindi')
+
+
+def _submit_record():
+    # What the form-submit branch does before saving: build and validate
+    game = create_game(*FORM_FIELDS)
+    game['title'].strip()
+    return game
+
+
+CASES = {
+    'generate_game_html_cached': lambda: generate_game_html(PREBUILT_GAMES[0], 'hindi'),
+    'generate_game_html_cold': _cold_render,
+    'translate_text_hit': lambda: translate_text('Play Now', 'hindi'),
+    'translate_text_english': lambda: translate_text('Play Now', 'english'),
+    'translate_text_miss': lambda: translate_text('Not a UI label', 'tamil'),
+    'translate_many_labels': lambda: translate_many(UI_LABELS, 'bengali'),
+    'create_game': _submit_record,
+}
+
+
+def time_case(func, repeat, min_time=0.05):
+    """Best per-call time in microseconds over ``repeat`` timed loops"""
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best * 1e6
+
+
+def time_app_rerun(repeat):
+    """Best full script rerun through AppTest, in microseconds"""
+    from streamlit.testing.v1 import AppTest
+
+    warnings.simplefilter('ignore')
+    app = AppTest.from_file(os.path.join(ROOT, 'streamlit_app.py'), default_timeout=60)
+    app.run()
+    if app.exception:
+        raise RuntimeError(f"streamlit_app raised: {app.exception[0].message}")
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def run(repeat, include_app=True):
+    results = {name: round(time_case(func, repeat), 3) for name, func in CASES.items()}
+    if include_app:
+        results['app_main_rerun'] = round(time_app_rerun(repeat), 1)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Per-case ratio to the baseline, and the names that regressed"""
+    report, regressions = {}, []
+    for name, micros in results.items():
+        before = baseline.get(name)
+        if not before:
+            report[name] = {'us': micros, 'baseline_us': None}
+            continue
+        ratio = micros / before
+        report[name] = {'us': micros, 'baseline_us': before, 'ratio': round(ratio, 3)}
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return report, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save', action='store_true', help="write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a case is flagged (0.25 = 25%%)")
+    parser.add_argument('--skip-app', action='store_true', help="leave out the AppTest rerun")
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat, not args.skip_app)
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(json.dumps(results, indent=2))
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(results, indent=2))
+        print(f"No baseline at {args.baseline}; run with --save to create one", file=sys.stderr)
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    report, regressions = compare(results, baseline, args.threshold)
+    print(json.dumps({'threshold': args.threshold, 'cases': report, 'regressions': regressions}, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
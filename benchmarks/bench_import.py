@@ -0,0 +1,75 @@
+"""Cold-start import time of the core package versus the Streamlit app
+
+Each import runs in a fresh interpreter, so nothing is already cached in
+``sys.modules``. Reports the median wall time per module and whether
+Streamlit got pulled in along the way:
+
+    python benchmarks/bench_import.py --repeat 7
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    'indic_games.catalog',
+    'indic_games.generator',
+    'indic_games.render',
+    'indic_games.translations',
+    'indic_games.api',
+    'indic_games.batch',
+    'streamlit_app',
+]
+
+_PROBE = """
+import sys, time, warnings
+warnings.simplefilter('ignore')
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, 'streamlit' in sys.modules)
+"""
+
+
+def _import_once(module):
+    # Streamlit's bare-mode warnings go to stderr; only the probe line matters
+    output = subprocess.run(
+        [sys.executable, '-c', _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[-2]), output[-1] == 'True'
+
+
+def run(modules, repeat):
+    results = []
+    for module in modules:
+        timings, loads_streamlit = [], False
+        for _ in range(repeat):
+            elapsed, loaded = _import_once(module)
+            timings.append(elapsed * 1000)
+            loads_streamlit = loads_streamlit or loaded
+        results.append({
+            'module': module,
+            'median_ms': round(statistics.median(timings), 1),
+            'min_ms': round(min(timings), 1),
+            'imports_streamlit': loads_streamlit,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--module', action='append', dest='modules',
+                        help="time only these modules (repeatable)")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.modules or MODULES, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
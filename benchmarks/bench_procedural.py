@@ -0,0 +1,89 @@
+"""Variants per second of the procedural quiz and level generator
+
+Generates ``--variants`` play sets, seeded like real games and spread over
+every catalog theme, at each ``--batch-size`` (one NumPy batch per that
+many variants), and reports per batch size:
+
+- arrays_per_s: variants generated as arrays (``generate_batch``)
+- json_per_s: the same, decoded to the JSON a page embeds
+- json_bytes: mean size of one play set's JSON
+
+Also checks that the output is reproducible: generating the same seeds
+again, and generating a sample of them one at a time, gives identical
+play sets.
+
+    python benchmarks/bench_procedural.py --variants 20000 --batch-size 1 --batch-size 512
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games import procedural  # noqa: E402
+from indic_games.catalog import GENRES, LANGUAGES, THEMES  # noqa: E402
+
+DEFAULT_BATCH_SIZES = (1, 64, 512, 4096)
+
+
+def sample_inputs(count):
+    """``(seeds, theme keys)`` of ``count`` games across the catalog's themes and languages"""
+    languages = list(LANGUAGES)
+    games = [({'title': f"Variant {number}", 'genre': GENRES[number % len(GENRES)],
+               'theme': THEMES[number % len(THEMES)]}, languages[number % len(languages)])
+             for number in range(count)]
+    return ([procedural.play_seed(game, language) for game, language in games],
+            [procedural.theme_key(game['theme']) for game, _ in games])
+
+
+def _batches(seeds, themes, size):
+    for start in range(0, len(seeds), size):
+        yield procedural.generate_batch(seeds[start:start + size], themes[start:start + size])
+
+
+def _encode(batch):
+    return [json.dumps(batch.variant(index), ensure_ascii=False, separators=(',', ':'))
+            for index in range(len(batch.seeds))]
+
+
+def run(seeds, themes, size):
+    start = time.perf_counter()
+    batches = list(_batches(seeds, themes, size))
+    arrays_s = time.perf_counter() - start
+    start = time.perf_counter()
+    encoded = [text for batch in batches for text in _encode(batch)]
+    decode_s = time.perf_counter() - start
+    return {
+        'arrays_per_s': round(len(seeds) / arrays_s),
+        'json_per_s': round(len(seeds) / (arrays_s + decode_s)),
+        'json_bytes': round(sum(len(text.encode('utf-8')) for text in encoded) / len(encoded)),
+    }, encoded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--variants', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, action='append', dest='batch_sizes',
+                        help=f"repeatable; default {', '.join(map(str, DEFAULT_BATCH_SIZES))}")
+    args = parser.parse_args(argv)
+
+    seeds, themes = sample_inputs(args.variants)
+    results, outputs = {}, []
+    for size in args.batch_sizes or DEFAULT_BATCH_SIZES:
+        results[size], encoded = run(seeds, themes, size)
+        outputs.append(encoded)
+    sample = range(0, args.variants, max(1, args.variants // 100))
+    alone = [_encode(procedural.generate_batch([seeds[i]], [themes[i]]))[0] for i in sample]
+    print(json.dumps({
+        'variants': args.variants,
+        'per_batch_size': results,
+        'reproducible': all(encoded == outputs[0] for encoded in outputs)
+        and alone == [outputs[0][i] for i in sample],
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
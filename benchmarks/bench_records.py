@@ -0,0 +1,90 @@
+"""Per-session memory of game dicts versus GameRecord
+
+Simulates many sessions each holding their current game, half of them a
+played prebuilt game and half a custom game restored from the store (so
+every string is a fresh copy, as it is after a widget read or a JSON
+decode), and measures the retained bytes with tracemalloc:
+
+    python benchmarks/bench_records.py --sessions 10000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES, THEMES  # noqa: E402
+from indic_games.generator import create_game  # noqa: E402
+from indic_games.record import GameRecord  # noqa: E402
+from indic_games.store import new_game_id  # noqa: E402
+
+LANGUAGE_CODES = list(LANGUAGES)
+GENRES = ['Adventure', 'Puzzle', 'Strategy', 'Quiz']
+
+
+def _fresh(text):
+    return text.encode('utf-8').decode('utf-8')
+
+
+def stored_game(i):
+    """A custom game as the store hands it back: every string a new object"""
+    game = create_game(f"Custom Game {i}", GENRES[i % len(GENRES)], THEMES[i % len(THEMES)],
+                       LANGUAGE_CODES[i % len(LANGUAGE_CODES)])
+    game['id'] = new_game_id()
+    return json.loads(json.dumps(game, ensure_ascii=False))
+
+
+def legacy_session(i):
+    if i % 2:
+        return stored_game(i)
+    game = PREBUILT_GAMES[i % len(PREBUILT_GAMES)]
+    return {
+        **game,
+        'language': _fresh(LANGUAGE_CODES[i % len(LANGUAGE_CODES)]),
+        'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def record_session(i):
+    if i % 2:
+        return GameRecord.from_dict(stored_game(i))
+    return GameRecord.from_dict(PREBUILT_GAMES[i % len(PREBUILT_GAMES)],
+                                language=_fresh(LANGUAGE_CODES[i % len(LANGUAGE_CODES)]))
+
+
+def retained_bytes(build, sessions):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build(i) for i in range(sessions)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return after - before
+
+
+def run(sessions):
+    legacy = retained_bytes(legacy_session, sessions)
+    records = retained_bytes(record_session, sessions)
+    return {
+        'sessions': sessions,
+        'dict_bytes_per_session': round(legacy / sessions),
+        'record_bytes_per_session': round(records / sessions),
+        'saved_percent': round(100 * (1 - records / legacy), 1),
+        'dict_total_mb': round(legacy / 1e6, 2),
+        'record_total_mb': round(records / 1e6, 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=10_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.sessions), indent=2))
+
+
+if __name__ == '__main__':
+    main()
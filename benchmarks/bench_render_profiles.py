@@ -0,0 +1,170 @@
+"""Size and animation frame cost of the full and lite game page profiles
+
+Renders every prebuilt game in every language in each render profile and
+reports the raw and gzipped page size. Frame cost is estimated from the
+page's own CSS, without a browser: every ``animation`` is matched to its
+``@keyframes``, and the properties those animate decide what each frame
+costs. ``transform`` and ``opacity`` are composited on the GPU; anything
+else (``background``, ``text-shadow``, ...) repaints the element every
+frame, and a repaint under a ``backdrop-filter`` blur re-blurs the panel on
+top of it too. Over a ``--seconds`` window at 60 fps it counts:
+
+- repaint_frames: frames in which at least one animation forces a repaint
+- blur_frames: of those, frames that also re-run the backdrop blur
+- composite_frames: frames kept busy by compositor-only animations
+- idle_after_s: when the last animation stops (``null`` if never)
+
+    python benchmarks/bench_render_profiles.py --seconds 10
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES  # noqa: E402
+from indic_games.export import render_entry  # noqa: E402
+from indic_games.render import RENDER_PROFILES  # noqa: E402
+
+FPS = 60
+COMPOSITOR_PROPERTIES = {'transform', 'opacity'}
+
+_KEYFRAMES = re.compile(r'@keyframes\s+([\w-]+)\s*\{')
+_MEDIA = re.compile(r'@media[^{]*\{')
+_RULE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+_PROPERTY = re.compile(r'([\w-]+)\s*:')
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)(m?s)\b')
+_COUNT = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _block_end(css, start):
+    """Index just past the ``}`` closing the block opened at ``start - 1``"""
+    depth = 1
+    for index in range(start, len(css)):
+        if css[index] == '{':
+            depth += 1
+        elif css[index] == '}':
+            depth -= 1
+            if not depth:
+                return index + 1
+    return len(css)
+
+
+def _cut_blocks(css, pattern):
+    """``css`` without the blocks ``pattern`` opens, and those blocks' names and bodies"""
+    kept, blocks, position = [], [], 0
+    for match in pattern.finditer(css):
+        if match.start() < position:
+            continue
+        end = _block_end(css, match.end())
+        kept.append(css[position:match.start()])
+        blocks.append((match.group(1) if match.groups() else None, css[match.end():end - 1]))
+        position = end
+    kept.append(css[position:])
+    return ''.join(kept), blocks
+
+
+def _seconds(value):
+    match = _DURATION.search(value)
+    if match is None:
+        return 0.0
+    number = float(match.group(1))
+    return number / 1000 if match.group(2) == 'ms' else number
+
+
+def analyze(page):
+    """The animations a page runs and what each of their frames costs"""
+    styles = page.partition('<style>')[2].partition('</style>')[0]
+    css, keyframes = _cut_blocks(styles, _KEYFRAMES)
+    # Media queries only switch animations off (reduced motion); count the defaults
+    css, _ = _cut_blocks(css, _MEDIA)
+    animated = {name: set(_PROPERTY.findall(_RULE.sub(r'\2', body))) for name, body in keyframes}
+    animations = []
+    for selector, body in _RULE.findall(css):
+        declarations = dict(
+            (name.strip(), value.strip()) for name, _, value in
+            (item.partition(':') for item in body.split(';') if ':' in item)
+        )
+        value = declarations.get('animation', 'none')
+        name = next((token for token in value.split() if token in animated), None)
+        if name is None or ':hover' in selector:
+            continue
+        tokens = value.split()
+        # A bare number in the shorthand is the iteration count
+        runs = math.inf if 'infinite' in tokens else next(
+            (float(token) for token in tokens if _COUNT.fullmatch(token)), 1.0)
+        properties = animated[name]
+        animations.append({
+            'selector': selector.strip(),
+            'keyframes': name,
+            'properties': sorted(properties),
+            'seconds': _seconds(value) * runs,
+            'repaints': bool(properties - COMPOSITOR_PROPERTIES),
+        })
+    return {
+        'animations': animations,
+        'backdrop_blur': 'backdrop-filter' in css,
+        'reduced_motion': 'prefers-reduced-motion' in styles,
+    }
+
+
+def frame_cost(analysis, seconds):
+    frames = int(seconds * FPS)
+
+    def busy(animations):
+        # Frames in the window during which any of ``animations`` is running
+        return int(min(seconds, max((a['seconds'] for a in animations), default=0)) * FPS)
+
+    repainting = [a for a in analysis['animations'] if a['repaints']]
+    composited = [a for a in analysis['animations'] if not a['repaints']]
+    repaint_frames = busy(repainting)
+    longest = max((a['seconds'] for a in analysis['animations']), default=0)
+    return {
+        'window_frames': frames,
+        'repaint_frames': repaint_frames,
+        'blur_frames': repaint_frames if analysis['backdrop_blur'] else 0,
+        'composite_frames': max(busy(composited) - repaint_frames, 0),
+        'idle_after_s': None if math.isinf(longest) else round(longest, 2),
+        'infinite_animations': sum(math.isinf(a['seconds']) for a in analysis['animations']),
+        'repainted_properties': sorted({p for a in repainting for p in a['properties']}),
+        'backdrop_blur': analysis['backdrop_blur'],
+        'respects_reduced_motion': analysis['reduced_motion'],
+    }
+
+
+def run(seconds):
+    pairs = [(game, language) for game in PREBUILT_GAMES for language in LANGUAGES]
+    results = {'pages': len(pairs), 'window_s': seconds}
+    for profile in RENDER_PROFILES:
+        pages = [render_entry(game, language, profile) for game, language in pairs]
+        raw = sum(map(len, pages))
+        packed = sum(len(gzip.compress(page, 9)) for page in pages)
+        results[profile] = {
+            'bytes_per_page': round(raw / len(pages)),
+            'gzip_bytes_per_page': round(packed / len(pages)),
+            **frame_cost(analyze(pages[0].decode('utf-8')), seconds),
+        }
+    full, lite = results['full'], results['lite']
+    results['lite_vs_full'] = {
+        'bytes_saved_per_page': full['bytes_per_page'] - lite['bytes_per_page'],
+        'gzip_bytes_saved_per_page': full['gzip_bytes_per_page'] - lite['gzip_bytes_per_page'],
+        'repaint_frames_saved': full['repaint_frames'] - lite['repaint_frames'],
+        'blur_frames_saved': full['blur_frames'] - lite['blur_frames'],
+    }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=10, help="window the frame counts cover")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.seconds), indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Rerun cost of each interaction in the Streamlit app
+
+Drives one browser session over Streamlit's websocket protocol (see
+``bench_sessions.py``) through every interaction on the page and reports,
+per interaction, the server round trip and how much it sent back. Widgets
+inside the app's ``st.fragment`` panels rerun only their panel, so those
+interactions should redraw a fraction of the page.
+
+``--compare REV`` runs the same interactions against ``streamlit_app.py``
+as of a git revision, to show the saving against whole-page reruns:
+
+    python benchmarks/bench_reruns.py --iterations 10 --compare HEAD~1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+
+from bench_sessions import (LANGUAGE_LABELS, ROOT, Session, _free_port, _wait_for_server,
+                            start_server)
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+THEME_QUERIES = ('diwali', 'ramayan', 'temple', 'holi', 'warli')
+
+
+class RerunProbe(Session):
+    """A session that records traffic per interaction as well as latency"""
+
+    def __init__(self, host, port, rng):
+        super().__init__(host, port, rng)
+        self.traffic = {}
+
+    async def rerun(self, action, triggers=(), form_values=(), fragment_id=''):
+        await super().rerun(action, triggers, form_values, fragment_id)
+        self.traffic.setdefault(action, []).append(self.last_traffic)
+
+    async def select(self, action, label, value):
+        selectbox = self.widget('selectbox', lambda w: w.label == label)
+        self.values[selectbox.id] = self._string_state(selectbox, value)
+        await self.rerun(action, fragment_id=self.fragment_of(selectbox))
+
+    async def click(self, action, predicate, kind='button'):
+        button = self.widget(kind, predicate)
+        await self.rerun(action, triggers=[self._trigger(button)],
+                         fragment_id=self.fragment_of(button))
+
+    async def type_text(self, action, label, value):
+        text_input = self.widget('text_input', lambda w: w.label == label)
+        self.values[text_input.id] = self._string_state(text_input, value)
+        await self.rerun(action, fragment_id=self.fragment_of(text_input))
+
+    async def export_filter(self):
+        genres = self.widget('multiselect', lambda w: w.label == 'Genres')
+        state = WidgetState(id=genres.id)
+        state.string_array_value.data.extend(self.rng.sample(list(genres.options), 2))
+        self.values[genres.id] = state
+        await self.rerun('export_filter', fragment_id=self.fragment_of(genres))
+
+    async def interactions(self, iterations):
+        await self.connect()
+        try:
+            await self.rerun('load')
+            for number in range(iterations):
+                await self.select('switch_language', 'Choose your language:',
+                                  LANGUAGE_LABELS[(number + 1) % len(LANGUAGE_LABELS)])
+                genre = self.widget('selectbox', lambda w: w.label == 'Filter by genre')
+                await self.select('gallery_filter', 'Filter by genre', self.rng.choice(genre.options[1:]))
+                await self.select('gallery_filter', 'Filter by genre', genre.options[0])
+                category = self.widget('selectbox', lambda w: w.label == 'Filter by category')
+                await self.select('gallery_filter', 'Filter by category', category.options[-1])
+                await self.select('gallery_filter', 'Filter by category', category.options[0])
+                choice = self.widget('selectbox', lambda w: w.label == '🎮 Choose a game')
+                await self.select('choose_game', '🎮 Choose a game', self.rng.choice(choice.options))
+                await self.click('play_now', lambda w: w.id.endswith('play_game'))
+                await self.type_text('theme_search', '🔎 Find a theme', self.rng.choice(THEME_QUERIES))
+                await self.type_text('theme_search', '🔎 Find a theme', '')
+                await self.submit_form(number)
+                await self.click('play_complete_game', lambda w: 'Play Complete Game' in w.label)
+                await self.export_filter()
+        finally:
+            await self.close()
+
+
+def measure(host, port, iterations, seed):
+    probe = RerunProbe(host, port, random.Random(seed))
+    asyncio.run(probe.interactions(iterations))
+    results = {}
+    for action, latencies in probe.latencies.items():
+        traffic = probe.traffic.get(action)
+        if not traffic:
+            continue
+        results[action] = {
+            'count': len(latencies),
+            'median_ms': round(statistics.median(latencies) * 1000, 2),
+            'messages': round(statistics.mean(messages for messages, _ in traffic), 1),
+            'kb_sent': round(statistics.mean(size for _, size in traffic) / 1024, 1),
+        }
+    return results
+
+
+def measure_script(host, script, iterations, seed):
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        server = start_server(port, os.path.join(tmp, 'reruns.db'), script)
+        try:
+            _wait_for_server(host, port)
+            # Warm-up pass so imports and caches don't count
+            measure(host, port, 1, seed)
+            return measure(host, port, iterations, seed)
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def compare(current, baseline):
+    saved = {}
+    for action, now in current.items():
+        before = baseline.get(action)
+        if before and before['median_ms']:
+            saved[action] = {
+                'latency_saved_percent': round(100 * (1 - now['median_ms'] / before['median_ms']), 1),
+                'bytes_saved_percent': round(100 * (1 - now['kb_sent'] / before['kb_sent']), 1)
+                if before['kb_sent'] else 0.0,
+            }
+    return saved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=5, help="passes over every interaction")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--compare', metavar='REV',
+                        help="also measure streamlit_app.py at this git revision")
+    args = parser.parse_args(argv)
+
+    result = {'current': measure_script(args.host, None, args.iterations, args.seed)}
+    if args.compare:
+        source = subprocess.run(['git', 'show', f'{args.compare}:streamlit_app.py'], cwd=ROOT,
+                                check=True, capture_output=True).stdout
+        with tempfile.TemporaryDirectory() as tmp:
+            script = os.path.join(tmp, 'streamlit_app.py')
+            with open(script, 'wb') as f:
+                f.write(source)
+            result[args.compare] = measure_script(args.host, script, args.iterations, args.seed)
+        result['saved'] = compare(result['current'], result[args.compare])
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,311 @@
+"""Concurrent-session load test for the Streamlit app
+
+Starts ``streamlit run streamlit_app.py`` on a free port (or targets a
+running server with ``--port``) and drives N simulated browser sessions over
+Streamlit's own websocket protocol. Each session loads the app and then
+loops through a realistic flow: switch language, play a prebuilt game,
+submit the custom generator form and download the generated HTML file.
+
+For each session count it reports rerun latency percentiles per action,
+reruns per second and the server's resident memory:
+
+    python benchmarks/bench_sessions.py --sessions 1,10,50 --iterations 3
+
+Needs the ``websockets`` package, which Streamlit's server installs.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from indic_games.catalog import LANGUAGES, THEMES  # noqa: E402
+
+WIDGET_KINDS = ('button', 'download_button', 'selectbox', 'multiselect', 'text_input', 'text_area')
+LANGUAGE_LABELS = [f"{data['name']} ({data['native']})" for data in LANGUAGES.values()]
+RERUN_TIMEOUT = 60
+
+
+class SessionError(Exception):
+    """The app raised, or a widget the flow needs was missing"""
+
+
+class Session:
+    """One simulated browser tab speaking Streamlit's websocket protocol"""
+
+    def __init__(self, host, port, rng):
+        self.host, self.port, self.rng = host, port, rng
+        # (kind, widget, fragment ID) for every widget on the page
+        self.widgets = []
+        # Values the "browser" keeps sending on every rerun, by widget ID
+        self.values = {}
+        self.latencies = {}
+        # Messages and bytes the server sent for the last rerun
+        self.last_traffic = (0, 0)
+        self.ws = None
+
+    async def connect(self):
+        self.ws = await websockets.connect(
+            f"ws://{self.host}:{self.port}/_stcore/stream",
+            subprotocols=['streamlit'], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    def widget(self, kind, predicate):
+        for widget_kind, widget, _ in self.widgets:
+            if widget_kind == kind and predicate(widget):
+                return widget
+        raise SessionError(f"No {kind} matching the flow on this page")
+
+    def fragment_of(self, widget):
+        """ID of the st.fragment a widget was drawn by, '' outside fragments"""
+        for _, candidate, fragment_id in self.widgets:
+            if candidate.id == widget.id:
+                return fragment_id
+        return ''
+
+    async def rerun(self, action, triggers=(), form_values=(), fragment_id=''):
+        """Send one interaction; like the browser, a widget inside a fragment
+        asks for a rerun of that fragment only"""
+        message = BackMsg()
+        client_state = message.rerun_script
+        client_state.query_string = ''
+        client_state.fragment_id = fragment_id
+        for state in [*self.values.values(), *form_values, *triggers]:
+            client_state.widget_states.widgets.append(state)
+
+        start = time.perf_counter()
+        await self.ws.send(message.SerializeToString())
+        widgets, redrawn, error = [], set(), None
+        messages = size = 0
+        while True:
+            data = await asyncio.wait_for(self.ws.recv(), RERUN_TIMEOUT)
+            messages += 1
+            size += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof('type')
+            if kind == 'delta':
+                redrawn.add(msg.delta.fragment_id)
+            if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                element = msg.delta.new_element
+                element_kind = element.WhichOneof('type')
+                if element_kind in WIDGET_KINDS:
+                    widgets.append((element_kind, getattr(element, element_kind),
+                                    msg.delta.fragment_id))
+                elif element_kind == 'exception':
+                    error = element.exception.message
+            elif kind == 'script_finished':
+                if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    # st.rerun(): the follow-up run belongs to the same action
+                    widgets, redrawn = [], set()
+                    continue
+                if msg.script_finished == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY:
+                    # Only the fragments that ran were redrawn; keep the rest of the page
+                    widgets = [entry for entry in self.widgets if entry[2] not in redrawn] + widgets
+                break
+        self.latencies.setdefault(action, []).append(time.perf_counter() - start)
+        self.last_traffic = (messages, size)
+        self.widgets = widgets
+        # Like the browser, forget values of widgets that are no longer on the page
+        # (before it was bound to a session key, the language selector got a new
+        # ID whenever its default changed)
+        current = {widget.id for _, widget, _ in widgets}
+        self.values = {wid: state for wid, state in self.values.items() if wid in current}
+        if error:
+            raise SessionError(f"{action}: {error}")
+
+    def _string_state(self, widget, value):
+        state = WidgetState(id=widget.id)
+        state.string_value = value
+        return state
+
+    def _trigger(self, widget):
+        return WidgetState(id=widget.id, trigger_value=True)
+
+    async def switch_language(self):
+        selector = self.widget('selectbox', lambda w: w.label == 'Choose your language:')
+        self.values[selector.id] = self._string_state(selector, self.rng.choice(LANGUAGE_LABELS))
+        await self.rerun('switch_language')
+
+    async def play_prebuilt(self):
+        play = self.widget('button', lambda w: w.id.endswith('play_game'))
+        await self.rerun('play_now', triggers=[self._trigger(play)],
+                         fragment_id=self.fragment_of(play))
+
+    async def submit_form(self, number):
+        title = self.widget('text_input', lambda w: 'Title' in w.label)
+        genre = self.widget('selectbox', lambda w: 'Genre' in w.label and w.form_id)
+        theme = self.widget('selectbox', lambda w: 'Cultural Theme' in w.label)
+        submit = self.widget('button', lambda w: w.is_form_submitter)
+        await self.rerun('submit_form', triggers=[self._trigger(submit)], form_values=[
+            self._string_state(title, f"Load Test Game {number}"),
+            self._string_state(genre, self.rng.choice(genre.options[1:])),
+            self._string_state(theme, self.rng.choice(THEMES)),
+        ], fragment_id=self.fragment_of(submit))
+
+    async def download(self):
+        button = self.widget('download_button', lambda w: 'Complete Game' in w.label)
+        url = f"http://{self.host}:{self.port}{button.url}"
+        start = time.perf_counter()
+        body = await asyncio.to_thread(lambda: urllib.request.urlopen(url, timeout=RERUN_TIMEOUT).read())
+        self.latencies.setdefault('download', []).append(time.perf_counter() - start)
+        if b'<html' not in body[:200]:
+            raise SessionError("download did not return the game HTML")
+
+    async def run_flow(self, iterations):
+        await self.connect()
+        try:
+            await self.rerun('load')
+            for number in range(iterations):
+                await self.switch_language()
+                await self.play_prebuilt()
+                await self.submit_form(number)
+                await self.download()
+        finally:
+            await self.close()
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _latency_summary(values):
+    values = sorted(values)
+    return {
+        'count': len(values),
+        **{f'p{p}_ms': round(_percentile(values, p) * 1000, 2) for p in (50, 95, 99)},
+    }
+
+
+def rss_mb(pid):
+    """Resident and peak memory of a process from /proc, or None elsewhere"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            fields = dict(line.split(':', 1) for line in f)
+    except OSError:
+        return None, None
+    return (round(int(fields['VmRSS'].split()[0]) / 1024, 1),
+            round(int(fields['VmHWM'].split()[0]) / 1024, 1))
+
+
+async def run_level(host, port, sessions, iterations, seed):
+    clients = [Session(host, port, random.Random(seed + i)) for i in range(sessions)]
+    start = time.perf_counter()
+    results = await asyncio.gather(*(c.run_flow(iterations) for c in clients), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    errors = [f"{type(r).__name__}: {r}" for r in results if isinstance(r, BaseException)]
+
+    by_action, everything = {}, []
+    for client in clients:
+        for action, values in client.latencies.items():
+            by_action.setdefault(action, []).extend(values)
+            if action != 'download':
+                everything.extend(values)
+    return {
+        'sessions': sessions,
+        'errors': len(errors),
+        'first_errors': errors[:3],
+        'seconds': round(elapsed, 2),
+        'reruns': len(everything),
+        'reruns_per_second': round(len(everything) / elapsed, 1),
+        'rerun_latency': _latency_summary(everything),
+        'by_action': {action: _latency_summary(values) for action, values in sorted(by_action.items())},
+    }
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_server(host, port, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://{host}:{port}/_stcore/health", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Streamlit did not start on {host}:{port}")
+
+
+def start_server(port, db_path, script=None):
+    """``streamlit run`` the app (or another copy of it) on ``port``"""
+    env = dict(os.environ, INDIC_GAMES_DB=db_path, INDIC_GAMES_METRICS_PORT='',
+               PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    return subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', script or os.path.join(ROOT, 'streamlit_app.py'),
+         '--server.headless', 'true', '--server.port', str(port),
+         '--browser.gatherUsageStats', 'false'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+def run(host, port, levels, iterations, seed, pid=None):
+    results = []
+    baseline_rss, _ = rss_mb(pid) if pid else (None, None)
+    for sessions in levels:
+        level = asyncio.run(run_level(host, port, sessions, iterations, seed))
+        if pid:
+            rss, peak = rss_mb(pid)
+            level['server_rss_mb'] = rss
+            level['server_peak_rss_mb'] = peak
+            if rss is not None and baseline_rss is not None:
+                level['peak_kb_per_session'] = round((peak - baseline_rss) * 1024 / sessions, 1)
+        results.append(level)
+    return {'iterations_per_session': iterations, 'idle_rss_mb': baseline_rss, 'levels': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', default='1,10,50',
+                        help="comma-separated concurrent session counts")
+    parser.add_argument('--iterations', type=int, default=3, help="flows per session")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="load an already running server")
+    parser.add_argument('--pid', type=int, help="server PID to sample memory from with --port")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+    levels = [int(n) for n in args.sessions.split(',')]
+
+    if args.port:
+        result = run(args.host, args.port, levels, args.iterations, args.seed, args.pid)
+    else:
+        port = _free_port()
+        with tempfile.TemporaryDirectory() as tmp:
+            server = start_server(port, os.path.join(tmp, 'load.db'))
+            try:
+                _wait_for_server(args.host, port)
+                # One warm-up load so imports and caches don't count against level one
+                asyncio.run(run_level(args.host, port, 1, 0, args.seed))
+                result = run(args.host, port, levels, args.iterations, args.seed, server.pid)
+            finally:
+                server.terminate()
+                server.wait()
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Round-trip and throughput of the game spec formats
+
+Builds ``--games`` games from the prebuilt catalog in every language, with
+ids, timestamps and titles full of quotes and backslashes, and runs each
+through every format:
+
+- plain_json: ``json.dumps`` of the game dict, as the API sends it today
+- json: canonical JSON spec per game (``dumps_json``/``loads_json``)
+- jsonl: one stream of canonical JSON lines
+- binary: one binary spec stream
+- binary_single: a binary stream per game (``dumps_binary``/``loads_binary``)
+
+Reports encode and decode throughput in games/s, bytes per game (raw and
+gzipped) and whether every game round-trips to the same spec.
+
+    python benchmarks/bench_spec.py --games 20000
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES  # noqa: E402
+from indic_games.spec import (dumps_binary, dumps_json, from_spec, game_spec, iter_binary,  # noqa: E402
+                              iter_jsonl, iter_load_binary, iter_load_jsonl, loads_binary, loads_json)
+
+
+def sample_games(count):
+    languages = list(LANGUAGES)
+    return [{
+        **game,
+        'id': f"{number:032x}",
+        'title': f'{game["title"]} "Part {number}" \\ {languages[number % len(languages)]}',
+        'language': languages[number % len(languages)],
+        'generated_at': f"2025-01-{number % 28 + 1:02d} 09:{number % 60:02d}:00",
+    } for number, game in ((n, PREBUILT_GAMES[n % len(PREBUILT_GAMES)]) for n in range(count))]
+
+
+def _per_game(encode, decode):
+    return (lambda games: [encode(game) for game in games],
+            lambda encoded: [decode(item) for item in encoded])
+
+
+FORMATS = {
+    'plain_json': _per_game(lambda game: json.dumps(game, ensure_ascii=False).encode('utf-8'), json.loads),
+    'json': _per_game(dumps_json, loads_json),
+    'jsonl': (lambda games: [b''.join(iter_jsonl(games))],
+              lambda encoded: list(iter_load_jsonl(encoded[0].splitlines()))),
+    'binary': (lambda games: [b''.join(iter_binary(games))],
+               lambda encoded: list(iter_load_binary(encoded[0]))),
+    'binary_single': _per_game(dumps_binary, loads_binary),
+}
+
+
+def _timed(function, argument, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function(argument)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def run(count, rounds):
+    games = sample_games(count)
+    expected = [from_spec(game_spec(game)) for game in games]
+    results = {'games': count}
+    for name, (encode, decode) in FORMATS.items():
+        encoded, encode_s = _timed(encode, games, rounds)
+        decoded, decode_s = _timed(decode, encoded, rounds)
+        raw = sum(map(len, encoded))
+        results[name] = {
+            'encode_games_per_s': round(count / encode_s),
+            'decode_games_per_s': round(count / decode_s),
+            'bytes_per_game': round(raw / count, 1),
+            'gzip_bytes_per_game': round(len(gzip.compress(b''.join(encoded), 6)) / count, 1),
+            # plain_json has no schema to normalize to, so it round-trips to the dicts themselves
+            'round_trip': decoded == (games if name == 'plain_json' else expected),
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=3, help="best of this many runs")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.games, args.rounds), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Full versus incremental static-site builds of the prebuilt catalog
+
+Builds the catalog (every prebuilt game in every language, copied
+``--scale`` times under new titles, with a synthetic asset tree) into a
+temporary directory, then times the rebuilds that matter
+day to day against a full regeneration:
+
+- full: ``--force`` build, in-process and over a process pool
+- no-op: rebuild with nothing changed
+- one game edited: one description changed, so one game's pages and the
+  index are rendered again
+- one language's assets changed: a font touched on disk
+
+    python benchmarks/bench_static_site.py --scale 20 --workers 8 --repeat 5
+"""
+
+import argparse
+import copy
+import json
+import os
+import statistics
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_assets import build_asset_tree  # noqa: E402
+from indic_games.assets import AssetLibrary  # noqa: E402
+from indic_games.catalog import PREBUILT_GAMES  # noqa: E402
+from indic_games.static_site import build_site  # noqa: E402
+
+
+def timed(repeat, build):
+    runs = [build() for _ in range(repeat)]
+    return {'ms': round(statistics.median(run['ms'] for run in runs), 2),
+            'rendered': runs[-1]['rendered'], 'pages': runs[-1]['pages']}
+
+
+def scaled_catalog(scale):
+    return [dict(game, title=f"{game['title']} {copy_number}" if copy_number else game['title'])
+            for copy_number in range(scale) for game in PREBUILT_GAMES]
+
+
+def run(scale, workers, repeat):
+    catalog = scaled_catalog(scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        build_asset_tree(os.path.join(tmp, 'assets'), 40, 80, 12)
+        library = AssetLibrary(os.path.join(tmp, 'assets'))
+        site = os.path.join(tmp, 'site')
+        results = {
+            'full_serial': timed(repeat, lambda: build_site(site, catalog, force=True, library=library)),
+            'full_parallel': timed(repeat, lambda: build_site(site, catalog, force=True, workers=workers,
+                                                              library=library)),
+            'noop': timed(repeat, lambda: build_site(site, catalog, workers=workers, library=library)),
+        }
+
+        edits = iter(range(repeat))
+
+        def edit_one_game():
+            games = copy.deepcopy(catalog)
+            games[0]['description'] += f" (edit {next(edits)})"
+            return build_site(site, games, workers=workers, library=library)
+        results['one_game_edited'] = timed(repeat, edit_one_game)
+        build_site(site, catalog, workers=workers, library=library)
+
+        font = os.path.join(tmp, 'assets', 'languages', 'hindi', 'script.woff2')
+
+        def touch_font():
+            stat = os.stat(font)
+            os.utime(font, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            return build_site(site, catalog, workers=workers, library=library)
+        results['one_language_assets_changed'] = timed(repeat, touch_font)
+    return {'workers': workers, **results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=20, help="copies of the prebuilt catalog")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.scale, args.workers, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
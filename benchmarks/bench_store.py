@@ -0,0 +1,127 @@
+"""Indexed query latency of the SQLite game store at 1M games
+
+Fills a temporary database with synthetic games (or reuses ``--db``), then
+times lookups by ID, filtered first pages, deep keyset pages and counts, and
+prints the query plans to show which index each one uses:
+
+    python benchmarks/bench_store.py --games 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.store import GameStore, new_game_id  # noqa: E402
+
+GENRES = ['Adventure', 'Puzzle', 'Strategy', 'Educational', 'RPG',
+          'Action', 'Simulation', 'Card Game', 'Board Game', 'Quiz']
+LANGUAGES = ['english', 'hindi', 'bengali', 'telugu', 'marathi', 'tamil', 'gujarati',
+             'kannada', 'malayalam', 'punjabi', 'odia', 'assamese', 'urdu', 'sanskrit']
+THEMES = [f"{category} - Theme {i}" for category in
+          ('Mythology', 'Historical', 'Festival', 'Culture', 'Geography', 'Art') for i in range(7)]
+MECHANICS = ['Turn-based gameplay', 'Story-driven progression', 'Cultural quiz elements']
+FEATURES = ['Voice narration in selected language', 'Leaderboard system']
+
+
+def populate(store, count, batch=20_000, seed=3):
+    rng = random.Random(seed)
+    start_ts = time.mktime((2025, 1, 1, 0, 0, 0, 0, 0, -1))
+    written = 0
+    while written < count:
+        games = []
+        for i in range(written, min(count, written + batch)):
+            games.append({
+                'id': new_game_id(),
+                'title': f"Game {i}",
+                'genre': rng.choice(GENRES),
+                'theme': rng.choice(THEMES),
+                'language': rng.choice(LANGUAGES),
+                'description': f"Synthetic game {i}",
+                'mechanics': MECHANICS,
+                'features': FEATURES,
+                'generated_at': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_ts + i * 13)),
+            })
+        written += store.save_many(games)
+
+
+def _time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {'p50_ms': round(timings[len(timings) // 2], 4),
+            'p99_ms': round(timings[int(len(timings) * 0.99)], 4)}
+
+
+def _plans(store):
+    queries = {
+        'by_id': ("SELECT * FROM games WHERE id = ?", ('x',)),
+        'by_genre': ("SELECT * FROM games WHERE genre = ? ORDER BY generated_at DESC, id DESC LIMIT 21", ('Quiz',)),
+        'by_language_page': ("SELECT * FROM games WHERE language = ? AND (generated_at, id) < (?, ?) "
+                             "ORDER BY generated_at DESC, id DESC LIMIT 21", ('hindi', '2025', 'z')),
+        'newest': ("SELECT * FROM games ORDER BY generated_at DESC, id DESC LIMIT 21", ()),
+    }
+    with store._connection() as conn:
+        return {
+            name: [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+            for name, (sql, params) in queries.items()
+        }
+
+
+def run(db_path, count, repeat):
+    store = GameStore(db_path)
+    existing = store.count()
+    insert_rate = None
+    if existing < count:
+        start = time.perf_counter()
+        populate(store, count - existing)
+        insert_rate = round((count - existing) / (time.perf_counter() - start))
+
+    rng = random.Random(5)
+    sample, _ = store.list(limit=100, language='tamil')
+    ids = [game['id'] for game in sample]
+
+    def deep_page():
+        cursor = None
+        for _ in range(10):
+            _, cursor = store.list(limit=50, cursor=cursor, genre='Strategy')
+
+    return {
+        'games': store.count(),
+        'inserts_per_second': insert_rate,
+        'get_by_id': _time(lambda: store.get(rng.choice(ids)), repeat),
+        'newest_page': _time(lambda: store.list(limit=20), repeat),
+        'genre_page': _time(lambda: store.list(limit=20, genre=rng.choice(GENRES)), repeat),
+        'theme_page': _time(lambda: store.list(limit=20, theme=rng.choice(THEMES)), repeat),
+        'language_page': _time(lambda: store.list(limit=20, language=rng.choice(LANGUAGES)), repeat),
+        'ten_keyset_pages': _time(deep_page, max(1, repeat // 10)),
+        'count_by_language': _time(lambda: store.count(language=rng.choice(LANGUAGES)), max(1, repeat // 10)),
+        'query_plans': _plans(store),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=500)
+    parser.add_argument('--db', help="reuse (and top up) this database instead of a temporary one")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        result = run(args.db, args.games, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            result = run(os.path.join(tmp, 'bench.db'), args.games, args.repeat)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
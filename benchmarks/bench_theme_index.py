@@ -0,0 +1,86 @@
+"""Query latency of the theme catalog index at catalog scale
+
+Builds a synthetic catalog (the real themes plus generated ones) and times
+facet, autocomplete and fuzzy queries:
+
+    python benchmarks/bench_theme_index.py --themes 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.theme_index import CatalogIndex  # noqa: E402
+
+CATEGORIES = ['Mythology', 'Historical', 'Festival', 'Culture', 'Geography', 'Literature',
+              'Architecture', 'Cuisine', 'Music', 'Art', 'Science', 'Sports']
+WORDS = ['Ramayana', 'Mahabharata', 'Krishna', 'Shiva', 'Ganga', 'Himalaya', 'Chola', 'Maurya',
+         'Diwali', 'Holi', 'Pongal', 'Onam', 'Bihu', 'Raga', 'Tabla', 'Veena', 'Kathak', 'Bharatanatyam',
+         'Temple', 'Fort', 'Palace', 'Spice', 'Thali', 'Madhubani', 'Warli', 'Tanjore', 'Kalari',
+         'Kabaddi', 'Ayurveda', 'Yoga', 'Veda', 'Upanishad', 'Panchatantra', 'Jataka', 'Sangam']
+
+
+def synthetic_themes(count, seed=7):
+    rng = random.Random(seed)
+    themes = set()
+    while len(themes) < count:
+        name = ' '.join(rng.sample(WORDS, rng.randint(1, 3)))
+        themes.add(f"{rng.choice(CATEGORIES)} - {name} {rng.randint(1, 999)}")
+    return sorted(themes)
+
+
+def _typo(word, rng):
+    i = rng.randrange(len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def _time_queries(func, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return {
+        'p50_us': round(timings[len(timings) // 2], 2),
+        'p99_us': round(timings[int(len(timings) * 0.99)], 2),
+        'max_us': round(timings[-1], 2),
+    }
+
+
+def run(count, queries):
+    rng = random.Random(11)
+    themes = synthetic_themes(count)
+
+    start = time.perf_counter()
+    index = CatalogIndex(themes)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    words = [rng.choice(WORDS) for _ in range(queries)]
+    return {
+        'themes': len(index),
+        'build_ms': round(build_ms, 1),
+        'facet': _time_queries(index.facet, [rng.choice(CATEGORIES) for _ in range(queries)]),
+        'autocomplete': _time_queries(index.autocomplete, [w[:rng.randint(1, 5)] for w in words]),
+        'autocomplete_two_words': _time_queries(
+            index.autocomplete, [f"{w[:4]} {rng.choice(WORDS)[:3]}" for w in words]),
+        'search_exact': _time_queries(index.search, words),
+        'search_typo': _time_queries(index.search, [_typo(w.lower(), rng) for w in words]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--themes', type=int, default=10_000)
+    parser.add_argument('--queries', type=int, default=2_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.themes, args.queries), indent=2))
+
+
+if __name__ == '__main__':
+    main()
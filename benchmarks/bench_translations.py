@@ -0,0 +1,83 @@
+"""Lookup cost of the compiled translation catalog per rerun
+
+Compares the old ``translate_text`` (which rebuilt its translation dict on
+every call and was called once per gallery card) with the compiled catalog:
+
+    python benchmarks/bench_translations.py --cards 6
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indic_games.translations import TranslationCatalog, get_catalog, translate_many, translate_text  # noqa: E402
+
+
+def legacy_translate_text(text, target_language):
+    """translate_text as it was before the catalog"""
+    if target_language == 'english':
+        return text
+
+    translations = {
+        'hindi': {
+            'Generate Your Game': 'अपना गेम बनाएं',
+            'Generate Game': 'गेम बनाएं',
+            'Play Now': 'अभी खेलें',
+            'Download': 'डाउनलोड करें',
+            'Ready-to-Play Games': 'तैयार खेल',
+            'Custom Game Generator': 'कस्टम गेम जेनरेटर'
+        }
+    }
+
+    return translations.get(target_language, {}).get(text, text)
+
+
+def _best_us(func, number, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def run(cards, language, number):
+    start = time.perf_counter()
+    TranslationCatalog.load()
+    load_ms = (time.perf_counter() - start) * 1000
+    get_catalog()
+
+    def legacy_rerun():
+        for _ in range(cards):
+            legacy_translate_text('Play Now', language)
+        legacy_translate_text('Generate Game', language)
+
+    def catalog_rerun():
+        translate_many(['Play Now', 'Generate Game'], language)
+
+    return {
+        'language': language,
+        'cards': cards,
+        'catalog_load_ms': round(load_ms, 3),
+        'per_call_us': {
+            'legacy': round(_best_us(lambda: legacy_translate_text('Play Now', language), number), 3),
+            'catalog': round(_best_us(lambda: translate_text('Play Now', language), number), 3),
+        },
+        'per_rerun_us': {
+            'legacy': round(_best_us(legacy_rerun, number), 3),
+            'catalog': round(_best_us(catalog_rerun, number), 3),
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cards', type=int, default=6, help="gallery cards per rerun")
+    parser.add_argument('--language', default='hindi')
+    parser.add_argument('--number', type=int, default=100_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.cards, args.language, args.number), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+"""Indic Game Generator services that run outside the Streamlit UI
+
+The core modules (``catalog``, ``generator``, ``render``, ``translations``,
+``theme_index``, ``store``) import nothing from Streamlit, so API servers,
+batch workers and scripts can use them without its startup cost.
+``streamlit_app`` is the UI layer on top.
+"""
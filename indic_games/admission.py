@@ -0,0 +1,213 @@
+"""Admission control for game generation under load
+
+An ``AdmissionGate`` bounds generation three ways: at most ``workers`` jobs
+run at once, at most ``max_queue`` more wait in line for a worker, and one
+session may have at most ``session_quota`` jobs admitted at a time. A job
+that would overflow the queue or its session's quota is turned away at once
+with ``BusyError``, as is one that waits longer than ``queue_timeout`` for a
+worker. The error carries ``retry_after``, whole seconds estimated from how
+long recent jobs ran and how many are ahead, so callers can answer "busy,
+retry in N s" instead of holding a thread while the backlog grows.
+
+``admit`` never blocks and is safe from any thread, so a Streamlit script
+thread or an HTTP handler learns straight away whether its job got in.
+Waiting for a worker happens in ``slot`` on the event loop that runs the
+jobs:
+
+    ticket = gate.admit(session)
+    async with gate.slot(ticket):
+        ...
+
+Gates created with a ``name`` are reported by the metrics endpoint: queue
+depth, running jobs, admissions, rejections by reason and queue wait times.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+
+from indic_games import metrics
+
+GENERATION_WORKERS = int(os.environ.get('INDIC_GAMES_GENERATION_WORKERS', 8))
+GENERATION_QUEUE_DEPTH = int(os.environ.get('INDIC_GAMES_GENERATION_QUEUE_DEPTH', 32))
+GENERATION_QUEUE_TIMEOUT = float(os.environ.get('INDIC_GAMES_GENERATION_QUEUE_TIMEOUT', 10))
+GENERATION_SESSION_QUOTA = int(os.environ.get('INDIC_GAMES_GENERATION_SESSION_QUOTA', 2))
+
+REJECT_REASONS = ('queue_full', 'session_quota', 'timeout')
+# Run time assumed for retry estimates until a job has finished
+INITIAL_RUN_SECONDS = 1.0
+# Weight of the latest job in the moving average of run times
+RUN_TIME_WEIGHT = 0.2
+
+
+class BusyError(Exception):
+    """Generation is at capacity; try again in ``retry_after`` seconds"""
+
+    def __init__(self, reason, retry_after):
+        super().__init__(f"Busy, retry in {retry_after} s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Ticket:
+    """One admitted job's place at the gate"""
+
+    __slots__ = ('session', 'admitted_at', 'entered', 'running', 'released')
+
+    def __init__(self, session):
+        self.session = session
+        self.admitted_at = time.monotonic()
+        self.entered = self.running = self.released = False
+
+
+class AdmissionGate:
+    """Worker budget, bounded queue and per-session quota for one kind of job"""
+
+    def __init__(self, workers=GENERATION_WORKERS, max_queue=GENERATION_QUEUE_DEPTH,
+                 queue_timeout=GENERATION_QUEUE_TIMEOUT, session_quota=GENERATION_SESSION_QUOTA,
+                 name=None):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.session_quota = session_quota
+        self.name = name
+        self.admitted = 0
+        self.rejected = dict.fromkeys(REJECT_REASONS, 0)
+        self.running = 0
+        self._pending = 0
+        self._sessions = Counter()
+        self._waiters = deque()
+        self._run_seconds = INITIAL_RUN_SECONDS
+        self._lock = threading.Lock()
+        if name:
+            metrics.registry.gates[name] = self
+
+    @property
+    def queued(self):
+        """Jobs admitted but not yet running"""
+        return self._pending - self.running
+
+    def retry_after(self, ahead=None):
+        """Whole seconds until a job behind ``ahead`` others (default: the queue) would start"""
+        ahead = self.queued if ahead is None else ahead
+        return max(1, math.ceil(self._run_seconds * (ahead // self.workers + 1)))
+
+    def _reject(self, reason, retry_after):
+        # Called under the lock
+        self.rejected[reason] += 1
+        return BusyError(reason, retry_after)
+
+    def admit(self, session=None):
+        """A ``Ticket`` for a new job, or ``BusyError`` if there is no room for it
+
+        ``session=None`` is exempt from the per-session quota.
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                raise self._reject('queue_full', self.retry_after())
+            if session is not None and self._sessions[session] >= self.session_quota:
+                # Room opens when one of the session's own jobs finishes
+                raise self._reject('session_quota', self.retry_after(0))
+            self._pending += 1
+            self.admitted += 1
+            if session is not None:
+                self._sessions[session] += 1
+        return Ticket(session)
+
+    async def _start(self, ticket, on_queue):
+        with self._lock:
+            if self.running < self.workers:
+                self.running += 1
+                ticket.running = True
+                waiter = None
+            else:
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+        if waiter is not None:
+            if on_queue is not None:
+                on_queue()
+            try:
+                await asyncio.wait_for(waiter, self.queue_timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                # A worker handed over just as we gave up is still ours to release
+                if waiter.done() and not waiter.cancelled():
+                    ticket.running = True
+            if not ticket.running:
+                with self._lock:
+                    raise self._reject('timeout', self.retry_after())
+        if self.name:
+            waited = time.monotonic() - ticket.admitted_at
+            metrics.registry.histogram(metrics.QUEUE_WAIT_METRIC, 'gate', self.name).observe(waited)
+
+    @asynccontextmanager
+    async def slot(self, ticket, on_queue=None):
+        """Hold a worker for the block, queueing for one if none is free
+
+        ``on_queue`` is called if the job has to wait. Raises ``BusyError``
+        after ``queue_timeout`` seconds in the queue. The ticket is released
+        however the block exits.
+        """
+        if ticket.released:
+            # Abandoned before its job got this far
+            raise asyncio.CancelledError()
+        ticket.entered = True
+        try:
+            await self._start(ticket, on_queue)
+            start = time.perf_counter()
+            yield
+            self._run_seconds += RUN_TIME_WEIGHT * (time.perf_counter() - start - self._run_seconds)
+        finally:
+            self.release(ticket)
+
+    def abandon(self, ticket):
+        """Release a ticket whose job was dropped before it reached ``slot``
+
+        Call it on the loop the slots are taken on, once the job is done;
+        it is a no-op for a ticket that entered its slot.
+        """
+        if not ticket.entered:
+            self.release(ticket)
+
+    def release(self, ticket):
+        """Give up the ticket's place and worker; later calls are no-ops
+
+        A ticket that never started may be released from any thread; one
+        holding a worker only from the loop its waiters are on.
+        """
+        with self._lock:
+            if ticket.released:
+                return
+            ticket.released = True
+            self._pending -= 1
+            if ticket.session is not None:
+                self._sessions[ticket.session] -= 1
+                if not self._sessions[ticket.session]:
+                    del self._sessions[ticket.session]
+            if ticket.running:
+                self.running -= 1
+                # Hand the worker straight to the next job still waiting
+                while self._waiters:
+                    waiter = self._waiters.popleft()
+                    if not waiter.done():
+                        waiter.set_result(None)
+                        self.running += 1
+                        break
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'running': self.running,
+                'queued': self.queued,
+                'max_queue': self.max_queue,
+                'sessions': len(self._sessions),
+                'admitted': self.admitted,
+                'rejected': dict(self.rejected),
+                'retry_after': self.retry_after(),
+            }
@@ -0,0 +1,380 @@
+"""Headless HTTP API for the game generator
+
+Serves the endpoints documented in ``src/components/ApiDocs.tsx`` from the
+same generation code the Streamlit app uses:
+
+    POST /api/generate-game
+    GET  /api/languages
+    GET  /api/themes[?q=...|prefix=...][&category=...][&limit=...]
+    GET  /api/games[?genre=...&theme=...&language=...&limit=...&cursor=...][&format=jsonl|binary]
+    GET  /api/games/{id}
+    GET  /api/games/{id}/spec[?format=binary]
+    GET  /api/games/{id}/html[?profile=lite]
+
+Generated games are persisted in the SQLite store (``INDIC_GAMES_DB``).
+With ``INDIC_GAMES_BACKEND_URL`` set, mechanics and features come from that
+generation service (see ``indic_games.backends``), awaited without blocking
+the other connections. Every generation goes through an admission gate (see
+``indic_games.admission``): past its worker budget and queue, or past the
+quota of the ``X-Client-Id`` a client sends, a request is answered at once
+with 503 or 429 and a ``Retry-After`` header. Game pages are sent gzip- or
+brotli-compressed when the client's ``Accept-Encoding`` allows (see
+``indic_games.compression``). ``format`` returns games as versioned game
+specs (see ``indic_games.spec``) instead, with a listing's ``next_cursor``
+in an ``X-Next-Cursor`` header.
+The server is a single asyncio event loop speaking HTTP/1.1 with keep-alive;
+store queries, page rendering and compression run on worker threads, so
+one worker handles many concurrent clients. Request bodies must come with
+a ``Content-Length``; chunked uploads are refused with 501. Run several workers on the
+same port with ``--reuse-port``:
+
+    python -m indic_games.api --host 0.0.0.0 --port 8000
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+from http import HTTPStatus
+from urllib.parse import parse_qs
+
+from indic_games.admission import AdmissionGate, BusyError
+from indic_games.assets import standalone_game_html
+from indic_games.backends import BackendError, backend_from_env, content_request
+from indic_games.catalog import GENRES, LANGUAGES, THEMES
+from indic_games.compression import encoded, negotiate
+from indic_games.generator import create_game, game_request_error
+from indic_games.render import DEFAULT_PROFILE, RENDER_PROFILES, render_game_html
+from indic_games.spec import MEDIA_TYPES, dumps_binary, dumps_json, iter_binary, iter_jsonl
+from indic_games.store import DEFAULT_DB_PATH, DEFAULT_PAGE_SIZE, GameStore
+from indic_games.theme_index import CatalogIndex
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+DEFAULT_THEME_LIMIT = 20
+MAX_THEME_LIMIT = 100
+
+log = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """An error that maps directly onto an HTTP error response"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json_bytes(payload):
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+class GameApi:
+    """Routes API requests to the generator and the game store"""
+
+    def __init__(self, store=None, backend=None, gate=None):
+        self.store = store or GameStore()
+        self.backend = backend if backend is not None else backend_from_env()
+        self.gate = gate if gate is not None else AdmissionGate(name='api_generation')
+        # The catalog endpoints never change, so encode them once
+        self._languages_body = _json_bytes({
+            'languages': [
+                {'code': code, 'name': data['name'], 'native': data['native']}
+                for code, data in LANGUAGES.items()
+            ]
+        })
+        self.index = CatalogIndex(THEMES, GENRES)
+        self._themes_body = _json_bytes({
+            'themes': THEMES,
+            'genres': GENRES,
+            'categories': [{'name': name, 'count': count} for name, count in self.index.categories],
+        })
+
+    def handle(self, method, target, body=b'', headers=None):
+        """Return ``(status, json_body)`` for a single request
+
+        Responses that aren't JSON come as ``(status, body, response_headers)``.
+        ``headers`` are the request's, keyed by lowercase name. Routes that
+        touch the store, render or compress return a coroutine instead, to
+        be awaited on the server's event loop.
+        """
+        path, _, query = target.partition('?')
+        path = path.rstrip('/') or '/'
+        try:
+            if path == '/api/generate-game':
+                self._require_method(method, 'POST')
+                # Every generation is admitted, whichever backend serves it
+                ticket = self.gate.admit((headers or {}).get('x-client-id'))
+                return self._generate_admitted(body, ticket)
+            if path == '/api/languages':
+                self._require_method(method, 'GET')
+                return HTTPStatus.OK, self._languages_body
+            if path == '/api/themes':
+                self._require_method(method, 'GET')
+                if not query:
+                    return HTTPStatus.OK, self._themes_body
+                return HTTPStatus.OK, _json_bytes(self.find_themes(parse_qs(query)))
+            if path == '/api/games':
+                self._require_method(method, 'GET')
+                params = parse_qs(query)
+                if 'format' in params:
+                    return self._blocking(self.list_specs, params)
+                return self._blocking(lambda: (HTTPStatus.OK, _json_bytes(self.list_games(params))))
+            if path.startswith('/api/games/') and path.endswith('/spec'):
+                self._require_method(method, 'GET')
+                return self._blocking(self.game_spec, path[len('/api/games/'):-len('/spec')], parse_qs(query))
+            if path.startswith('/api/games/') and path.endswith('/html'):
+                self._require_method(method, 'GET')
+                return self._blocking(self.game_page, path[len('/api/games/'):-len('/html')],
+                                      parse_qs(query), (headers or {}).get('accept-encoding'))
+            if path.startswith('/api/games/'):
+                self._require_method(method, 'GET')
+                game_id = path[len('/api/games/'):]
+                return self._blocking(lambda: (HTTPStatus.OK, _json_bytes(self.get_game(game_id))))
+            raise ApiError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+        except ApiError as e:
+            return e.status, _json_bytes({'error': e.message})
+        except BusyError as e:
+            return self._busy(e)
+
+    @staticmethod
+    async def _blocking(handler, *args):
+        """Run a handler that queries the store, renders or compresses on a worker thread"""
+        try:
+            return await asyncio.to_thread(handler, *args)
+        except ApiError as e:
+            return e.status, _json_bytes({'error': e.message})
+
+    @staticmethod
+    def _busy(error):
+        # Over a client's own quota is on the client; a full queue is on us
+        status = (HTTPStatus.TOO_MANY_REQUESTS if error.reason == 'session_quota'
+                  else HTTPStatus.SERVICE_UNAVAILABLE)
+        return (status, _json_bytes({'error': str(error), 'retry_after': error.retry_after}),
+                {'Retry-After': str(error.retry_after)})
+
+    @staticmethod
+    def _request_params(body):
+        try:
+            params = json.loads(body or b'{}')
+        except (ValueError, UnicodeDecodeError):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Request body must be JSON")
+        error = game_request_error(params)
+        if error:
+            raise ApiError(HTTPStatus.BAD_REQUEST, error)
+        return params
+
+    def generate(self, body, content=None):
+        params = self._request_params(body)
+        game = create_game(
+            params['title'], params['genre'], params['theme'],
+            params['language'], params.get('description') or '',
+            **(content or {})
+        )
+        return self.store.save(game)
+
+    async def _generate_admitted(self, body, ticket):
+        try:
+            async with self.gate.slot(ticket):
+                request = content_request(self._request_params(body))
+                try:
+                    content = await self.backend.generate(request)
+                except BackendError as e:
+                    raise ApiError(HTTPStatus.BAD_GATEWAY, str(e))
+                game = await asyncio.to_thread(self.generate, body, content)
+                return HTTPStatus.CREATED, _json_bytes(game)
+        except ApiError as e:
+            return e.status, _json_bytes({'error': e.message})
+        except BusyError as e:
+            return self._busy(e)
+
+    def find_themes(self, params):
+        """Fuzzy search (``q``), autocomplete (``prefix``) or a category facet"""
+        try:
+            limit = int(params.get('limit', [DEFAULT_THEME_LIMIT])[0])
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "limit must be an integer")
+        limit = max(1, min(limit, MAX_THEME_LIMIT))
+        category = params.get('category', [None])[0]
+        if 'q' in params:
+            themes = self.index.search(params['q'][0], limit, category)
+        elif 'prefix' in params:
+            themes = self.index.autocomplete(params['prefix'][0], limit, category)
+        elif category:
+            themes = list(self.index.facet(category)[:limit])
+        else:
+            themes = THEMES[:limit]
+        return {'themes': themes}
+
+    def list_games(self, params):
+        """Newest-first page of stored games with an opaque ``next_cursor``"""
+        try:
+            limit = int(params.get('limit', [DEFAULT_PAGE_SIZE])[0])
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "limit must be an integer")
+        filters = {name: params[name][0] for name in ('genre', 'theme', 'language') if name in params}
+        games, next_cursor = self.store.list(limit, params.get('cursor', [None])[0], **filters)
+        return {'games': games, 'next_cursor': next_cursor}
+
+    @staticmethod
+    def _spec_format(params, allowed):
+        spec_format = params.get('format', [allowed[0]])[0]
+        if spec_format not in allowed:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"format must be one of {', '.join(allowed)}")
+        return spec_format
+
+    def list_specs(self, params):
+        """A page of stored games as a JSONL or binary game spec stream"""
+        spec_format = self._spec_format(params, ('jsonl', 'binary'))
+        listing = self.list_games(params)
+        encode = iter_jsonl if spec_format == 'jsonl' else iter_binary
+        headers = {'Content-Type': MEDIA_TYPES[spec_format]}
+        if listing['next_cursor']:
+            headers['X-Next-Cursor'] = listing['next_cursor']
+        return HTTPStatus.OK, b''.join(encode(listing['games'])), headers
+
+    def game_spec(self, game_id, params):
+        """One stored game as a canonical JSON or binary game spec"""
+        spec_format = self._spec_format(params, ('json', 'binary'))
+        game = self.get_game(game_id)
+        body = dumps_json(game) if spec_format == 'json' else dumps_binary(game)
+        return HTTPStatus.OK, body, {'Content-Type': MEDIA_TYPES[spec_format]}
+
+    def get_game(self, game_id):
+        game = self.store.get(game_id)
+        if game is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Game {game_id} not found")
+        return game
+
+    def game_page(self, game_id, params, accept_encoding=None):
+        """The game's standalone HTML page, in the best coding the client accepts"""
+        profile = params.get('profile', [DEFAULT_PROFILE])[0]
+        if profile not in RENDER_PROFILES:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"profile must be one of {', '.join(RENDER_PROFILES)}")
+        game = self.get_game(game_id)
+        page = standalone_game_html(render_game_html(game, game['language'], profile), game, game['language'])
+        body, encoding = encoded(page, negotiate(accept_encoding))
+        headers = {'Content-Type': 'text/html; charset=utf-8', 'Vary': 'Accept-Encoding'}
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return HTTPStatus.OK, body, headers
+
+    @staticmethod
+    def _require_method(method, allowed):
+        if method != allowed:
+            raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {allowed} for this endpoint")
+
+
+def _response(status, body, keep_alive, headers=None):
+    status = HTTPStatus(status)
+    headers = {'Content-Type': 'application/json; charset=utf-8', **(headers or {})}
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        + ''.join(f"{name}: {value}\r\n" for name, value in headers.items())
+        + f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode('latin-1') + body
+
+
+class ApiServer:
+    """Minimal asyncio HTTP/1.1 front end for :class:`GameApi`"""
+
+    def __init__(self, api=None):
+        self.api = api or GameApi()
+
+    async def start(self, host='127.0.0.1', port=8000, reuse_port=False):
+        return await asyncio.start_server(
+            self._serve_connection, host, port,
+            limit=MAX_HEADER_BYTES, reuse_port=reuse_port or None
+        )
+
+    async def _serve_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                           _json_bytes({'error': "Headers too large"}), False))
+                    break
+
+                try:
+                    method, target, version, headers = self._parse_head(head)
+                    length = int(headers.get('content-length') or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    writer.write(_response(HTTPStatus.BAD_REQUEST,
+                                           _json_bytes({'error': "Malformed request"}), False))
+                    break
+                if 'transfer-encoding' in headers:
+                    # Only Content-Length framed bodies are read
+                    writer.write(_response(HTTPStatus.NOT_IMPLEMENTED,
+                                           _json_bytes({'error': "Transfer-Encoding is not supported"}), False))
+                    break
+                if length > MAX_BODY_BYTES:
+                    writer.write(_response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                           _json_bytes({'error': "Request body too large"}), False))
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                try:
+                    response = self.api.handle(method, target, body, headers)
+                    # Handlers that wait on I/O return a coroutine instead
+                    response = await response if inspect.isawaitable(response) else response
+                except Exception:
+                    log.exception("Error handling %s %s", method, target)
+                    writer.write(_response(HTTPStatus.INTERNAL_SERVER_ERROR,
+                                           _json_bytes({'error': "Internal server error"}), False))
+                    break
+                writer.write(_response(*response[:2], keep_alive, *response[2:]))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head):
+        request_line, *header_lines = head.decode('latin-1').split('\r\n')
+        method, target, version = request_line.split(' ', 2)
+        headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+
+async def serve(host='127.0.0.1', port=8000, reuse_port=False, db_path=DEFAULT_DB_PATH):
+    server = await ApiServer(GameApi(GameStore(db_path))).start(host, port, reuse_port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Indic Game Generator HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--reuse-port', action='store_true',
+                        help="let several worker processes share the port")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite game store path")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.reuse_port, args.db))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+"""Images, narration audio and fonts for exported games
+
+Assets live in a directory tree (``INDIC_GAMES_ASSETS``, default
+``assets/``) and are picked per game by its theme category and language:
+
+    assets/common/                     every game
+    assets/themes/<category>/          e.g. themes/mythology/chariot.webp
+    assets/languages/<language>/       e.g. languages/hindi/narration.mp3,
+                                       languages/hindi/NotoSansDevanagari.woff2
+    assets/fonts/<script>/             every language in the script, e.g.
+                                       fonts/devanagari/NotoSansDevanagari.ttf
+
+Pages embed each font cut down to the characters they show in its script
+(see ``indic_games.fonts``); the subsets are kept in ``assets/.subsets/``.
+
+Files are read through ``mmap`` and identified by the SHA-256 of their
+content, so an ``AssetBundle`` holds each distinct file once however many
+games, languages or paths refer to it. Per asset the bundle decides whether
+a page embeds it as a base64 ``data:`` URI (small files, or everything for a
+standalone download) or references one shared external file. Pages are
+produced as a stream of byte chunks by ``iter_game_html`` and base64 is
+encoded a block at a time, so neither the page nor any asset is ever built
+as one big string. Standalone downloads, which are built whole, are
+memoized per page and asset set, keyed by each asset's size and mtime, and
+shared by every session. Directory listings are re-read when the directory
+changes, so a running app sees new and removed assets.
+"""
+
+import base64
+import hashlib
+import mmap
+import os
+import threading
+
+from indic_games.catalog import LANGUAGES
+from indic_games.fonts import FONT_EXTENSIONS, SUBSET_DIR_NAME, fit_fonts, page_codepoints
+from indic_games.memo import MEMO_TTL, MemoCache
+from indic_games.theme_index import split_theme
+
+DEFAULT_ASSETS_DIR = os.environ.get('INDIC_GAMES_ASSETS', 'assets')
+# Files up to this size are inlined; larger ones become shared external files
+INLINE_LIMIT = 16 * 1024
+# Read/write block; a multiple of 3 so base64 blocks concatenate cleanly
+CHUNK_SIZE = 48 * 1024
+# Standalone pages inline every asset and can be large; keep only a few
+STANDALONE_CACHE_SIZE = 32
+
+MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.svg': 'image/svg+xml',
+    '.mp3': 'audio/mpeg',
+    '.ogg': 'audio/ogg',
+    '.m4a': 'audio/mp4',
+    '.wav': 'audio/wav',
+    '.woff2': 'font/woff2',
+    '.woff': 'font/woff',
+    '.ttf': 'font/ttf',
+    '.otf': 'font/otf',
+}
+FONT_FORMATS = {'.woff2': 'woff2', '.woff': 'woff', '.ttf': 'truetype', '.otf': 'opentype'}
+# Formats that are already compressed and gain nothing from deflate
+COMPRESSED_TYPES = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.ogg', '.m4a', '.woff2', '.woff'}
+
+HEAD_MARKER = b'</head>'
+BODY_MARKER = b'<!-- game-assets -->'
+
+
+class Asset:
+    """One distinct file, memory-mapped and named by its content hash"""
+
+    __slots__ = ('digest', 'size', 'ext', 'mime', 'source', '_map')
+
+    def __init__(self, path):
+        self.source = path
+        self.ext = os.path.splitext(path)[1].lower()
+        self.mime = MIME_TYPES[self.ext]
+        with open(path, 'rb') as f:
+            self.size = os.fstat(f.fileno()).st_size
+            # Pages come from the OS page cache; nothing is copied onto the heap
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.digest = hashlib.sha256(self._map if self._map is not None else b'').hexdigest()
+
+    @property
+    def kind(self):
+        """``'image'``, ``'audio'`` or ``'font'``"""
+        return self.mime.partition('/')[0]
+
+    @property
+    def file_name(self):
+        return f"{self.digest[:16]}{self.ext}"
+
+    @property
+    def compressed(self):
+        return self.ext in COMPRESSED_TYPES
+
+    def chunks(self, size=CHUNK_SIZE):
+        """Yield the content a block at a time, straight from the mapping"""
+        if self._map is None:
+            return
+        for start in range(0, self.size, size):
+            yield self._map[start:start + size]
+
+    def data_uri_chunks(self):
+        """Yield a ``data:`` URI for the asset, one base64 block at a time"""
+        yield f"data:{self.mime};base64,".encode('ascii')
+        for chunk in self.chunks():
+            yield base64.b64encode(chunk)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __repr__(self):
+        return f"Asset({self.file_name!r}, size={self.size})"
+
+
+class AssetLibrary:
+    """Finds the asset files that belong to a game"""
+
+    def __init__(self, root=DEFAULT_ASSETS_DIR):
+        self.root = root
+        self.subset_dir = os.path.join(root, SUBSET_DIR_NAME)
+        self._listings = {}
+
+    def _listing(self, *parts):
+        directory = os.path.join(self.root, *parts)
+        try:
+            # Adding, removing or renaming a file changes its directory's mtime
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            mtime = None
+        listing = self._listings.get(directory)
+        if listing is not None and listing[0] == mtime:
+            return listing[1]
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            names = []
+        files = tuple(
+            os.path.join(directory, name) for name in names
+            if os.path.splitext(name)[1].lower() in MIME_TYPES
+            and os.path.isfile(os.path.join(directory, name))
+        )
+        self._listings[directory] = (mtime, files)
+        return files
+
+    def _game_files(self, game):
+        category = split_theme(game['theme'])[0].lower()
+        return self._listing('common') + (self._listing('themes', category) if category else ())
+
+    def _language_files(self, language):
+        script = LANGUAGES.get(language, {}).get('script')
+        return self._listing('languages', language) + (self._listing('fonts', script) if script else ())
+
+    def files_for(self, game, language):
+        """Asset paths for a game in a language, common files first"""
+        return self._game_files(game) + self._language_files(language)
+
+    def files_for_page(self, game, language, page):
+        """``files_for``, with each font subset to the text the rendered ``page`` shows"""
+        paths = self.files_for(game, language)
+        if not any(os.path.splitext(path)[1].lower() in FONT_EXTENSIONS for path in paths):
+            return paths
+        codepoints = page_codepoints(page)
+        script = LANGUAGES.get(language, {}).get('script')
+        return (fit_fonts(self._game_files(game), codepoints, None, self.subset_dir)
+                + fit_fonts(self._language_files(language), codepoints, script, self.subset_dir))
+
+    def refresh(self):
+        """Forget cached directory listings; a listing is re-read anyway once its directory changes"""
+        self._listings.clear()
+
+
+default_library = AssetLibrary()
+
+
+class AssetBundle:
+    """The distinct assets used by a set of pages, deduplicated by content
+
+    ``inline_limit=None`` inlines everything, for single-file downloads.
+    Use as a context manager, or call ``close()``, to release the mappings.
+    """
+
+    def __init__(self, inline_limit=INLINE_LIMIT):
+        self.inline_limit = inline_limit
+        self.deduplicated = 0
+        self._assets = {}
+        self._by_file = {}
+        self._external = {}
+        self._lock = threading.Lock()
+
+    def add(self, path):
+        """The asset for ``path``; files with identical content share one"""
+        stat = os.stat(path)
+        # Other names for the same file are hashed once more, then deduplicated by content
+        file_key = (path, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._by_file.get(file_key)
+            if digest is not None:
+                return self._assets[digest]
+        asset = Asset(path)
+        with self._lock:
+            existing = self._assets.get(asset.digest)
+            if existing is not None:
+                self.deduplicated += 1
+                asset.close()
+                asset = existing
+            else:
+                self._assets[asset.digest] = asset
+            self._by_file[file_key] = asset.digest
+        return asset
+
+    def is_inline(self, asset):
+        return self.inline_limit is None or asset.size <= self.inline_limit
+
+    def src_chunks(self, asset, prefix=''):
+        """Yield the value of a ``src``/``url()`` for the asset"""
+        if self.is_inline(asset):
+            yield from asset.data_uri_chunks()
+            return
+        with self._lock:
+            self._external[asset.digest] = asset
+        yield f"{prefix}{asset.file_name}".encode('utf-8')
+
+    @property
+    def external(self):
+        """Assets referenced as files so far, in first-use order"""
+        with self._lock:
+            return list(self._external.values())
+
+    def write_external(self, directory):
+        """Write each external asset once into ``directory``; returns files written
+
+        Files are named by content hash, so one already there is left alone
+        and concurrent writers (batch workers) can't clash.
+        """
+        os.makedirs(directory, exist_ok=True)
+        written = 0
+        for asset in self.external:
+            path = os.path.join(directory, asset.file_name)
+            if os.path.exists(path):
+                continue
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                for chunk in asset.chunks():
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+            written += 1
+        return written
+
+    def stats(self):
+        with self._lock:
+            assets = list(self._assets.values())
+            external = len(self._external)
+        return {
+            'assets': len(assets),
+            'bytes': sum(asset.size for asset in assets),
+            'external': external,
+            'deduplicated': self.deduplicated,
+        }
+
+    def close(self):
+        with self._lock:
+            assets = list(self._assets.values())
+            self._assets.clear()
+            self._by_file.clear()
+            self._external.clear()
+        for asset in assets:
+            asset.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _font_faces(fonts, bundle, prefix):
+    yield b'<style>\n'
+    families = []
+    for number, asset in enumerate(fonts):
+        family = f"IndicGameFont{number}"
+        families.append(f"'{family}'")
+        yield f"        @font-face {{ font-family: '{family}'; src: url(".encode('ascii')
+        yield from bundle.src_chunks(asset, prefix)
+        yield f") format('{FONT_FORMATS[asset.ext]}'); font-display: swap; }}\n".encode('ascii')
+    yield f"        body {{ font-family: {', '.join(families)}, 'Arial', sans-serif; }}\n    </style>\n".encode('ascii')
+
+
+def _media(assets, bundle, prefix):
+    for asset in assets:
+        if asset.kind == 'image':
+            yield b'<img src="'
+            yield from bundle.src_chunks(asset, prefix)
+            yield b'" alt="" loading="lazy" style="max-width: 100%; border-radius: 10px; margin: 10px 0;">\n            '
+        else:
+            yield b'<audio controls preload="none" src="'
+            yield from bundle.src_chunks(asset, prefix)
+            yield b'"></audio>\n            '
+
+
+def iter_game_html(page, paths, bundle, prefix=''):
+    """Yield a rendered game page with its assets spliced in, as byte chunks
+
+    ``page`` is the page from ``render_game_html``; ``prefix`` is put in
+    front of external asset file names (e.g. ``'../assets/'``).
+    """
+    if not paths:
+        yield page
+        return
+    # Two paths with the same content go into the page once
+    assets = list({asset.digest: asset for asset in map(bundle.add, paths)}.values())
+    fonts = [asset for asset in assets if asset.kind == 'font']
+    media = [asset for asset in assets if asset.kind != 'font']
+
+    view = memoryview(page)
+    head_end = page.find(HEAD_MARKER) if fonts else 0
+    body_at = page.find(BODY_MARKER) if media else -1
+    if fonts and head_end >= 0:
+        yield view[:head_end]
+        yield from _font_faces(fonts, bundle, prefix)
+    else:
+        head_end = 0
+    if body_at >= 0:
+        yield view[head_end:body_at]
+        yield from _media(media, bundle, prefix)
+        yield view[body_at:]
+    else:
+        yield view[head_end:]
+
+
+def write_game_html(out, page, paths, bundle, prefix=''):
+    """Stream a page with its assets into a binary file; returns bytes written"""
+    written = 0
+    for chunk in iter_game_html(page, paths, bundle, prefix):
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+standalone_cache = MemoCache(STANDALONE_CACHE_SIZE, ttl=MEMO_TTL, name='standalone_pages')
+
+
+def _build_standalone(page, paths):
+    with AssetBundle(inline_limit=None) as bundle:
+        return b''.join(iter_game_html(page, paths, bundle))
+
+
+def standalone_game_html(page, game, language, library=default_library):
+    """A single self-contained file: ``page`` itself when the game has no assets"""
+    paths = library.files_for_page(game, language, page)
+    if not paths:
+        return page
+    # Size and mtime too, so an edited asset is picked up straight away
+    stamps = tuple((stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, paths))
+    key = (hashlib.blake2b(page, digest_size=16).digest(), paths, stamps)
+    return standalone_cache.get_or_compute(key, lambda: _build_standalone(page, paths))
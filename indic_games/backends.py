@@ -0,0 +1,321 @@
+"""Pluggable content backends for game generation
+
+A backend turns a game request (title, genre, theme, language and
+description) into the game's mechanics and features:
+
+    StaticBackend   the fixed default lists, no I/O (the default)
+    RulesBackend    picks mechanics by genre and features by theme category
+    HttpBackend     asks a generation service over HTTP
+
+``HttpBackend`` is an asyncio client built for a slow, rate-limited model
+service. It keeps a pool of keep-alive connections, caps the batches in
+flight, coalesces requests arriving within a few milliseconds into one
+``POST /v1/generate`` batch, retries 429/5xx responses and dropped
+connections with jittered exponential backoff, and memoizes responses by
+a hash of the request in a single-flight ``MemoCache`` shared by every
+client in the process: identical requests from any session, thread or event
+loop wait on one call instead of each sending their own. The wire format is
+
+    POST /v1/generate  {"requests": [{...}, ...]}
+    200                {"results": [{"mechanics": [...], "features": [...]}, ...]}
+
+``indic_games.mock_backend`` serves it locally. Point the app, the API and
+batch runs at a service with ``INDIC_GAMES_BACKEND_URL``.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+from collections import deque
+from urllib.parse import urlsplit
+
+from indic_games.generator import DEFAULT_FEATURES, DEFAULT_MECHANICS
+from indic_games.memo import MEMO_TTL, MemoCache
+from indic_games.theme_index import split_theme
+
+BACKEND_URL = os.environ.get('INDIC_GAMES_BACKEND_URL', '')
+REQUEST_FIELDS = ('title', 'genre', 'theme', 'language', 'description')
+CACHE_SIZE = 4096
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class BackendError(Exception):
+    """The backend could not produce content for a request"""
+
+
+class _RetryableError(BackendError):
+    pass
+
+
+def content_request(params):
+    """The normalized request a backend sees, from form/API/batch fields"""
+    return {field: (params.get(field) or '').strip() for field in REQUEST_FIELDS}
+
+
+def request_key(request):
+    """Stable hash of a request, for caching"""
+    payload = json.dumps([request.get(field, '') for field in REQUEST_FIELDS], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Backend answers for identical requests, shared by every HttpBackend in the process
+response_cache = MemoCache(CACHE_SIZE, ttl=MEMO_TTL, name='backend_responses')
+
+
+class GenerationBackend:
+    """Base class: ``generate`` one request, ``generate_many`` in order"""
+
+    async def generate(self, request):
+        raise NotImplementedError
+
+    async def generate_many(self, requests):
+        return await asyncio.gather(*(self.generate(request) for request in requests))
+
+    async def close(self):
+        pass
+
+    def stats(self):
+        return {}
+
+
+class StaticBackend(GenerationBackend):
+    """The same default mechanics and features for every game"""
+
+    _result = {'mechanics': DEFAULT_MECHANICS, 'features': DEFAULT_FEATURES}
+
+    async def generate(self, request):
+        return self._result
+
+
+GENRE_MECHANICS = {
+    'Adventure': ('Open-world exploration', 'Story-driven progression', 'Hidden collectibles'),
+    'Puzzle': ('Pattern-matching puzzles', 'Timed challenges', 'Hint system'),
+    'Strategy': ('Turn-based gameplay', 'Resource management', 'Territory control'),
+    'Educational': ('Lesson checkpoints', 'Cultural quiz elements', 'Progress tracking'),
+    'RPG': ('Character progression', 'Branching dialogue', 'Quest journal'),
+    'Action': ('Real-time combat', 'Combo system', 'Boss encounters'),
+    'Simulation': ('Daily life cycle', 'Economy simulation', 'Community building'),
+    'Card Game': ('Deck building', 'Turn-based card duels', 'Collectible cards'),
+    'Board Game': ('Dice-based movement', 'Traditional board rules', 'Local multiplayer'),
+    'Quiz': ('Multiple-choice rounds', 'Streak bonuses', 'Cultural quiz elements'),
+}
+CATEGORY_FEATURES = {
+    'Architecture': ('Monument reconstructions', 'Guided heritage tours'),
+    'Art': ('Folk art drawing canvas', 'Artist biographies'),
+    'Cuisine': ('Recipe mini-games', 'Regional ingredient atlas'),
+    'Culture': ('Traditional costumes', 'Customs and etiquette guide'),
+    'Festival': ('Festival calendar events', 'Celebration soundtracks'),
+    'Geography': ('Interactive map of India', 'Landmark discovery'),
+    'Historical': ('Historical timeline', 'Primary source excerpts'),
+    'Literature': ('Illustrated story passages', 'Poetry recitation'),
+    'Music': ('Raga and rhythm challenges', 'Instrument showcase'),
+    'Mythology': ('Epic story retellings', 'Character encyclopedia'),
+}
+COMMON_FEATURES = ('Voice narration in selected language', 'Offline play support')
+
+
+class RulesBackend(GenerationBackend):
+    """Mechanics chosen by genre, features by theme category"""
+
+    async def generate(self, request):
+        return self.content(request)
+
+    @staticmethod
+    def content(request):
+        category = split_theme(request.get('theme', ''))[0]
+        mechanics = GENRE_MECHANICS.get(request.get('genre'), DEFAULT_MECHANICS[:3])
+        features = CATEGORY_FEATURES.get(category, DEFAULT_FEATURES[1:3]) + COMMON_FEATURES
+        return {'mechanics': mechanics + ('Achievement system',), 'features': features}
+
+
+class HttpBackend(GenerationBackend):
+    """Pooled, batching, retrying, caching client for a generation service
+
+    One instance belongs to the event loop it is first used on.
+    """
+
+    def __init__(self, url, pool_size=8, max_in_flight=16, batch_size=16, batch_window=0.005,
+                 retries=3, backoff=0.05, timeout=10.0, cache=None):
+        parts = urlsplit(url)
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or 80
+        self.path = (parts.path.rstrip('/') or '') + '/v1/generate'
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache if cache is not None else response_cache
+        self._key_prefix = f"{self.host}:{self.port}{self.path}|"
+        self.counters = dict.fromkeys(
+            ('requests', 'batches', 'retries', 'failures', 'connections_opened'), 0)
+        self._max_in_flight = max_in_flight
+        self._in_flight = None
+        self._connections = None
+        self._idle = deque()
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    def _bind(self):
+        # Created lazily so the instance can be built outside the loop it runs on
+        if self._in_flight is None:
+            self._in_flight = asyncio.Semaphore(self._max_in_flight)
+            self._connections = asyncio.Semaphore(self.pool_size)
+
+    async def generate(self, request):
+        return await self.cache.get_or_compute_async(
+            self._key_prefix + request_key(request), lambda: self._submit(request))
+
+    async def _submit(self, request):
+        self._bind()
+        self.counters['requests'] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+            task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch):
+        body = json.dumps({'requests': [request for request, _ in batch]},
+                          ensure_ascii=False).encode('utf-8')
+        try:
+            async with self._in_flight:
+                self.counters['batches'] += 1
+                results = await self._post_with_retries(body)
+            if len(results) != len(batch):
+                raise BackendError(f"Expected {len(batch)} results, got {len(results)}")
+            results = [{'mechanics': tuple(result['mechanics']), 'features': tuple(result['features'])}
+                       for result in results]
+        except Exception as e:
+            self._fail(batch, e if isinstance(e, BackendError) else BackendError(f"Bad backend response: {e!r}"))
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _post_with_retries(self, body):
+        for attempt in range(self.retries + 1):
+            try:
+                return await asyncio.wait_for(self._post(body), self.timeout)
+            except (_RetryableError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                if attempt == self.retries:
+                    raise BackendError(f"Backend unavailable after {attempt + 1} attempts: {e!r}") from e
+                self.counters['retries'] += 1
+                await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + random.random()))
+
+    def _fail(self, batch, error):
+        self.counters['failures'] += len(batch)
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _post(self, body):
+        reader, writer = await self._acquire()
+        reusable = False
+        try:
+            writer.write((
+                f"POST {self.path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: keep-alive\r\n"
+                "\r\n"
+            ).encode('latin-1') + body)
+            await writer.drain()
+            head = await reader.readuntil(b'\r\n\r\n')
+            status_line, *header_lines = head.decode('latin-1').split('\r\n')
+            status = int(status_line.split(' ', 2)[1])
+            headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get('content-length') or 0)
+            if length > MAX_RESPONSE_BYTES:
+                raise BackendError(f"Backend response too large ({length} bytes)")
+            payload = await reader.readexactly(length) if length else b''
+            reusable = headers.get('connection', '').lower() != 'close'
+        finally:
+            self._release(reader, writer, reusable)
+        if status in RETRY_STATUSES:
+            raise _RetryableError(f"HTTP {status}")
+        if status != 200:
+            raise BackendError(f"Backend returned HTTP {status}: {payload[:200]!r}")
+        return json.loads(payload)['results']
+
+    async def _acquire(self):
+        await self._connections.acquire()
+        while self._idle:
+            reader, writer = self._idle.popleft()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        try:
+            connection = await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            self._connections.release()
+            raise
+        self.counters['connections_opened'] += 1
+        return connection
+
+    def _release(self, reader, writer, reusable):
+        if reusable:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        self._connections.release()
+
+    async def close(self):
+        if self._timer is not None:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        while self._idle:
+            _, writer = self._idle.popleft()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def stats(self):
+        cache = self.cache.stats()
+        return {**self.counters, 'cache_hits': cache['hits'], 'coalesced': cache['coalesced'],
+                'cache_size': cache['size']}
+
+
+def backend_from_env(url=None, **options):
+    """``HttpBackend`` for ``INDIC_GAMES_BACKEND_URL`` if set, else ``StaticBackend``"""
+    url = BACKEND_URL if url is None else url
+    return HttpBackend(url, **options) if url else StaticBackend()
+
+
+def generate_many_sync(requests, backend_factory=backend_from_env):
+    """Run one batch of requests to completion from synchronous code
+
+    Returns a result or a ``BackendError`` per request, in order.
+    """
+    async def run():
+        backend = backend_factory()
+        try:
+            return await asyncio.gather(*(backend.generate(r) for r in requests),
+                                        return_exceptions=True)
+        finally:
+            await backend.close()
+    return asyncio.run(run())
@@ -0,0 +1,207 @@
+"""Offline batch generation from a JSONL manifest
+
+Each manifest line is a JSON object with ``title``, ``genre``, ``theme``,
+``language`` and an optional ``description``. Lines are shipped in chunks to
+a process pool, which parses them, builds the game records and renders the
+HTML. Results stream out in completion order as JSONL (to a file or stdout)
+or as a directory of HTML files plus ``games.jsonl``, with the games'
+larger assets written once to ``assets/`` beside them. Each result's game is
+a versioned game spec (see ``indic_games.spec``). Only a bounded number
+of chunks is in flight, so memory stays flat for any manifest size. With
+``INDIC_GAMES_BACKEND_URL`` set, each chunk's content is fetched from the
+generation service in batched requests.
+
+    python streamlit_app.py batch manifest.jsonl --output-dir out/ --workers 32
+    cat manifest.jsonl | python -m indic_games.batch - --output games.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+from indic_games.assets import AssetBundle, default_library, standalone_game_html, write_game_html
+from indic_games.backends import BACKEND_URL, BackendError, HttpBackend, content_request, generate_many_sync
+from indic_games.export import ASSETS_PATH, render_entry
+from indic_games.generator import create_game, game_request_error
+from indic_games.render import DEFAULT_PROFILE, RENDER_PROFILES
+from indic_games.spec import game_spec
+from indic_games.store import new_game_id
+
+CHUNK_SIZE = 64
+OUTPUT_MANIFEST = 'games.jsonl'
+
+
+def _html_file_name(game):
+    slug = ''.join(ch if ch.isalnum() else '_' for ch in game['title']).strip('_') or 'game'
+    return f"{game['id']}_{slug[:60]}_Complete_Game.html"
+
+
+def generate_chunk(lines, output_dir=None, include_html=True, profile=DEFAULT_PROFILE):
+    """Worker: turn ``(line_no, raw_json)`` pairs into result records"""
+    parsed = [_parse_line(line_no, raw) for line_no, raw in lines]
+    contents = _backend_contents([line for line in parsed if 'error' not in line])
+    with AssetBundle() as bundle:
+        results = [line if 'error' in line else
+                   _generate_game(line, contents.get(id(line)), bundle, output_dir, include_html, profile)
+                   for line in parsed]
+        if output_dir:
+            bundle.write_external(os.path.join(output_dir, ASSETS_PATH))
+    return results
+
+
+def _parse_line(line_no, raw):
+    try:
+        params = json.loads(raw)
+    except ValueError as e:
+        return {'line': line_no, 'error': f"Invalid JSON: {e}"}
+    error = game_request_error(params)
+    if error:
+        return {'line': line_no, 'error': error}
+    return {'line': line_no, 'params': params}
+
+
+def _backend_contents(valid):
+    """Backend content for a chunk's valid lines, keyed by ``id()`` of the line
+
+    Empty without a backend URL, which means the default content.
+    """
+    if not BACKEND_URL or not valid:
+        return {}
+    # Clients share the process-wide response memo, so repeats across chunks stay local
+    results = generate_many_sync([content_request(line['params']) for line in valid],
+                                 lambda: HttpBackend(BACKEND_URL))
+    return {id(line): result for line, result in zip(valid, results)}
+
+
+def _generate_game(line, content, bundle, output_dir, include_html, profile):
+    line_no, params = line['line'], line['params']
+    if isinstance(content, BackendError):
+        return {'line': line_no, 'error': f"Backend error: {content}"}
+    game = create_game(
+        params['title'], params['genre'], params['theme'],
+        params['language'], params.get('description') or '',
+        **(content or {})
+    )
+    game['id'] = new_game_id()
+    html_bytes = render_entry(game, game['language'], profile)
+    result = {'line': line_no, 'game': game_spec(game)}
+    if output_dir:
+        file_name = _html_file_name(game)
+        with open(os.path.join(output_dir, file_name), 'wb') as f:
+            write_game_html(f, html_bytes, default_library.files_for_page(game, game['language'], html_bytes),
+                            bundle, prefix=ASSETS_PATH)
+        result['html_file'] = file_name
+    elif include_html:
+        # A JSONL record has nowhere to put external files, so inline everything
+        html_bytes = standalone_game_html(html_bytes, game, game['language'])
+        result['html'] = html_bytes.decode('utf-8')
+    return result
+
+
+def _generate_chunk_jsonl(lines, output_dir, include_html, profile):
+    # Serializing in the worker keeps the parent process to plain writes
+    results = generate_chunk(lines, output_dir, include_html, profile)
+    errors = sum('error' in result for result in results)
+    text = ''.join(json.dumps(result, ensure_ascii=False) + '\n' for result in results)
+    return len(results) - errors, errors, text
+
+
+def read_manifest(stream):
+    """Yield ``(line_no, raw_json)`` for every non-blank manifest line"""
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if line:
+            yield line_no, line
+
+
+def _chunks(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(lines, out, workers=None, chunk_size=CHUNK_SIZE, max_in_flight=None,
+              output_dir=None, include_html=True, profile=DEFAULT_PROFILE):
+    """Generate every manifest line, writing JSONL results to ``out`` as they finish
+
+    Returns ``(generated, errors)`` counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    generated = errors = 0
+
+    def collect(chunk_result):
+        nonlocal generated, errors
+        ok, failed, text = chunk_result
+        generated += ok
+        errors += failed
+        out.write(text)
+
+    chunks = _chunks(lines, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            collect(_generate_chunk_jsonl(chunk, output_dir, include_html, profile))
+        return generated, errors
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future.result())
+            pending.add(pool.submit(_generate_chunk_jsonl, chunk, output_dir, include_html, profile))
+        for future in wait(pending).done:
+            collect(future.result())
+    return generated, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate games from a JSONL manifest")
+    parser.add_argument('manifest', help="JSONL manifest path, or - for stdin")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--output', '-o', default='-', help="JSONL results path, or - for stdout")
+    output.add_argument('--output-dir', help=f"write HTML files and {OUTPUT_MANIFEST} here")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--max-in-flight', type=int, help="chunks queued at once (default 2 x workers)")
+    parser.add_argument('--no-html', action='store_true', help="omit the HTML from JSONL results")
+    parser.add_argument('--profile', choices=RENDER_PROFILES, default=DEFAULT_PROFILE,
+                        help="lite: lighter pages for low-end phones")
+    args = parser.parse_args(argv)
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        out = open(os.path.join(args.output_dir, OUTPUT_MANIFEST), 'w', encoding='utf-8')
+    elif args.output == '-':
+        out = sys.stdout
+    else:
+        out = open(args.output, 'w', encoding='utf-8')
+    source = sys.stdin if args.manifest == '-' else open(args.manifest, encoding='utf-8')
+
+    start = time.perf_counter()
+    try:
+        generated, errors = run_batch(
+            read_manifest(source), out, args.workers, args.chunk_size,
+            args.max_in_flight, args.output_dir, not args.no_html, args.profile
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"Generated {generated} games ({errors} errors) in {elapsed:.2f}s "
+          f"with {args.workers} workers", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
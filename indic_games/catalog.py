@@ -0,0 +1,93 @@
+"""Languages, genres, themes and the prebuilt games"""
+
+# Language data; ``tag`` is the BCP 47 tag pages declare in ``lang``
+LANGUAGES = {
+    'english': {'name': 'English', 'native': 'English', 'script': 'latin', 'tag': 'en'},
+    'hindi': {'name': 'Hindi', 'native': 'हिंदी', 'script': 'devanagari', 'tag': 'hi'},
+    'bengali': {'name': 'Bengali', 'native': 'বাংলা', 'script': 'bengali', 'tag': 'bn'},
+    'telugu': {'name': 'Telugu', 'native': 'తెలుగు', 'script': 'telugu', 'tag': 'te'},
+    'marathi': {'name': 'Marathi', 'native': 'मराठी', 'script': 'devanagari', 'tag': 'mr'},
+    'tamil': {'name': 'Tamil', 'native': 'தமிழ்', 'script': 'tamil', 'tag': 'ta'},
+    'gujarati': {'name': 'Gujarati', 'native': 'ગુજરાતી', 'script': 'gujarati', 'tag': 'gu'},
+    'kannada': {'name': 'Kannada', 'native': 'ಕನ್ನಡ', 'script': 'kannada', 'tag': 'kn'},
+    'malayalam': {'name': 'Malayalam', 'native': 'മലയാളം', 'script': 'malayalam', 'tag': 'ml'},
+    'punjabi': {'name': 'Punjabi', 'native': 'ਪੰਜਾਬੀ', 'script': 'gurmukhi', 'tag': 'pa'},
+    'odia': {'name': 'Odia', 'native': 'ଓଡ଼ିଆ', 'script': 'odia', 'tag': 'or'},
+    'assamese': {'name': 'Assamese', 'native': 'অসমীয়া', 'script': 'bengali', 'tag': 'as'},
+    'urdu': {'name': 'Urdu', 'native': 'اردو', 'script': 'arabic', 'tag': 'ur'},
+    'sanskrit': {'name': 'Sanskrit', 'native': 'संस्कृत', 'script': 'devanagari', 'tag': 'sa'}
+}
+
+GENRES = [
+    'Adventure', 'Puzzle', 'Strategy', 'Educational', 'RPG', 
+    'Action', 'Simulation', 'Card Game', 'Board Game', 'Quiz'
+]
+
+THEMES = [
+    'Mythology - Ramayana', 'Mythology - Mahabharata', 'Mythology - Bhagavad Gita',
+    'Mythology - Hanuman Chalisa', 'Mythology - Krishna Leela', 'Mythology - Shiva Purana',
+    'Historical - Mughal Era', 'Historical - Maratha Empire', 'Historical - Chola Dynasty',
+    'Historical - Gupta Empire', 'Historical - Mauryan Empire', 'Historical - Vijayanagara',
+    'Festival - Diwali', 'Festival - Holi', 'Festival - Dussehra',
+    'Festival - Karva Chauth', 'Festival - Ganesh Chaturthi', 'Festival - Navratri',
+    'Culture - Classical Dance', 'Culture - Folk Tales', 'Culture - Ayurveda',
+    'Culture - Yoga Traditions', 'Culture - Sanskrit Literature', 'Culture - Vedic Wisdom',
+    'Geography - Indian States', 'Geography - Sacred Rivers', 'Geography - Mountain Ranges',
+    'Literature - Sanskrit Poetry', 'Literature - Tamil Classics', 'Literature - Vedic Texts',
+    'Architecture - Temples', 'Architecture - Forts', 'Architecture - Palaces',
+    'Cuisine - Regional Foods', 'Cuisine - Spices & Herbs', 'Cuisine - Festival Foods',
+    'Music - Classical Ragas', 'Music - Folk Songs', 'Music - Devotional Music',
+    'Art - Madhubani', 'Art - Warli', 'Art - Tanjore Painting'
+]
+
+# Pre-built games
+PREBUILT_GAMES = [
+    {
+        "title": "Ramayana Quest",
+        "genre": "adventure",
+        "theme": "mythology - ramayana",
+        "description": "Join Prince Rama on his epic journey through exile, the search for Sita, and the battle against Ravana.",
+        "mechanics": ['Story Progression', 'Character Development', 'Battle System', 'Quest Management'],
+        "features": ['Voice Narration', 'Interactive Choices', 'Cultural Learning', 'Achievement System']
+    },
+    {
+        "title": "Mahabharata Legends",
+        "genre": "strategy",
+        "theme": "mythology - mahabharata",
+        "description": "Experience the great war of Kurukshetra and make crucial decisions that shape the destiny of kingdoms.",
+        "mechanics": ['Strategic Combat', 'Diplomatic Choices', 'Resource Management', 'Alliance Building'],
+        "features": ['Multiple Endings', 'Historical Accuracy', 'Character Relationships', 'Moral Dilemmas']
+    },
+    {
+        "title": "Festival Celebrations",
+        "genre": "simulation",
+        "theme": "festival - diwali",
+        "description": "Plan and organize traditional Indian festivals, learn customs, and spread joy in the community.",
+        "mechanics": ['Event Planning', 'Resource Management', 'Community Building', 'Cultural Learning'],
+        "features": ['Regional Variations', 'Recipe Collection', 'Decoration Crafting', 'Social Sharing']
+    },
+    {
+        "title": "Classical Dance Academy",
+        "genre": "educational",
+        "theme": "culture - classical dance",
+        "description": "Learn and master traditional Indian dance forms through interactive gameplay and cultural education.",
+        "mechanics": ['Rhythm Matching', 'Pose Recognition', 'Story Interpretation', 'Performance Scoring'],
+        "features": ['Multiple Dance Forms', 'Cultural Context', 'Progressive Learning', 'Performance Mode']
+    },
+    {
+        "title": "Spice Route Trader",
+        "genre": "strategy",
+        "theme": "cuisine - spices & herbs",
+        "description": "Navigate ancient trade routes, discover exotic spices, and build your trading empire across India.",
+        "mechanics": ['Trade Management', 'Route Planning', 'Market Analysis', 'Cultural Exchange'],
+        "features": ['Historical Accuracy', 'Recipe Discovery', 'Economic Strategy', 'Cultural Learning']
+    },
+    {
+        "title": "Temple Architecture Builder",
+        "genre": "simulation",
+        "theme": "architecture - temples",
+        "description": "Design and construct magnificent Indian temples while learning about architectural principles and cultural significance.",
+        "mechanics": ['Building Design', 'Resource Management', 'Historical Accuracy', 'Cultural Integration'],
+        "features": ['Authentic Styles', 'Educational Content', 'Visual Showcase', 'Historical Context']
+    }
+]
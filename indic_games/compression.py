@@ -0,0 +1,94 @@
+"""Pre-compressed variants of rendered artifacts and ``Accept-Encoding`` negotiation
+
+Pages are compressed once at the highest level and the result is memoized
+by the page's content hash, so every client asking for the same page in the
+same coding shares one compression. ``gzip`` is always available; ``br`` is
+offered when the optional ``brotli`` package is installed. A variant that
+wouldn't be smaller than the page isn't offered.
+
+    encoding = negotiate(headers.get('accept-encoding'))
+    body = encoded(page, encoding)
+"""
+
+import gzip
+import hashlib
+import os
+
+from indic_games.memo import MemoCache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Standalone pages inline their assets and can be large; keep only a few
+COMPRESSED_CACHE_SIZE = int(os.environ.get('INDIC_GAMES_COMPRESSED_CACHE_SIZE', 64))
+# Best first: on equal quality values the client gets the smaller coding
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+FILE_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+compressed_cache = MemoCache(COMPRESSED_CACHE_SIZE, name='compressed_pages')
+
+
+def compress(data, encoding):
+    """``data`` in a content coding, compressed as small as the coding gets"""
+    if encoding == 'gzip':
+        # A fixed mtime keeps the output, and anything hashing it, reproducible
+        return gzip.compress(data, 9, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unsupported content coding: {encoding!r}")
+
+
+def _variant(data, encoding):
+    packed = compress(data, encoding)
+    # Not worth a Content-Encoding (or a sibling file) if it doesn't shrink
+    return packed if len(packed) < len(data) else None
+
+
+def variant(data, encoding):
+    """Memoized compressed copy of ``data``, or ``None`` if it wouldn't be smaller"""
+    key = (hashlib.blake2b(data, digest_size=16).digest(), encoding)
+    return compressed_cache.get_or_compute(key, lambda: _variant(data, encoding))
+
+
+def variants(data):
+    """``{encoding: bytes}`` of every available coding that makes ``data`` smaller"""
+    packed = {encoding: variant(data, encoding) for encoding in ENCODINGS}
+    return {encoding: body for encoding, body in packed.items() if body is not None}
+
+
+def encoded(data, encoding):
+    """``(body, encoding)``: ``data`` in ``encoding`` if that pays off, else as is"""
+    if encoding != 'identity':
+        body = variant(data, encoding)
+        if body is not None:
+            return body, encoding
+    return data, 'identity'
+
+
+def _quality(value):
+    try:
+        return max(0.0, min(float(value), 1.0))
+    except ValueError:
+        return 0.0
+
+
+def negotiate(accept_encoding, available=ENCODINGS):
+    """The best coding in ``available`` an ``Accept-Encoding`` value allows, else ``'identity'``
+
+    Codings are ranked by quality value (``q=0`` rules one out, ``*`` stands
+    for any coding not listed), then by their order in ``available``.
+    """
+    if not accept_encoding:
+        return 'identity'
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        name, _, value = params.partition('=')
+        qualities[coding] = _quality(value.strip()) if name.strip().lower() == 'q' else 1.0
+    wildcard = qualities.get('*', 0.0)
+    ranked = [(qualities.get(coding, wildcard), -rank, coding) for rank, coding in enumerate(available)]
+    quality, _, coding = max(ranked, default=(0.0, 0, 'identity'))
+    return coding if quality > 0 else 'identity'
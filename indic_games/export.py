@@ -0,0 +1,233 @@
+"""Streaming bulk export of games × languages as a zip archive
+
+Entries are produced one at a time from generators and written through a
+non-seekable zip writer, so memory stays flat however many games and
+languages are selected. Game assets (see ``indic_games.assets``) are spliced
+into each page as it streams out; the ones too big to inline are stored once
+under ``assets/`` however many pages use them. A ``manifest.json`` describing
+every entry is written last. Rendering can be spread over a process pool,
+and ``--profile lite`` exports the lighter pages for low-end phones.
+
+The app's download button uses ``spool_export_zip``, which streams the
+archive into a temporary file instead of joining it in memory. Streamlit
+still reads a finished download into memory to serve it, so only the CLI
+keeps memory flat end to end:
+
+    python -m indic_games.export all_games.zip --genre strategy --language hindi --workers 4
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from indic_games.assets import AssetBundle, default_library, iter_game_html
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES
+from indic_games.procedural import prepared
+from indic_games.render import DEFAULT_PROFILE, RENDER_PROFILES, game_template, game_template_values
+
+EXPORT_FILE_NAME = 'indic_games_export.zip'
+ASSETS_PATH = 'assets/'
+
+
+def theme_category(theme):
+    """``'Mythology - Ramayana'`` -> ``'mythology'``"""
+    return theme.split(' - ')[0].strip().lower()
+
+
+def select_entries(games, languages, genres=None, categories=None, language_codes=None):
+    """Yield the ``(game, language)`` pairs that pass the filters
+
+    Filters are case-insensitive; ``None`` or empty means no filtering.
+    """
+    genres = {g.lower() for g in genres or ()}
+    categories = {c.lower() for c in categories or ()}
+    language_codes = [code for code in languages if not language_codes or code in language_codes]
+    for game in games:
+        if genres and game['genre'].lower() not in genres:
+            continue
+        if categories and theme_category(game['theme']) not in categories:
+            continue
+        for code in language_codes:
+            yield game, code
+
+
+def entry_path(game, language):
+    name = game['title'].replace(' ', '_').replace('/', '_')
+    return f"{language}/{name}_Complete_Game.html"
+
+
+def render_entry(game, language, profile=DEFAULT_PROFILE):
+    # Bypasses the shared artifact cache so an export doesn't evict live games
+    return game_template(profile).render(game_template_values(game, language))
+
+
+def iter_rendered(pairs, workers=1, profile=DEFAULT_PROFILE):
+    """Yield ``(game, language, html_bytes)`` in input order
+
+    With ``workers > 1`` entries render in a process pool, with only a small
+    window of them in flight at a time.
+    """
+    if workers <= 1:
+        for game, language in prepared(pairs):
+            yield game, language, render_entry(game, language, profile)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    window = deque()
+    try:
+        for game, language in pairs:
+            window.append((game, language, pool.submit(render_entry, game, language, profile)))
+            if len(window) >= workers * 4:
+                game, language, future = window.popleft()
+                yield game, language, future.result()
+        while window:
+            game, language, future = window.popleft()
+            yield game, language, future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Non-seekable sink that hands written bytes back to the generator"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _write_streamed(archive, sink, info, chunks):
+    """Write one entry from byte chunks; yields zip output as it is produced
+
+    Returns ``(bytes, sha256)`` of the uncompressed entry.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with archive.open(info, 'w') as entry:
+        for chunk in chunks:
+            entry.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+            yield sink.drain()
+    return size, digest.hexdigest()
+
+
+def stream_export_zip(games, languages, genres=None, categories=None, language_codes=None, workers=1,
+                      library=default_library, profile=DEFAULT_PROFILE):
+    """Yield the zip archive as a sequence of byte chunks"""
+    started = time.localtime()
+    sink = _ChunkSink()
+    manifest = []
+    pairs = select_entries(games, languages, genres, categories, language_codes)
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as archive, AssetBundle() as bundle:
+        for game, language, html_bytes in iter_rendered(pairs, workers, profile):
+            path = entry_path(game, language)
+            info = zipfile.ZipInfo(path, date_time=started[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            asset_paths = library.files_for_page(game, language, html_bytes)
+            if asset_paths:
+                # Pages sit one level down, next to the shared assets/ folder
+                chunks = iter_game_html(html_bytes, asset_paths, bundle, prefix='../' + ASSETS_PATH)
+                size, sha256 = yield from _write_streamed(archive, sink, info, chunks)
+            else:
+                archive.writestr(info, html_bytes)
+                size, sha256 = len(html_bytes), hashlib.sha256(html_bytes).hexdigest()
+            manifest.append({
+                'path': path,
+                'title': game['title'],
+                'genre': game['genre'],
+                'theme': game['theme'],
+                'language': language,
+                'bytes': size,
+                'sha256': sha256,
+            })
+            yield sink.drain()
+
+        # Each external asset once, however many pages reference it
+        assets = []
+        for asset in bundle.external:
+            info = zipfile.ZipInfo(ASSETS_PATH + asset.file_name, date_time=started[:6])
+            info.compress_type = zipfile.ZIP_STORED if asset.compressed else zipfile.ZIP_DEFLATED
+            yield from _write_streamed(archive, sink, info, asset.chunks())
+            assets.append({'path': info.filename, 'bytes': asset.size, 'sha256': asset.digest})
+
+        archive.writestr('manifest.json', json.dumps({
+            'generated_at': time.strftime("%Y-%m-%d %H:%M:%S", started),
+            'filters': {
+                'genres': sorted(genres or []),
+                'categories': sorted(categories or []),
+                'languages': sorted(language_codes or []),
+            },
+            'profile': profile,
+            'count': len(manifest),
+            'entries': manifest,
+            'assets': assets,
+        }, ensure_ascii=False, indent=2))
+    # Closing the archive writes the central directory
+    yield sink.drain()
+
+
+def write_export_zip(out, games, languages, **filters):
+    """Stream the archive into a binary file object; returns bytes written"""
+    written = 0
+    for chunk in stream_export_zip(games, languages, **filters):
+        out.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def spool_export_zip(games, languages, **filters):
+    """The archive streamed into a temporary file, rewound for reading"""
+    out = tempfile.TemporaryFile()
+    try:
+        write_export_zip(out, games, languages, **filters)
+    except BaseException:
+        out.close()
+        raise
+    out.seek(0)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every prebuilt game in every language as a zip")
+    parser.add_argument('output', nargs='?', default=EXPORT_FILE_NAME, help="zip path, or - for stdout")
+    parser.add_argument('--genre', action='append', dest='genres', help="repeatable")
+    parser.add_argument('--category', action='append', dest='categories',
+                        help="theme category such as mythology (repeatable)")
+    parser.add_argument('--language', action='append', dest='language_codes', help="repeatable")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--profile', choices=RENDER_PROFILES, default=DEFAULT_PROFILE,
+                        help="lite: lighter pages for low-end phones")
+    args = parser.parse_args(argv)
+
+    filters = dict(genres=args.genres, categories=args.categories,
+                   language_codes=args.language_codes, workers=args.workers, profile=args.profile)
+    if args.output == '-':
+        write_export_zip(sys.stdout.buffer, PREBUILT_GAMES, LANGUAGES, **filters)
+    else:
+        with open(args.output, 'wb') as out:
+            written = write_export_zip(out, PREBUILT_GAMES, LANGUAGES, **filters)
+        print(f"Wrote {written} bytes to {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
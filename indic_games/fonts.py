@@ -0,0 +1,163 @@
+"""Per-script font subsetting for exported games
+
+A full Noto font for one Indic script is hundreds of kilobytes, but a game
+page shows a few dozen of its characters. Before a page embeds its fonts,
+each font is cut down to exactly the characters the page's visible text
+uses, in that font's script only: a font from ``languages/<language>/`` or
+``fonts/<script>/`` keeps just the codepoints of the language's script
+(plus the joiners and dotted circle Indic shaping needs), and a font the
+page has no text for is left out altogether. Fonts elsewhere in the asset
+tree are cut down to every character they cover.
+
+Subsets keep all OpenType layout features, so conjuncts and vowel signs
+still shape, and are written as WOFF2 (WOFF when ``brotli`` is missing)
+into ``<assets>/.subsets/`` named by font digest and glyph-set hash. The
+same font and text therefore subset once, for every later export and every
+worker process. Subsetting needs the optional ``fontTools`` package;
+without it fonts are embedded whole, still only for scripts the page uses.
+"""
+
+import functools
+import hashlib
+import html
+import logging
+import os
+import re
+
+from indic_games.compression import brotli
+from indic_games.memo import MemoCache
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    font_subset = TTFont = None
+
+SUBSET_CACHE_SIZE = 1024
+SUBSET_DIR_NAME = '.subsets'
+FONT_EXTENSIONS = {'.woff2', '.woff', '.ttf', '.otf'}
+SUBSET_EXT = '.woff2' if brotli is not None else '.woff'
+# What a build's fonts come out as; ``None`` when they are embedded whole
+SUBSET_FORMAT = SUBSET_EXT[1:] if font_subset is not None else None
+
+SCRIPT_RANGES = {
+    'devanagari': ((0x0900, 0x097F), (0xA8E0, 0xA8FF)),
+    'bengali': ((0x0980, 0x09FF),),
+    'gurmukhi': ((0x0A00, 0x0A7F),),
+    'gujarati': ((0x0A80, 0x0AFF),),
+    'odia': ((0x0B00, 0x0B7F),),
+    'tamil': ((0x0B80, 0x0BFF),),
+    'telugu': ((0x0C00, 0x0C7F),),
+    'kannada': ((0x0C80, 0x0CFF),),
+    'malayalam': ((0x0D00, 0x0D7F),),
+    'arabic': ((0x0600, 0x06FF), (0x0750, 0x077F), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)),
+}
+# ZWNJ, ZWJ and the dotted circle shown under a mark with no base
+SHAPING_CODEPOINTS = frozenset((0x200C, 0x200D, 0x25CC))
+
+_INVISIBLE = re.compile(r'<(style|script)\b.*?</\1\s*>|<[^>]*>', re.S | re.I)
+
+log = logging.getLogger(__name__)
+
+subset_cache = MemoCache(SUBSET_CACHE_SIZE, name='font_subsets')
+
+
+def page_codepoints(page):
+    """The codepoints of a page's visible text (``page`` as UTF-8 bytes)"""
+    return frozenset(map(ord, html.unescape(_INVISIBLE.sub(' ', page.decode('utf-8')))))
+
+
+def script_codepoints(codepoints, script):
+    """The members of ``codepoints`` written in ``script`` (all of them for ``None``)"""
+    ranges = SCRIPT_RANGES.get(script)
+    if ranges is None:
+        return codepoints
+    used = frozenset(c for c in codepoints if any(low <= c <= high for low, high in ranges))
+    return used | SHAPING_CODEPOINTS if used else used
+
+
+def glyph_set_hash(codepoints):
+    payload = ','.join(map(str, sorted(codepoints))).encode('ascii')
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _font_info(path, size, mtime_ns):
+    # Keyed by size and mtime too, so an edited font is read again
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    try:
+        font = TTFont(path, lazy=True)
+        try:
+            return digest, frozenset(font.getBestCmap())
+        finally:
+            font.close()
+    except Exception as e:
+        log.warning("Embedding %s whole, it can't be read as a font: %s", path, e)
+        return digest, None
+
+
+def _write_subset(path, codepoints, out_path):
+    if os.path.exists(out_path):
+        return out_path
+    options = font_subset.Options()
+    options.flavor = SUBSET_EXT[1:]
+    # Indic scripts need their whole GSUB/GPOS to form conjuncts and place marks
+    options.layout_features = ['*']
+    font = font_subset.load_font(path, options)
+    try:
+        subsetter = font_subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        tmp_path = f"{out_path}.{os.getpid()}.tmp"
+        font_subset.save_font(font, tmp_path, options)
+        os.replace(tmp_path, out_path)
+    finally:
+        font.close()
+    return out_path
+
+
+def subset_font(path, codepoints, subset_dir):
+    """Path of a subset of the font at ``path`` covering ``codepoints``
+
+    ``None`` if the font has none of them. Fonts that can't be read are
+    embedded whole, so a bad file degrades to the old download, not an error.
+    """
+    stat = os.stat(path)
+    digest, cmap = _font_info(path, stat.st_size, stat.st_mtime_ns)
+    if cmap is None:
+        return path
+    wanted = codepoints & cmap
+    # Joiners alone draw nothing
+    if not wanted - SHAPING_CODEPOINTS:
+        return None
+    glyphs = glyph_set_hash(wanted)
+    out_path = os.path.join(subset_dir, f"{digest[:16]}-{glyphs}{SUBSET_EXT}")
+
+    def compute():
+        try:
+            return _write_subset(path, wanted, out_path)
+        except Exception as e:
+            log.warning("Embedding %s whole, subsetting failed: %s", path, e)
+            return path
+
+    return subset_cache.get_or_compute((digest, glyphs), compute)
+
+
+def fit_fonts(paths, codepoints, script, subset_dir):
+    """``paths`` with each font subset to the page's ``codepoints`` in ``script``, or dropped
+
+    ``script=None`` keeps every codepoint a font covers. Other files pass through.
+    """
+    fitted = []
+    wanted = script_codepoints(codepoints, script)
+    for path in paths:
+        if os.path.splitext(path)[1].lower() in FONT_EXTENSIONS:
+            if not wanted:
+                path = None
+            elif font_subset is not None:
+                path = subset_font(path, wanted, subset_dir)
+        if path is not None:
+            fitted.append(path)
+    return tuple(fitted)
@@ -0,0 +1,80 @@
+"""Paginated, render-cached game gallery
+
+Each game's card HTML is built and escaped once when the gallery is
+created. Filters (genre, theme category) are precomputed posting lists, and
+a rendered page is one HTML fragment memoized in a bounded LRU, so a rerun
+sends one markdown element for the page instead of one per game.
+"""
+
+import math
+
+from indic_games.render import ArtifactCache, escape_html
+
+PAGE_SIZE = 6
+PAGE_CACHE_SIZE = 512
+
+CARD_TEMPLATE = """
+<div class="animated-card hover-scale" style="border: 2px solid #e5e7eb; border-radius: 10px; padding: 1rem; margin: 1rem 0; background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%);">
+    <h4 style="color: #374151; margin-bottom: 0.5rem;">🎮 {title}</h4>
+    <p style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">{description}</p>
+    <div style="margin-bottom: 1rem;">
+        <span style="background: #ddd6fe; color: #5b21b6; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.8rem; margin-right: 0.5rem;">{genre}</span>
+        <span style="background: #fed7d7; color: #c53030; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.8rem;">{category}</span>
+    </div>
+</div>"""
+
+
+class GameGallery:
+    """Pages of prebuilt game cards with genre and theme-category filters"""
+
+    def __init__(self, games, catalog_index, page_size=PAGE_SIZE):
+        self.games = games
+        self.page_size = page_size
+        self._cards = []
+        self._by_genre = {}
+        self._by_category = {}
+        for i, game in enumerate(games):
+            category = catalog_index.category_of(game['theme'])
+            self._cards.append(CARD_TEMPLATE.format(
+                title=escape_html(game['title']),
+                description=escape_html(game['description']),
+                genre=escape_html(game['genre']),
+                category=escape_html(category),
+            ))
+            self._by_genre.setdefault(game['genre'].lower(), []).append(i)
+            self._by_category.setdefault(category.lower(), []).append(i)
+        self.genres = sorted({game['genre'] for game in games}, key=str.lower)
+        self.categories = sorted(
+            {catalog_index.category_of(game['theme']) for game in games}, key=str.lower)
+        self._filtered_cache = {}
+        self._pages = ArtifactCache(PAGE_CACHE_SIZE, name='gallery_pages')
+
+    def filtered(self, genre=None, category=None):
+        """Indices of the games matching the filters, in catalog order"""
+        key = ((genre or '').lower(), (category or '').lower())
+        ids = self._filtered_cache.get(key)
+        if ids is None:
+            if genre and category:
+                in_category = set(self._by_category.get(key[1], ()))
+                ids = tuple(i for i in self._by_genre.get(key[0], ()) if i in in_category)
+            elif genre:
+                ids = tuple(self._by_genre.get(key[0], ()))
+            elif category:
+                ids = tuple(self._by_category.get(key[1], ()))
+            else:
+                ids = tuple(range(len(self.games)))
+            self._filtered_cache[key] = ids
+        return ids
+
+    def page_count(self, genre=None, category=None):
+        return max(1, math.ceil(len(self.filtered(genre, category)) / self.page_size))
+
+    def page(self, page, genre=None, category=None):
+        """``(game_indices, html_fragment)`` for a 1-based page number"""
+        ids = self.filtered(genre, category)
+        page = min(max(page, 1), self.page_count(genre, category))
+        start = (page - 1) * self.page_size
+        page_ids = ids[start:start + self.page_size]
+        fragment = self._pages.get_or_render(
+            page_ids, lambda: ''.join(self._cards[i] for i in page_ids))
+        return page_ids, fragment
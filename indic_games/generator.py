@@ -0,0 +1,79 @@
+"""Game record construction shared by the UI, API and batch workers"""
+
+from datetime import datetime
+
+from indic_games.catalog import LANGUAGES
+from indic_games.theme_index import split_theme
+from indic_games.translations import translate_many
+
+
+DEFAULT_MECHANICS = (
+    'Turn-based gameplay',
+    'Story-driven progression',
+    'Cultural quiz elements',
+    'Achievement system',
+    'Multiplayer support'
+)
+DEFAULT_FEATURES = (
+    'Voice narration in selected language',
+    'Authentic cultural graphics',
+    'Educational content integration',
+    'Leaderboard system',
+    'Offline play support'
+)
+
+
+def default_description(genre, theme):
+    return f"An immersive {genre} game exploring {theme}"
+
+
+def game_labels(genre, theme, language):
+    """The genre, theme category, language name and play button a game in ``language`` is shown with"""
+    genre_label, category_label, play_label = translate_many(
+        [genre, split_theme(theme)[0], 'Play Now'], language)
+    return {
+        'genre': genre_label,
+        'category': category_label,
+        'language': LANGUAGES[language]['native'],
+        # English pages, and languages the catalog has no label for, keep "Start Game"
+        'play': play_label if play_label != 'Play Now' else 'Start Game',
+    }
+
+
+def game_record(title, genre, theme, language, description, mechanics, features):
+    """Assemble a game record stamped with the current time"""
+    return {
+        'title': title,
+        'genre': genre,
+        'theme': theme,
+        'description': description,
+        'mechanics': list(mechanics),
+        'features': list(features),
+        'language': language,
+        'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def create_game(title, genre, theme, language, description='',
+                mechanics=DEFAULT_MECHANICS, features=DEFAULT_FEATURES):
+    """Build a custom game record from the generator form fields"""
+    description = description or default_description(genre, theme)
+    return game_record(title, genre, theme, language, description, mechanics, features)
+
+
+REQUIRED_GAME_FIELDS = ('title', 'genre', 'theme', 'language')
+
+
+def game_request_error(params):
+    """Why an API or batch generation request is invalid, or None if it is valid"""
+    if not isinstance(params, dict):
+        return "Request must be a JSON object"
+    missing = [field for field in REQUIRED_GAME_FIELDS
+               if not isinstance(params.get(field), str) or not params[field].strip()]
+    if missing:
+        return f"Missing required fields: {', '.join(missing)}"
+    if params['language'] not in LANGUAGES:
+        return f"Unsupported language: {params['language']}"
+    if not isinstance(params.get('description') or '', str):
+        return "description must be a string"
+    return None
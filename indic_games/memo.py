@@ -0,0 +1,151 @@
+"""Single-flight memoization shared across sessions, threads and event loops
+
+``MemoCache.get_or_compute(key, compute)`` returns the stored value for
+``key`` while it is fresh. On a miss the first caller computes it, and every
+caller asking for the same key in the meantime waits for that one result
+instead of starting its own computation. A failure is handed to the waiters
+but not stored, so the next call tries again. If the computing caller is
+cancelled or interrupted, the waiters start over and one of them takes over.
+
+``get_or_compute_async`` does the same for coroutines and waits without
+blocking its event loop. Both share one table, so a request from a thread
+and one from any event loop coalesce with each other.
+
+Entries are evicted least-recently-used beyond ``maxsize`` and expire
+``ttl`` seconds after they were computed (``ttl=None`` keeps them until
+evicted). Caches created with a ``name`` are listed in ``named_caches``, and
+the metrics endpoint reports their hit, miss and coalesce counters.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+MEMO_TTL = float(os.environ.get('INDIC_GAMES_MEMO_TTL', 600))
+
+named_caches = {}
+
+_HIT, _WAIT, _LEAD = 'hit', 'wait', 'lead'
+
+
+class _LeaderCancelled(Exception):
+    """The caller computing a value stopped before it finished"""
+
+
+class MemoCache:
+    """Thread-safe bounded, expiring LRU with single-flight misses"""
+
+    def __init__(self, maxsize, ttl=None, name=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.hits = self.misses = self.coalesced = self.evictions = self.expirations = 0
+        self._items = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        if name:
+            named_caches[name] = self
+
+    def _claim(self, key):
+        # Called under the lock: a fresh value, a computation to wait on, or ours to run
+        entry = self._items.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or time.monotonic() < expires_at:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return _HIT, value
+            del self._items[key]
+            self.expirations += 1
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return _WAIT, future
+        self.misses += 1
+        future = self._in_flight[key] = Future()
+        # A running future can't be cancelled by a waiter giving up on it
+        future.set_running_or_notify_cancel()
+        return _LEAD, future
+
+    def _settle(self, key, future, value=None, error=None):
+        with self._lock:
+            del self._in_flight[key]
+            if error is None and self.maxsize > 0:
+                expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+                self._items[key] = (value, expires_at)
+                self._items.move_to_end(key)
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+                    self.evictions += 1
+        if error is None:
+            future.set_result(value)
+        else:
+            future.set_exception(error)
+
+    def _fail(self, key, future, error):
+        # Real errors reach the waiters; cancellation makes them retry
+        self._settle(key, future, error=error if isinstance(error, Exception) else _LeaderCancelled())
+
+    def get_or_compute(self, key, compute):
+        """The value for ``key``, calling ``compute()`` at most once at a time"""
+        while True:
+            with self._lock:
+                state, value = self._claim(key)
+            if state is _HIT:
+                return value
+            if state is _WAIT:
+                try:
+                    return value.result()
+                except _LeaderCancelled:
+                    continue
+            try:
+                result = compute()
+            except BaseException as e:
+                self._fail(key, value, e)
+                raise
+            self._settle(key, value, result)
+            return result
+
+    async def get_or_compute_async(self, key, compute):
+        """Like ``get_or_compute`` for a coroutine function ``compute``"""
+        while True:
+            with self._lock:
+                state, value = self._claim(key)
+            if state is _HIT:
+                return value
+            if state is _WAIT:
+                try:
+                    return await asyncio.wrap_future(value)
+                except _LeaderCancelled:
+                    continue
+            try:
+                result = await compute()
+            except BaseException as e:
+                self._fail(key, value, e)
+                raise
+            self._settle(key, value, result)
+            return result
+
+    def clear(self):
+        """Drop stored values and reset the counters; computations in flight finish"""
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = self.coalesced = self.evictions = self.expirations = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._items),
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'in_flight': len(self._in_flight),
+            }
+
+    def __len__(self):
+        return len(self._items)
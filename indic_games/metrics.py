@@ -0,0 +1,308 @@
+"""Rerun timing spans, latency histograms and a local metrics endpoint
+
+The Streamlit app wraps each script run in ``registry.rerun()`` and each
+phase of ``main()`` in ``registry.span(name)``. Panel fragments wrap
+themselves in ``registry.rerun(session, name)`` too, which times a panel
+rerunning on its own as a run of its own and does nothing inside a full
+run. Durations land in Prometheus-style histograms shared by every
+session in the process. Any rerun that takes longer than the budget is
+logged to the ``indic_games.slow_reruns`` logger with its span breakdown
+and kept in a short in-memory history.
+
+The hit, miss and coalesce counters of every named ``MemoCache`` (rendered
+pages, backend responses, standalone downloads) are reported alongside, as
+are the queue depth, running jobs, admissions and rejections of every named
+``AdmissionGate`` (see ``indic_games.admission``) for autoscaling.
+
+``MetricsServer`` serves the registry on localhost:
+
+    GET /metrics              Prometheus text format
+    GET /metrics.json         the same histograms, cache and queue counters as JSON
+    GET /metrics/slow-reruns  the most recent slow reruns
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from indic_games.memo import named_caches
+
+# Upper bounds in seconds, from sub-millisecond lookups up to slow reruns
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+           0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SLOW_RERUN_MS = float(os.environ.get('INDIC_GAMES_SLOW_RERUN_MS', 500))
+SLOW_RERUN_HISTORY = 50
+METRICS_HOST = '127.0.0.1'
+METRICS_PORT = os.environ.get('INDIC_GAMES_METRICS_PORT', '9464')
+
+RERUN_METRIC = 'indic_rerun_seconds'
+PHASE_METRIC = 'indic_rerun_phase_seconds'
+CALL_METRIC = 'indic_call_seconds'
+CACHE_METRIC = 'indic_cache_lookups_total'
+CACHE_EVICTION_METRIC = 'indic_cache_evictions_total'
+CACHE_SIZE_METRIC = 'indic_cache_entries'
+QUEUE_WAIT_METRIC = 'indic_queue_wait_seconds'
+QUEUE_DEPTH_METRIC = 'indic_queue_depth'
+QUEUE_RUNNING_METRIC = 'indic_queue_running_jobs'
+QUEUE_WORKERS_METRIC = 'indic_queue_workers'
+QUEUE_ADMITTED_METRIC = 'indic_queue_admitted_total'
+QUEUE_REJECTED_METRIC = 'indic_queue_rejected_total'
+
+slow_rerun_log = logging.getLogger('indic_games.slow_reruns')
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram, safe to observe from any thread"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+
+    def snapshot(self):
+        """``(cumulative_counts, count, sum)``; the last count is ``+Inf``"""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, running = [], 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return cumulative, running, total
+
+    def quantile(self, q, snapshot=None):
+        """Upper bound of the bucket holding the ``q`` quantile"""
+        cumulative, count, _ = snapshot or self.snapshot()
+        if not count:
+            return 0.0
+        rank = q * count
+        for bound, seen in zip(self.buckets, cumulative):
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+class MetricsRegistry:
+    """Named histograms plus per-rerun span collection"""
+
+    def __init__(self, slow_rerun_ms=SLOW_RERUN_MS, history=SLOW_RERUN_HISTORY):
+        self.slow_rerun_ms = slow_rerun_ms
+        self.slow_reruns = deque(maxlen=history)
+        # Named admission gates register themselves here
+        self.gates = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        # Streamlit runs each session's script on its own thread
+        self._local = threading.local()
+
+    def histogram(self, metric, label_name, label):
+        key = (metric, label_name, label)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+    def _record_span(self, name, seconds):
+        spans = getattr(self._local, 'spans', None)
+        if spans is not None:
+            spans.append((name, seconds))
+
+    @contextmanager
+    def span(self, phase):
+        """Time one phase of the current rerun"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.histogram(PHASE_METRIC, 'phase', phase).observe(elapsed)
+            self._record_span(phase, elapsed)
+
+    def timed(self, name):
+        """Decorator recording every call of a function under ``name``"""
+        def decorate(func):
+            histogram = self.histogram(CALL_METRIC, 'function', name)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    histogram.observe(elapsed)
+                    self._record_span(name, elapsed)
+            return wrapper
+        return decorate
+
+    @contextmanager
+    def rerun(self, session=None, script='main'):
+        """Time a whole script run and log it if it goes over budget
+
+        ``script`` names what ran: ``'main'`` or the fragment rerun on its
+        own. Inside a run that is already being timed this does nothing.
+        Streamlit ends a run early by raising (``st.rerun``, ``st.stop``), so
+        the run is recorded whichever way the block exits.
+        """
+        if getattr(self._local, 'spans', None) is not None:
+            yield
+            return
+        spans = self._local.spans = []
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.spans = None
+            self.histogram(RERUN_METRIC, 'script', script).observe(elapsed)
+            if elapsed * 1000 > self.slow_rerun_ms:
+                self._log_slow_rerun(session, script, elapsed, spans)
+
+    def _log_slow_rerun(self, session, script, elapsed, spans):
+        entry = {
+            'at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'session': session,
+            'script': script,
+            'total_ms': round(elapsed * 1000, 2),
+            'budget_ms': self.slow_rerun_ms,
+            'spans': [{'name': name, 'ms': round(seconds * 1000, 3)} for name, seconds in spans],
+        }
+        self.slow_reruns.append(entry)
+        slow_rerun_log.warning("Slow rerun: %s", json.dumps(entry, ensure_ascii=False))
+
+    def _items(self):
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def to_prometheus(self):
+        lines, described = [], set()
+        for (metric, label_name, label), histogram in self._items():
+            if metric not in described:
+                described.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative, count, total = histogram.snapshot()
+            labels = f'{label_name}="{label}"'
+            for bound, seen in zip(histogram.buckets, cumulative):
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {seen}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f'{metric}_sum{{{labels}}} {total}')
+            lines.append(f'{metric}_count{{{labels}}} {count}')
+        caches = [(name, cache.stats()) for name, cache in sorted(named_caches.items())]
+        if caches:
+            lines.append(f"# TYPE {CACHE_METRIC} counter")
+            for name, stats in caches:
+                for result, field in (('hit', 'hits'), ('miss', 'misses'), ('coalesced', 'coalesced')):
+                    lines.append(f'{CACHE_METRIC}{{cache="{name}",result="{result}"}} {stats[field]}')
+            lines.append(f"# TYPE {CACHE_EVICTION_METRIC} counter")
+            for name, stats in caches:
+                lines.append(f'{CACHE_EVICTION_METRIC}{{cache="{name}",reason="size"}} {stats["evictions"]}')
+                lines.append(f'{CACHE_EVICTION_METRIC}{{cache="{name}",reason="ttl"}} {stats["expirations"]}')
+            lines.append(f"# TYPE {CACHE_SIZE_METRIC} gauge")
+            for name, stats in caches:
+                lines.append(f'{CACHE_SIZE_METRIC}{{cache="{name}"}} {stats["size"]}')
+        gates = [(name, gate.stats()) for name, gate in sorted(self.gates.items())]
+        if gates:
+            for metric, kind, field in ((QUEUE_DEPTH_METRIC, 'gauge', 'queued'),
+                                        (QUEUE_RUNNING_METRIC, 'gauge', 'running'),
+                                        (QUEUE_WORKERS_METRIC, 'gauge', 'workers'),
+                                        (QUEUE_ADMITTED_METRIC, 'counter', 'admitted')):
+                lines.append(f"# TYPE {metric} {kind}")
+                for name, stats in gates:
+                    lines.append(f'{metric}{{gate="{name}"}} {stats[field]}')
+            lines.append(f"# TYPE {QUEUE_REJECTED_METRIC} counter")
+            for name, stats in gates:
+                for reason, count in stats['rejected'].items():
+                    lines.append(f'{QUEUE_REJECTED_METRIC}{{gate="{name}",reason="{reason}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def to_json(self):
+        metrics = {}
+        for (metric, label_name, label), histogram in self._items():
+            snapshot = histogram.snapshot()
+            _, count, total = snapshot
+            metrics.setdefault(metric, {})[label] = {
+                'count': count,
+                'sum_ms': round(total * 1000, 3),
+                'mean_ms': round(total * 1000 / count, 3) if count else 0.0,
+                **{f'p{int(q * 100)}_ms': histogram.quantile(q, snapshot) * 1000
+                   for q in (0.5, 0.95, 0.99)},
+            }
+        return {'metrics': metrics,
+                'caches': {name: cache.stats() for name, cache in sorted(named_caches.items())},
+                'queues': {name: gate.stats() for name, gate in sorted(self.gates.items())},
+                'slow_rerun_budget_ms': self.slow_rerun_ms, 'slow_reruns': len(self.slow_reruns)}
+
+
+registry = MetricsRegistry()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = registry
+
+    def do_GET(self):
+        path = self.path.partition('?')[0].rstrip('/')
+        if path == '/metrics':
+            body = self.registry.to_prometheus().encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        elif path == '/metrics.json':
+            body = json.dumps(self.registry.to_json(), ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json'
+        elif path == '/metrics/slow-reruns':
+            body = json.dumps(list(self.registry.slow_reruns), ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    """Serves a registry over HTTP from a daemon thread"""
+
+    def __init__(self, metrics=registry, host=METRICS_HOST, port=METRICS_PORT):
+        handler = type('MetricsHandler', (_MetricsHandler,), {'registry': metrics})
+        self.httpd = ThreadingHTTPServer((host, int(port)), handler)
+        self.httpd.daemon_threads = True
+        self.address = self.httpd.server_address
+        self._thread = threading.Thread(target=self.httpd.serve_forever,
+                                        name='indic-metrics', daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def start_metrics_server(metrics=registry, host=METRICS_HOST, port=METRICS_PORT):
+    """Start the endpoint, or return ``None`` when disabled or the port is taken
+
+    Set ``INDIC_GAMES_METRICS_PORT`` to an empty string to disable it.
+    """
+    if port in (None, ''):
+        return None
+    try:
+        return MetricsServer(metrics, host, port)
+    except OSError as e:
+        slow_rerun_log.warning("Metrics endpoint not started on %s:%s: %s", host, port, e)
+        return None
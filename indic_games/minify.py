@@ -0,0 +1,82 @@
+"""Whitespace minification for generated HTML and CSS
+
+Conservative by design, so a minified page renders exactly like the
+original: runs of whitespace in text collapse to one space (never to
+nothing, which could join inline elements), whitespace is dropped only
+around tags that never render it, ``<pre>`` and ``<textarea>`` are left
+alone, and ``<script>`` keeps its line breaks and only loses indentation.
+HTML comments stay, since ``<!-- game-assets -->`` marks where assets are
+spliced in. Inside ``<style>`` comments and optional whitespace outside quoted
+strings go, and keyframe steps with identical bodies are merged
+(``0%,100%{...}``).
+
+Results are memoized per source string, so the app's stylesheet is
+minified once per process, not on every rerun.
+"""
+
+import functools
+import re
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_STRING = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')')
+_CSS_SPACE = re.compile(r'\s+')
+# Whitespace around these is never significant in CSS. ':' is left out on
+# purpose: ``a :hover`` and ``a:hover`` are different selectors.
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_CSS_AFTER_COLON = re.compile(r':\s+')
+_CSS_KEYFRAMES = re.compile(r'(@keyframes\s*[\w-]+\{)((?:[^{}]*\{[^{}]*\})*)\}')
+_CSS_STEP = re.compile(r'([^{}]+)\{([^{}]*)\}')
+
+_RAW_BLOCK = re.compile(r'(<(style|script|pre|textarea)\b[^>]*>)(.*?)(</\2\s*>)', re.S | re.I)
+_SPACE = re.compile(r'\s+')
+# Document-level tags: whitespace next to them is never rendered
+_QUIET_TAG = re.compile(
+    r'\s*(</?(?:!doctype|html|head|meta|title|link|style|script|body)\b[^>]*>)\s*', re.I)
+
+
+def _merge_keyframe_steps(match):
+    steps = {}
+    for selector, body in _CSS_STEP.findall(match.group(2)):
+        steps.setdefault(body, []).append(selector)
+    merged = ''.join(f"{','.join(selectors)}{{{body}}}" for body, selectors in steps.items())
+    return f"{match.group(1)}{merged}}}"
+
+
+def _squeeze(css):
+    css = _CSS_SPACE.sub(' ', css)
+    css = _CSS_PUNCTUATION.sub(r'\1', css)
+    css = _CSS_AFTER_COLON.sub(':', css)
+    return css.replace(';}', '}')
+
+
+def minify_css(css):
+    """Drop comments and optional whitespace, merge identical keyframe steps"""
+    # Odd parts are quoted strings (``content: ', '``), which keep their spaces
+    parts = _CSS_STRING.split(_CSS_COMMENT.sub('', css))
+    css = ''.join(part if index % 2 else _squeeze(part) for index, part in enumerate(parts))
+    return _CSS_KEYFRAMES.sub(_merge_keyframe_steps, css).strip()
+
+
+def _minify_script(script):
+    lines = (line.strip() for line in script.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+@functools.lru_cache(maxsize=64)
+def minify_html(page):
+    """Minified copy of an HTML document or fragment (a ``str``)"""
+    parts = []
+    position = 0
+    for match in _RAW_BLOCK.finditer(page):
+        parts.append(_SPACE.sub(' ', page[position:match.start()]))
+        open_tag, name, body, close_tag = match.groups()
+        name = name.lower()
+        if name == 'style':
+            body = minify_css(body)
+        elif name == 'script':
+            body = _minify_script(body)
+        parts.append(f"{open_tag}{body}{close_tag}")
+        position = match.end()
+    parts.append(_SPACE.sub(' ', page[position:]))
+    # Raw blocks are already tag-delimited, so this only trims around their tags
+    return _QUIET_TAG.sub(r'\1', ''.join(parts)).strip()
@@ -0,0 +1,92 @@
+"""Local stand-in for a generation service, for offline tests and benchmarks
+
+Speaks the ``POST /v1/generate`` batch protocol of ``indic_games.backends``
+and answers with ``RulesBackend`` content after a simulated model latency
+(a fixed cost per batch plus a cost per request). It can also shed load
+like a real service: batches beyond ``--max-batch`` get 429, and a random
+share of batches fail with 503 to exercise client retries.
+
+    python -m indic_games.mock_backend --port 8700 --latency-ms 40 --fail-rate 0.05
+    INDIC_GAMES_BACKEND_URL=http://127.0.0.1:8700 streamlit run streamlit_app.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from http import HTTPStatus
+
+from indic_games.api import ApiServer
+from indic_games.backends import RulesBackend
+
+DEFAULT_PORT = 8700
+
+
+class MockBackendApi:
+    """Request handler for ``ApiServer`` with simulated latency and failures"""
+
+    def __init__(self, latency=0.04, per_request=0.002, fail_rate=0.0, max_batch=64, seed=None):
+        self.latency = latency
+        self.per_request = per_request
+        self.fail_rate = fail_rate
+        self.max_batch = max_batch
+        self.rng = random.Random(seed)
+        self.counters = dict.fromkeys(('batches', 'requests', 'rejected', 'failed'), 0)
+
+    def handle(self, method, target, body=b'', headers=None):
+        if target.partition('?')[0].rstrip('/') != '/v1/generate':
+            return HTTPStatus.NOT_FOUND, b'{"error": "Not found"}'
+        if method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED, b'{"error": "Use POST"}'
+        return self._generate(body)
+
+    async def _generate(self, body):
+        try:
+            requests = json.loads(body)['requests']
+        except (ValueError, KeyError, TypeError):
+            return HTTPStatus.BAD_REQUEST, b'{"error": "Expected {\\"requests\\": [...]}"}'
+        if len(requests) > self.max_batch:
+            self.counters['rejected'] += 1
+            return HTTPStatus.TOO_MANY_REQUESTS, b'{"error": "Batch too large"}'
+        self.counters['batches'] += 1
+        self.counters['requests'] += len(requests)
+        await asyncio.sleep(self.latency + self.per_request * len(requests))
+        if self.fail_rate and self.rng.random() < self.fail_rate:
+            self.counters['failed'] += 1
+            return HTTPStatus.SERVICE_UNAVAILABLE, b'{"error": "Model overloaded"}'
+        results = [RulesBackend.content(request) for request in requests]
+        return HTTPStatus.OK, json.dumps({'results': results}, ensure_ascii=False).encode('utf-8')
+
+
+async def start_mock_backend(host='127.0.0.1', port=DEFAULT_PORT, **options):
+    """Start serving in the running loop; returns ``(server, api)``"""
+    api = MockBackendApi(**options)
+    server = await ApiServer(api).start(host, port)
+    return server, api
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=float, default=40, help="fixed cost per batch")
+    parser.add_argument('--per-request-ms', type=float, default=2, help="extra cost per request")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="share of batches answered 503")
+    parser.add_argument('--max-batch', type=int, default=64, help="larger batches are answered 429")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server, _ = await start_mock_backend(
+            args.host, args.port, latency=args.latency_ms / 1000,
+            per_request=args.per_request_ms / 1000, fail_rate=args.fail_rate, max_batch=args.max_batch)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""Staged game generation with streamed progress and cancellation
+
+A submission runs through four stages, each timed on its own:
+
+    context     validate the request and resolve its theme category
+    mechanics   pick the game mechanics and features
+    translate   localize the labels the game's page is shown with
+    finalize    assemble the record, save it and render its HTML file
+
+``GenerationRunner`` runs jobs as asyncio tasks on one background event loop
+shared by every session. Stage work is handed to a thread pool, so the loop
+keeps scheduling other jobs while one saves or renders; the mechanics stage
+awaits the runner's content backend (``indic_games.backends``) on the loop
+itself, so concurrent submissions share its connections and batches. The
+caller gets a ``GenerationJob`` back straight away, reads ``ProgressEvent``s
+from it as the stages finish and a ``GameRecord`` from ``result()``, and can
+``cancel()`` it at any time; a cancelled job stops before its next stage and
+is never saved. Stages run in threads can't be interrupted, so ``finalize``
+checks for a cancel once more right before it saves.
+
+The runner's ``AdmissionGate`` (``indic_games.admission``) bounds how many
+jobs run and wait at once, and how many one session may have in flight. A
+submission over those limits comes back as a finished job whose
+``result()`` raises ``BusyError`` with a retry estimate, so the caller's
+thread is free again at once; a job that has to queue for a worker first
+reports a ``queue`` event, and gives up with ``BusyError`` if none frees
+up in time.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from indic_games import metrics
+from indic_games.admission import AdmissionGate, BusyError
+from indic_games.backends import BackendError, backend_from_env, content_request
+from indic_games.generator import (DEFAULT_FEATURES, DEFAULT_MECHANICS, default_description,
+                                   game_labels, game_record, game_request_error)
+from indic_games.record import GameRecord
+from indic_games.render import render_game_html
+from indic_games.theme_index import split_theme
+
+STAGES = (
+    ('context', "🤖 Analyzing cultural context"),
+    ('mechanics', "🎨 Generating game mechanics"),
+    ('translate', "🌍 Translating to selected language"),
+    ('finalize', "✨ Finalizing your game"),
+)
+STAGE_METRIC = 'indic_generation_stage_seconds'
+JOB_TIMEOUT = 30
+
+ProgressEvent = namedtuple('ProgressEvent', 'stage label progress elapsed_ms')
+ProgressEvent.__doc__ = """A stage starting (``elapsed_ms`` is None) or finishing"""
+QUEUE_EVENT = ProgressEvent('queue', "⏳ Waiting for a free generator", 0, None)
+
+_DONE = object()
+
+log = logging.getLogger(__name__)
+
+
+class GenerationError(Exception):
+    """The request was rejected before anything was generated"""
+
+
+def analyze_context(state):
+    params = state['request']
+    error = game_request_error(params)
+    if error:
+        raise GenerationError(error)
+    title, genre, theme = (params[field].strip() for field in ('title', 'genre', 'theme'))
+    category, subject = split_theme(theme)
+    state.update(
+        title=title, genre=genre, theme=theme, category=category, subject=subject,
+        language=params['language'],
+        description=(params.get('description') or '').strip() or default_description(genre, theme),
+    )
+
+
+async def select_mechanics(state):
+    backend = state.get('backend')
+    content = None
+    if backend is not None:
+        try:
+            content = await backend.generate(content_request(state))
+        except BackendError as e:
+            # A backend outage degrades to the default content, not a failed game
+            log.warning("Generation backend failed, using default content: %s", e)
+    state['mechanics'] = content['mechanics'] if content else DEFAULT_MECHANICS
+    state['features'] = content['features'] if content else DEFAULT_FEATURES
+
+
+def translate_labels(state):
+    state['labels'] = game_labels(state['genre'], state['theme'], state['language'])
+
+
+def finalize(state):
+    game = game_record(state['title'], state['genre'], state['theme'], state['language'],
+                       state['description'], state['mechanics'], state['features'])
+    if state['cancelled'].is_set():
+        # Cancelled or timed out while the earlier stages ran; the caller has moved on
+        return
+    store = state.get('store')
+    if store is not None:
+        game = store.save(game)
+    game = GameRecord.from_dict(game)
+    # Warm the artifact cache so the download button is ready on the next rerun
+    render_game_html(game, game.language, labels=state['labels'])
+    state['game'] = game
+
+
+STAGE_FUNCTIONS = {
+    'context': analyze_context,
+    'mechanics': select_mechanics,
+    'translate': translate_labels,
+    'finalize': finalize,
+}
+
+
+class GenerationJob:
+    """Handle on a submitted generation: progress events, result, cancel"""
+
+    def __init__(self, request, store=None, backend=None):
+        self.state = {'request': request, 'store': store, 'backend': backend,
+                      'cancelled': threading.Event()}
+        self.timings = {}
+        self._events = queue.SimpleQueue()
+        self._future = None
+
+    def _emit(self, event):
+        self._events.put(event)
+
+    def events(self, timeout=JOB_TIMEOUT):
+        """Yield progress events until the job finishes
+
+        Raises ``TimeoutError`` (after cancelling the job) if it has not
+        finished within ``timeout`` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                event = self._events.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.cancel()
+                raise TimeoutError(f"Generation did not finish within {timeout}s") from None
+            if event is _DONE:
+                return
+            yield event
+
+    def result(self, timeout=JOB_TIMEOUT):
+        """The saved game; re-raises whatever stopped the job"""
+        return self._future.result(timeout)
+
+    def cancel(self):
+        """Stop the job before its next stage or its save; a no-op once it has finished"""
+        self.state['cancelled'].set()
+        cancelled = self._future.cancel()
+        if cancelled:
+            # A job cancelled before it started never reaches its own _DONE
+            self._emit(_DONE)
+        return cancelled
+
+    def done(self):
+        return self._future.done()
+
+    def cancelled(self):
+        return self._future.cancelled()
+
+
+class GenerationRunner:
+    """Runs generation jobs on a background asyncio loop, within its gate's limits"""
+
+    def __init__(self, backend=None, gate=None):
+        self.backend = backend if backend is not None else backend_from_env()
+        self.gate = gate if gate is not None else AdmissionGate(name='generation')
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name='indic-generation', daemon=True)
+        self._thread.start()
+
+    def submit(self, request, store=None, session=None):
+        """Start a job for ``request``, counted against ``session``'s quota"""
+        job = GenerationJob(request, store, self.backend)
+        try:
+            ticket = self.gate.admit(session)
+        except BusyError as e:
+            job._future = concurrent.futures.Future()
+            job._future.set_exception(e)
+            job._emit(_DONE)
+            return job
+        job._future = asyncio.run_coroutine_threadsafe(self._run(job, ticket), self.loop)
+        # A job cancelled before its first step never reaches the gate to leave it
+        job._future.add_done_callback(
+            lambda _: self.loop.call_soon_threadsafe(self.gate.abandon, ticket))
+        return job
+
+    async def _run(self, job, ticket):
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.gate.slot(ticket, on_queue=lambda: job._emit(QUEUE_EVENT)):
+                for number, (stage, label) in enumerate(STAGES):
+                    job._emit(ProgressEvent(stage, label, number * 100 // len(STAGES), None))
+                    start = time.perf_counter()
+                    function = STAGE_FUNCTIONS[stage]
+                    if asyncio.iscoroutinefunction(function):
+                        await function(job.state)
+                    else:
+                        await loop.run_in_executor(None, function, job.state)
+                    elapsed = time.perf_counter() - start
+                    job.timings[stage] = elapsed
+                    metrics.registry.histogram(STAGE_METRIC, 'stage', stage).observe(elapsed)
+                    job._emit(ProgressEvent(stage, label, (number + 1) * 100 // len(STAGES),
+                                            round(elapsed * 1000, 3)))
+                return job.state['game']
+        finally:
+            job._emit(_DONE)
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.backend.close(), self.loop).result(JOB_TIMEOUT)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
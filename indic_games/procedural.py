@@ -0,0 +1,375 @@
+"""Seeded procedural quizzes and level layouts for generated games
+
+Every game page carries a play set: a quiz drawn from a small knowledge
+table of Indian culture and a run of maze levels to walk through. The play
+set is a pure function of its seed, and a game's seed is a hash of its
+title, genre, theme and language, so the same game always plays the same
+way, in every export and on every machine.
+
+Play sets are generated in batches, one NumPy array operation per step for
+the whole batch, so producing thousands of variants is cheap:
+
+- questions are drawn without replacement, facts about the theme's own
+  subject first, then the rest of its category, then anything else
+- each question's options are its answer plus distractors drawn from the
+  answers to the same kind of question, shuffled
+- each level is a grid of walls that grows denser level by level, with a
+  path from start to goal always carved clear and stars placed along it
+
+Random numbers come from a counter-based generator (SplitMix64 over the
+seed, a stream and the position), so a variant does not depend on how the
+batch it was generated in was made up, nor on the NumPy version.
+
+    batch = generate_batch(seeds, [theme_key(theme) for theme in themes])
+    play = batch.variant(0)
+
+Pages take their play set as JSON from ``play_json``, memoized per seed.
+Bulk renders go through ``prepared`` so each window of pages has its play
+sets generated in one batch rather than one at a time.
+"""
+
+import functools
+import hashlib
+import itertools
+import json
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from indic_games.memo import MemoCache
+from indic_games.theme_index import normalize, split_theme
+
+ENGINE_VERSION = 1
+PLAY_CACHE_SIZE = 4096
+# Play sets generated together by ``prepared``
+BATCH_SIZE = 512
+QUESTIONS = 5
+OPTIONS = 4
+LEVELS = 3
+GRID_SIZE = 8
+# Share of a level's cells that start as walls, first level to last
+WALL_DENSITY = (0.2, 0.35)
+# Stars on the first level; each later level has one more
+FIRST_LEVEL_STARS = 2
+
+# category -> ((question template, ((subject, answer), ...)), ...)
+# Every kind of question needs at least OPTIONS distinct answers.
+KNOWLEDGE = {
+    'mythology': (
+        ("What is the vahana (mount) of {}?", (
+            ('Ganesha', 'Mouse'), ('Shiva', 'Nandi the bull'), ('Vishnu', 'Garuda'), ('Durga', 'Lion'),
+            ('Saraswati', 'Swan'), ('Kartikeya', 'Peacock'), ('Indra', 'Airavata'))),
+        ("Who is the consort of {}?", (
+            ('Rama', 'Sita'), ('Shiva', 'Parvati'), ('Vishnu', 'Lakshmi'), ('Brahma', 'Saraswati'),
+            ('Nala', 'Damayanti'), ('Satyavan', 'Savitri'))),
+        ("Which weapon is {} known for?", (
+            ('Arjuna', 'Gandiva bow'), ('Shiva', 'Trishula'), ('Vishnu', 'Sudarshana Chakra'),
+            ('Hanuman', 'Gada (mace)'), ('Indra', 'Vajra'), ('Parashurama', 'Axe'))),
+    ),
+    'historical': (
+        ("Who founded the {}?", (
+            ('Maurya Empire', 'Chandragupta Maurya'), ('Mughal Empire', 'Babur'), ('Maratha Empire', 'Shivaji'),
+            ('Vijayanagara Empire', 'Harihara I and Bukka Raya I'), ('Delhi Sultanate', 'Qutb ud-Din Aibak'),
+            ('Gupta Empire', 'Sri Gupta'))),
+        ("Which ruler built {}?", (
+            ('Brihadeeswarar Temple', 'Rajaraja Chola I'), ('Taj Mahal', 'Shah Jahan'),
+            ('Great Stupa at Sanchi', 'Ashoka'), ('Fatehpur Sikri', 'Akbar'),
+            ('Konark Sun Temple', 'Narasimhadeva I'), ('Gol Gumbaz', 'Muhammad Adil Shah'))),
+    ),
+    'festival': (
+        ("{} is popularly known as the festival of what?", (
+            ('Diwali', 'Lights'), ('Holi', 'Colours'), ('Navratri', 'Nine nights'),
+            ('Raksha Bandhan', 'The sibling bond'), ('Uttarayan', 'Kites'), ('Lohri', 'Bonfires'))),
+        ("Which state is {} most closely associated with?", (
+            ('Onam', 'Kerala'), ('Bihu', 'Assam'), ('Durga Puja', 'West Bengal'),
+            ('Ganesh Chaturthi', 'Maharashtra'), ('Pongal', 'Tamil Nadu'), ('Hornbill Festival', 'Nagaland'))),
+        ("Which deity is worshipped during {}?", (
+            ('Ganesh Chaturthi', 'Ganesha'), ('Durga Puja', 'Durga'), ('Maha Shivaratri', 'Shiva'),
+            ('Janmashtami', 'Krishna'), ('Ram Navami', 'Rama'), ('Chhath Puja', 'Surya'))),
+    ),
+    'culture': (
+        ("{} is a classical dance of which state?", (
+            ('Bharatanatyam', 'Tamil Nadu'), ('Kathakali', 'Kerala'), ('Kuchipudi', 'Andhra Pradesh'),
+            ('Odissi', 'Odisha'), ('Kathak', 'Uttar Pradesh'), ('Manipuri', 'Manipur'), ('Sattriya', 'Assam'))),
+        ("Who is traditionally credited with the {}?", (
+            ('Yoga Sutras', 'Patanjali'), ('Natya Shastra', 'Bharata Muni'), ('Arthashastra', 'Kautilya'),
+            ('Charaka Samhita', 'Charaka'), ('Sushruta Samhita', 'Sushruta'), ('Ashtadhyayi', 'Panini'))),
+    ),
+    'geography': (
+        ("What is the capital of {}?", (
+            ('Karnataka', 'Bengaluru'), ('Tamil Nadu', 'Chennai'), ('Maharashtra', 'Mumbai'),
+            ('West Bengal', 'Kolkata'), ('Rajasthan', 'Jaipur'), ('Kerala', 'Thiruvananthapuram'),
+            ('Gujarat', 'Gandhinagar'), ('Bihar', 'Patna'), ('Odisha', 'Bhubaneswar'))),
+        ("Where does the {} river rise?", (
+            ('Ganga', 'Gangotri Glacier'), ('Yamuna', 'Yamunotri Glacier'), ('Godavari', 'Trimbakeshwar'),
+            ('Kaveri', 'Talakaveri'), ('Narmada', 'Amarkantak'), ('Krishna', 'Mahabaleshwar'))),
+        ("Which range is {} in?", (
+            ('Kangchenjunga', 'Himalayas'), ('Anamudi', 'Western Ghats'), ('Guru Shikhar', 'Aravalli Range'),
+            ('Dhupgarh', 'Satpura Range'), ('Mahendragiri', 'Eastern Ghats'))),
+    ),
+    'literature': (
+        ("Who wrote the {}?", (
+            ('Ramayana', 'Valmiki'), ('Mahabharata', 'Vyasa'), ('Abhijnanashakuntalam', 'Kalidasa'),
+            ('Thirukkural', 'Thiruvalluvar'), ('Silappatikaram', 'Ilango Adigal'),
+            ('Gitanjali', 'Rabindranath Tagore'), ('Gita Govinda', 'Jayadeva'), ('Ramcharitmanas', 'Tulsidas'))),
+        ("In which language was the {} written?", (
+            ('Thirukkural', 'Tamil'), ('Gitanjali', 'Bengali'), ('Ramcharitmanas', 'Awadhi'),
+            ('Abhijnanashakuntalam', 'Sanskrit'), ('Jnaneshwari', 'Marathi'), ('Kavirajamarga', 'Kannada'))),
+    ),
+    'architecture': (
+        ("In which state is {}?", (
+            ('Konark Sun Temple', 'Odisha'), ('Brihadeeswarar Temple', 'Tamil Nadu'),
+            ('Khajuraho', 'Madhya Pradesh'), ('Amber Fort', 'Rajasthan'), ('Golconda Fort', 'Telangana'),
+            ('Mysore Palace', 'Karnataka'), ('Ajanta Caves', 'Maharashtra'), ('Somnath Temple', 'Gujarat'))),
+    ),
+    'cuisine': (
+        ("Which region is {} from?", (
+            ('Dhokla', 'Gujarat'), ('Vada pav', 'Maharashtra'), ('Litti chokha', 'Bihar'),
+            ('Rogan josh', 'Kashmir'), ('Dal baati churma', 'Rajasthan'), ('Sarson da saag', 'Punjab'),
+            ('Bisi bele bath', 'Karnataka'), ('Appam and stew', 'Kerala'))),
+        ("What is {} called in Hindi?", (
+            ('Turmeric', 'Haldi'), ('Cumin', 'Jeera'), ('Coriander', 'Dhaniya'), ('Cardamom', 'Elaichi'),
+            ('Fenugreek', 'Methi'), ('Asafoetida', 'Hing'), ('Carom seeds', 'Ajwain'))),
+    ),
+    'music': (
+        ("Which instrument is {} famous for?", (
+            ('Ravi Shankar', 'Sitar'), ('Zakir Hussain', 'Tabla'), ('Bismillah Khan', 'Shehnai'),
+            ('Hariprasad Chaurasia', 'Bansuri'), ('Shivkumar Sharma', 'Santoor'),
+            ('Amjad Ali Khan', 'Sarod'), ('Lalgudi Jayaraman', 'Violin'))),
+    ),
+    'art': (
+        ("Which state does {} art come from?", (
+            ('Madhubani', 'Bihar'), ('Warli', 'Maharashtra'), ('Tanjore', 'Tamil Nadu'), ('Pattachitra', 'Odisha'),
+            ('Kalamkari', 'Andhra Pradesh'), ('Gond', 'Madhya Pradesh'), ('Phad', 'Rajasthan'),
+            ('Pithora', 'Gujarat'))),
+    ),
+}
+
+# Changes whenever anything but the seed that play sets are made from does
+ENGINE_DIGEST = hashlib.blake2b(json.dumps(
+    [ENGINE_VERSION, QUESTIONS, OPTIONS, LEVELS, GRID_SIZE, WALL_DENSITY, FIRST_LEVEL_STARS, KNOWLEDGE]
+).encode('utf-8'), digest_size=16).hexdigest()
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_SHIFTS = tuple(map(np.uint64, (30, 27, 31, 11)))
+# Independent random streams per seed, one for each thing drawn
+_STREAMS = ('questions', 'distractors', 'options', 'walls', 'path', 'stars')
+_STREAM_OFFSETS = np.arange(1, len(_STREAMS) + 1, dtype=np.uint64) * _GOLDEN
+_TILES = np.frombuffer(b'.#', dtype=np.uint8)
+_WALL_DENSITY = np.linspace(*WALL_DENSITY, LEVELS)[None, :, None, None]
+
+
+def _key(text):
+    return ' '.join(normalize(text))
+
+
+def _build_tables():
+    """Flat arrays over every fact: its question, answer, category and subject"""
+    questions, answers, categories, subjects = [], [], [], []
+    answer_ids, subject_ids, relation_answers = {}, {}, []
+    for category_id, relations in enumerate(KNOWLEDGE.values()):
+        for template, facts in relations:
+            ids = [answer_ids.setdefault(answer, len(answer_ids)) for _, answer in facts]
+            if len(set(ids)) != len(ids) or len(ids) < OPTIONS:
+                raise ValueError(f"{template!r} needs {OPTIONS} or more distinct answers")
+            for (subject, _), answer_id in zip(facts, ids):
+                questions.append(template.format(subject))
+                answers.append((len(relation_answers), answer_id))
+                categories.append(category_id)
+                subjects.append(subject_ids.setdefault(_key(subject), len(subject_ids)))
+            relation_answers.append(ids)
+    width = max(map(len, relation_answers))
+    # Each relation's answers, padded with -1 to a common width
+    padded = np.full((len(relation_answers), width), -1, dtype=np.int64)
+    for row, ids in enumerate(relation_answers):
+        padded[row, :len(ids)] = ids
+    relation, answer = (np.array(column, dtype=np.int64) for column in zip(*answers))
+    return {
+        'questions': tuple(questions),
+        'answers': tuple(answer_ids),
+        'relation': relation,
+        'answer': answer,
+        'category': np.array(categories, dtype=np.int64),
+        'subject': np.array(subjects, dtype=np.int64),
+        'relation_answers': padded,
+        'subject_ids': subject_ids,
+    }
+
+
+_TABLES = _build_tables()
+CATEGORIES = tuple(KNOWLEDGE)
+
+
+def theme_key(theme):
+    """``(category id, subject id)`` of a theme, ``-1`` for either one the table lacks"""
+    category, subject = split_theme(theme)
+    category = _key(category)
+    return (CATEGORIES.index(category) if category in KNOWLEDGE else -1,
+            _TABLES['subject_ids'].get(_key(subject), -1))
+
+
+def play_seed(game, language):
+    """The seed of a game's play set, small enough to survive a round trip through JS"""
+    payload = '\x1f'.join((game['title'], game['genre'], game['theme'], language)).encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), 'little') >> 11
+
+
+def _mix(x):
+    # SplitMix64 finalizer, in place on a fresh array; uint64 arithmetic wraps
+    x ^= x >> _SHIFTS[0]
+    x *= _MIX1
+    x ^= x >> _SHIFTS[1]
+    x *= _MIX2
+    x ^= x >> _SHIFTS[2]
+    return x
+
+
+@functools.lru_cache(maxsize=None)
+def _counters(size):
+    counters = np.arange(1, size + 1, dtype=np.uint64) * _GOLDEN
+    counters.flags.writeable = False
+    return counters
+
+
+def _streams(seeds):
+    """Per seed, the starting state of each of its random streams"""
+    return _mix(seeds[:, None] + _STREAM_OFFSETS[None, :])
+
+
+def _uniform(streams, stream, shape):
+    """Floats in [0, 1) of ``shape`` per seed, from the seeds' own ``stream``"""
+    bits = _mix(streams[:, _STREAMS.index(stream), None] + _counters(math.prod(shape))[None, :])
+    return ((bits >> _SHIFTS[3]).astype(np.float64) * 2.0 ** -53).reshape((len(streams),) + shape)
+
+
+def _first(keys, count):
+    """Indices of the ``count`` smallest keys along the last axis, smallest first"""
+    return np.argsort(keys, axis=-1, kind='stable')[..., :count]
+
+
+class PlayBatch(namedtuple('PlayBatch', 'seeds facts options answers walls paths stars')):
+    """Arrays of a generated batch, one row per variant"""
+
+    __slots__ = ()
+
+    def variant(self, index):
+        """The play set of variant ``index`` as plain JSON-ready data"""
+        questions, answer_text = _TABLES['questions'], _TABLES['answers']
+        # Every level's rows of '#' (wall) and '.' in one string
+        cells = _TILES[self.walls[index].view(np.uint8)].tobytes().decode('ascii')
+        stars = self.stars[index].tolist()
+        levels = []
+        for level in range(LEVELS):
+            first = level * GRID_SIZE * GRID_SIZE
+            levels.append({
+                'grid': [cells[start:start + GRID_SIZE] for start in range(first, first + GRID_SIZE ** 2, GRID_SIZE)],
+                'start': [0, 0],
+                'goal': [GRID_SIZE - 1, GRID_SIZE - 1],
+                'stars': stars[level][:FIRST_LEVEL_STARS + level],
+            })
+        return {
+            'engine': ENGINE_VERSION,
+            'seed': int(self.seeds[index]),
+            'quiz': [{
+                'question': questions[fact],
+                'options': [answer_text[option] for option in options],
+                'answer': answer,
+            } for fact, options, answer in zip(self.facts[index].tolist(), self.options[index].tolist(),
+                                               self.answers[index].tolist())],
+            'levels': levels,
+        }
+
+
+def _draw_quiz(streams, categories, subjects):
+    tables = _TABLES
+    # Same subject first, then same category, then everything else
+    tier = np.where(tables['subject'][None, :] == subjects[:, None], 0,
+                    np.where(tables['category'][None, :] == categories[:, None], 1, 2))
+    facts = _first(tier + _uniform(streams, 'questions', tier.shape[1:]), QUESTIONS)
+
+    candidates = tables['relation_answers'][tables['relation'][facts]]
+    correct = tables['answer'][facts]
+    keys = _uniform(streams, 'distractors', candidates.shape[1:])
+    keys[(candidates < 0) | (candidates == correct[..., None])] = np.inf
+    distractors = np.take_along_axis(candidates, _first(keys, OPTIONS - 1), axis=-1)
+
+    choices = np.concatenate([correct[..., None], distractors], axis=-1)
+    order = _first(_uniform(streams, 'options', choices.shape[1:]), OPTIONS)
+    options = np.take_along_axis(choices, order, axis=-1)
+    answers = np.argmax(order == 0, axis=-1)
+    return facts, options, answers
+
+
+def _draw_levels(streams):
+    count, size, steps = len(streams), GRID_SIZE, 2 * (GRID_SIZE - 1)
+    walls = _uniform(streams, 'walls', (LEVELS, size, size)) < _WALL_DENSITY
+
+    # A monotone path: GRID_SIZE - 1 steps down, the rest right, in random order
+    ranks = np.argsort(_first(_uniform(streams, 'path', (LEVELS, steps)), steps), axis=-1)
+    down = ranks < size - 1
+    zero = np.zeros((count, LEVELS, 1), dtype=np.int64)
+    rows = np.concatenate([zero, np.cumsum(down, axis=-1)], axis=-1)
+    cols = np.concatenate([zero, np.cumsum(~down, axis=-1)], axis=-1)
+    variant = np.arange(count)[:, None, None]
+    level = np.arange(LEVELS)[None, :, None]
+    walls[variant, level, rows, cols] = False
+
+    # Stars sit on the path between start and goal
+    most = FIRST_LEVEL_STARS + LEVELS - 1
+    picks = 1 + _first(_uniform(streams, 'stars', (LEVELS, steps - 1)), most)
+    stars = np.stack([np.take_along_axis(rows, picks, axis=-1),
+                      np.take_along_axis(cols, picks, axis=-1)], axis=-1)
+    return walls, np.stack([rows, cols], axis=-1), stars
+
+
+def generate_batch(seeds, themes):
+    """Play sets for ``seeds``, each for its theme from ``themes`` (``theme_key`` pairs)"""
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    themes = np.asarray(themes, dtype=np.int64).reshape(len(seeds), 2)
+    streams = _streams(seeds)
+    facts, options, answers = _draw_quiz(streams, themes[:, 0], themes[:, 1])
+    walls, paths, stars = _draw_levels(streams)
+    return PlayBatch(seeds, facts, options, answers, walls, paths, stars)
+
+
+play_cache = MemoCache(PLAY_CACHE_SIZE, name='play_sets')
+
+
+def _play_key(game, language):
+    return play_seed(game, language), theme_key(game['theme'])
+
+
+def _encode(batch, index):
+    return json.dumps(batch.variant(index), ensure_ascii=False, separators=(',', ':'))
+
+
+def play_json(game, language):
+    """The game's play set as compact JSON, generated on its own unless prepared"""
+    seed, theme = key = _play_key(game, language)
+    return play_cache.get_or_compute(key, lambda: _encode(generate_batch([seed], [theme]), 0))
+
+
+def prepare(pairs):
+    """Generate the play sets of ``(game, language)`` pairs in one batch, into the cache"""
+    keys = list(dict.fromkeys(_play_key(game, language) for game, language in pairs))
+    if keys:
+        batch = generate_batch(*zip(*keys))
+        for index, key in enumerate(keys):
+            play_cache.get_or_compute(key, functools.partial(_encode, batch, index))
+
+
+def prepared(items, pair=None):
+    """Yield ``items``, preparing the play sets of each ``BATCH_SIZE`` of them first
+
+    ``pair`` maps an item to its ``(game, language)``; items are pairs by default.
+    """
+    items = iter(items)
+    while True:
+        window = list(itertools.islice(items, BATCH_SIZE))
+        if not window:
+            return
+        prepare(window if pair is None else map(pair, window))
+        yield from window
@@ -0,0 +1,144 @@
+"""Compact, immutable game records for session state
+
+A ``GameRecord`` holds the same fields as the game dicts used everywhere
+else, in far less memory:
+
+- slots instead of a per-instance dict
+- genre, theme and language interned, so every session shares one copy
+- mechanics and features as tuples shared with the catalog
+- ``generated_at`` packed into one integer (``20250101093000``)
+
+Records are read-only mappings, so ``game['title']``, ``game.get('id')`` and
+``dict(game)`` keep working in the preview, the store and the HTML renderer
+(mechanics and features come back as tuples). ``to_dict()`` gives the exact
+dict shape, lists included, for code that needs a real dict.
+"""
+
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+
+from indic_games.catalog import PREBUILT_GAMES
+from indic_games.generator import DEFAULT_FEATURES, DEFAULT_MECHANICS
+
+FIELDS = ('id', 'title', 'genre', 'theme', 'description', 'mechanics', 'features',
+          'language', 'generated_at')
+MAX_SHARED_TUPLES = 4096
+
+_shared_tuples = {}
+
+
+def shared_tuple(values):
+    """One tuple object per distinct mechanics/features list"""
+    values = tuple(values)
+    shared = _shared_tuples.get(values)
+    if shared is not None:
+        return shared
+    if len(_shared_tuples) < MAX_SHARED_TUPLES:
+        _shared_tuples[values] = values
+    return values
+
+
+for _values in (DEFAULT_MECHANICS, DEFAULT_FEATURES):
+    shared_tuple(_values)
+for _game in PREBUILT_GAMES:
+    shared_tuple(_game['mechanics'])
+    shared_tuple(_game['features'])
+
+
+def pack_timestamp(text):
+    """``'2025-01-01 09:30:00'`` -> ``20250101093000``"""
+    return int(text[0:4] + text[5:7] + text[8:10] + text[11:13] + text[14:16] + text[17:19])
+
+
+def unpack_timestamp(packed):
+    date, clock = divmod(packed, 1_000_000)
+    return (f"{date // 10000:04d}-{date // 100 % 100:02d}-{date % 100:02d} "
+            f"{clock // 10000:02d}:{clock // 100 % 100:02d}:{clock % 100:02d}")
+
+
+def now_timestamp():
+    now = datetime.now()
+    return (((now.year * 100 + now.month) * 100 + now.day) * 1_000_000
+            + (now.hour * 100 + now.minute) * 100 + now.second)
+
+
+class GameRecord(Mapping):
+    """Read-only game record with the same keys as a game dict"""
+
+    __slots__ = ('id', 'title', 'genre', 'theme', 'description', 'mechanics', 'features',
+                 'language', 'created')
+
+    def __init__(self, title, genre, theme, description, mechanics, features, language,
+                 created, id=None):
+        setattr_ = object.__setattr__
+        setattr_(self, 'id', id)
+        setattr_(self, 'title', title)
+        setattr_(self, 'genre', sys.intern(genre))
+        setattr_(self, 'theme', sys.intern(theme))
+        setattr_(self, 'description', description)
+        setattr_(self, 'mechanics', shared_tuple(mechanics))
+        setattr_(self, 'features', shared_tuple(features))
+        setattr_(self, 'language', sys.intern(language))
+        setattr_(self, 'created', created)
+
+    @classmethod
+    def from_dict(cls, game, **changes):
+        """Build a record from a game dict, overriding any of its fields"""
+        if changes:
+            game = {**game, **changes}
+        generated_at = game.get('generated_at')
+        return cls(
+            game['title'], game['genre'], game['theme'], game['description'],
+            game.get('mechanics', ()), game.get('features', ()), game['language'],
+            pack_timestamp(generated_at) if generated_at else now_timestamp(),
+            game.get('id'),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    __delattr__ = __setattr__
+
+    @property
+    def generated_at(self):
+        return unpack_timestamp(self.created)
+
+    def __getitem__(self, key):
+        if key == 'generated_at':
+            return self.generated_at
+        if key in FIELDS:
+            value = getattr(self, key)
+            # A record without an ID behaves like a dict without the key
+            if value is not None or key != 'id':
+                return value
+        raise KeyError(key)
+
+    def __iter__(self):
+        return (key for key in FIELDS if key != 'id' or self.id is not None)
+
+    def __len__(self):
+        return len(FIELDS) - (self.id is None)
+
+    def __reduce__(self):
+        return (type(self), (self.title, self.genre, self.theme, self.description,
+                             self.mechanics, self.features, self.language, self.created, self.id))
+
+    def __repr__(self):
+        return f"GameRecord(id={self.id!r}, title={self.title!r}, language={self.language!r})"
+
+    def to_dict(self):
+        """The plain game dict this record stands for"""
+        game = {
+            'title': self.title,
+            'genre': self.genre,
+            'theme': self.theme,
+            'description': self.description,
+            'mechanics': list(self.mechanics),
+            'features': list(self.features),
+            'language': self.language,
+            'generated_at': self.generated_at,
+        }
+        if self.id is not None:
+            game['id'] = self.id
+        return game
@@ -0,0 +1,590 @@
+"""Precompiled HTML rendering for downloadable games
+
+The game page shell (CSS, keyframes, script) is minified and split once
+into immutable byte segments; rendering a game only escapes its fields and
+joins them with the segments. Each page embeds its play set, the seeded
+quiz and maze levels from ``indic_games.procedural`` that its script plays
+once the game starts. Its genre, language name and play button are shown
+in the game's language, so its script fonts have text to cover, and the
+page declares that language in ``lang`` for font choice and shaping.
+
+The page comes in two render profiles: ``full``, the original animated
+look, and ``lite`` for low-end phones, which animates only
+compositor-friendly properties, drops the backdrop blur and honours
+``prefers-reduced-motion``. Rendered pages are memoized in a bounded LRU
+shared by every session, keyed by a hash of the fields the page uses, the
+language and the profile; concurrent requests for a page that isn't cached
+yet render it once.
+"""
+
+import functools
+import hashlib
+import html
+import re
+
+from indic_games.catalog import LANGUAGES
+from indic_games.generator import game_labels
+from indic_games.memo import MemoCache
+from indic_games.minify import minify_html
+from indic_games.procedural import play_json
+
+ARTIFACT_CACHE_SIZE = 256
+
+_PLACEHOLDER = re.compile(r'\{\{\s*(\w+)(?:\|(\w+))?\s*\}\}')
+
+# Characters that could end a single-quoted JS string or the <script> block
+_JS_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    "'": "\\'",
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '<': '\\u003C',
+    '>': '\\u003E',
+    '&': '\\u0026',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029',
+})
+_JS_UNSAFE = re.compile(r'[\\\'"\n\r<>&\u2028\u2029]')
+# JSON is already a valid JS literal; only what could end the <script> block needs escaping
+_JSON_ESCAPES = str.maketrans({
+    '<': '\\u003C',
+    '>': '\\u003E',
+    '&': '\\u0026',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029',
+})
+# Play sets run to a kilobyte and rarely need any; ``in`` scans beat a regex
+_JSON_UNSAFE = ('<', '>', '&', '\u2028', '\u2029')
+_HTML_UNSAFE = re.compile(r'[&<>"\']')
+
+
+def escape_html(value):
+    value = str(value)
+    if _HTML_UNSAFE.search(value) is None:
+        return value
+    return html.escape(value, quote=True)
+
+
+def escape_js(value):
+    """Escape a value for use inside a single-quoted JS string literal"""
+    value = str(value)
+    if _JS_UNSAFE.search(value) is None:
+        return value
+    return value.translate(_JS_ESCAPES)
+
+
+def escape_json(value):
+    """Make JSON text safe to embed as a literal in a <script> block"""
+    value = str(value)
+    if not any(char in value for char in _JSON_UNSAFE):
+        return value
+    return value.translate(_JSON_ESCAPES)
+
+
+ESCAPERS = {'html': escape_html, 'js': escape_js, 'json': escape_json}
+
+
+# Fields that repeat across games; titles, descriptions and play sets don't
+SHARED_FIELDS = frozenset(('genre', 'theme', 'language', 'lang', 'genre_label', 'language_name',
+                           'play_label'))
+# Longer values are escaped on every render rather than cached
+MAX_SHARED_CHARS = 128
+
+
+@functools.lru_cache(maxsize=4096)
+def _escaped_bytes(value, escaper):
+    return ESCAPERS[escaper](value).encode('utf-8')
+
+
+class CompiledTemplate:
+    """A template split once into immutable byte segments
+
+    Placeholders are written ``{{ name }}`` (HTML-escaped),
+    ``{{ name|js }}`` (escaped for a single-quoted JS string) or
+    ``{{ name|json }}`` (JSON text embedded as a JS literal). Each distinct
+    placeholder is escaped once per render and the segments are joined by a
+    single bytes %-format. Short values of the ``shared`` fields are
+    escaped once per process; the rest on every render.
+    """
+
+    __slots__ = ('segments', 'fields', '_slots', '_order', '_format')
+
+    def __init__(self, source, shared=()):
+        parts = _PLACEHOLDER.split(source)
+        # re.split yields [text, name, filter, text, name, filter, ..., text]
+        self.segments = tuple(p.encode('utf-8') for p in parts[0::3])
+        self.fields = tuple(
+            (name, escaper or 'html') for name, escaper in zip(parts[1::3], parts[2::3])
+        )
+        unique = list(dict.fromkeys(self.fields))
+        self._slots = tuple((name, escaper, name in shared) for name, escaper in unique)
+        self._order = tuple(unique.index(field) for field in self.fields)
+        self._format = b'%s'.join(seg.replace(b'%', b'%%') for seg in self.segments)
+
+    def render(self, values):
+        """Render to UTF-8 bytes from a mapping of raw field values"""
+        escaped = []
+        for name, escaper, shared in self._slots:
+            value = str(values[name])
+            if shared and len(value) <= MAX_SHARED_CHARS:
+                escaped.append(_escaped_bytes(value, escaper))
+            else:
+                escaped.append(ESCAPERS[escaper](value).encode('utf-8'))
+        return self._format % tuple([escaped[i] for i in self._order])
+
+
+_GAME_PAGE = """<!DOCTYPE html>
+<html lang="{{ lang }}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }} - Complete Indic Game</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Arial', sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            animation: gradient-shift 3s ease infinite;
+        }
+        @keyframes gradient-shift {
+            0%, 100% { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+            50% { background: linear-gradient(135deg, #764ba2 0%, #667eea 100%); }
+        }
+        .game-container {
+            max-width: 800px;
+            width: 90%;
+            background: rgba(255,255,255,0.1);
+            padding: 30px;
+            border-radius: 20px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
+            text-align: center;
+            animation: fadeInUp 1s ease-out;
+        }
+        @keyframes fadeInUp {
+            from {
+                opacity: 0;
+                transform: translateY(30px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+        .game-title {
+            font-size: 2.5em;
+            margin-bottom: 20px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
+            animation: glow 2s ease-in-out infinite alternate;
+        }
+        @keyframes glow {
+            from { text-shadow: 2px 2px 4px rgba(0,0,0,0.5), 0 0 20px rgba(255,255,255,0.3); }
+            to { text-shadow: 2px 2px 4px rgba(0,0,0,0.5), 0 0 30px rgba(255,255,255,0.6); }
+        }
+        .play-button {
+            background: linear-gradient(45deg, #ff6b6b, #4ecdc4);
+            border: none;
+            padding: 15px 30px;
+            border-radius: 25px;
+            color: white;
+            font-size: 1.2em;
+            font-weight: bold;
+            cursor: pointer;
+            transition: transform 0.3s ease;
+            margin: 20px 10px;
+            animation: pulse 2s infinite;
+        }
+        @keyframes pulse {
+            0% { transform: scale(1); }
+            50% { transform: scale(1.05); }
+            100% { transform: scale(1); }
+        }
+        .play-button:hover {
+            transform: scale(1.1);
+            animation: none;
+        }
+        .play-panel {
+            margin: 20px 0;
+        }
+        .quiz-option {
+            display: block;
+            width: 100%;
+            margin: 8px 0;
+            padding: 12px;
+            border: none;
+            border-radius: 10px;
+            background: rgba(255,255,255,0.2);
+            color: white;
+            font-size: 1em;
+            cursor: pointer;
+        }
+        .quiz-option.right { background: #2ecc71; }
+        .quiz-option.wrong { background: #e74c3c; }
+        .maze {
+            display: inline-grid;
+            gap: 2px;
+            margin: 15px 0;
+        }
+        .maze div {
+            height: 2em;
+            line-height: 2em;
+            border-radius: 4px;
+            background: rgba(255,255,255,0.15);
+        }
+        .maze .wall { background: rgba(0,0,0,0.45); }
+        .maze-move {
+            margin: 4px;
+            padding: 8px 14px;
+            border: none;
+            border-radius: 8px;
+            background: rgba(255,255,255,0.2);
+            font-size: 1.2em;
+            cursor: pointer;
+        }
+    </style>
+</head>
+<body>
+    <div class="game-container">
+        <h1 class="game-title">🎮 {{ title }}</h1>
+        <p style="font-size: 1.2em; margin-bottom: 20px; opacity: 0.9;">
+            {{ description }}
+        </p>
+        
+        <div style="margin: 30px 0;">
+            <div style="display: inline-block; margin: 10px; padding: 15px; background: rgba(255,255,255,0.2); border-radius: 10px;">
+                <strong>Genre:</strong> {{ genre_label }}
+            </div>
+            <div style="display: inline-block; margin: 10px; padding: 15px; background: rgba(255,255,255,0.2); border-radius: 10px;">
+                <strong>Theme:</strong> {{ theme }}
+            </div>
+            <div style="display: inline-block; margin: 10px; padding: 15px; background: rgba(255,255,255,0.2); border-radius: 10px;">
+                <strong>Language:</strong> {{ language_name }}
+            </div>
+        </div>
+
+        <button class="play-button" onclick="startGame()">🚀 {{ play_label }}</button>
+        
+        <div id="game-area" style="display: none; margin-top: 30px;">
+            <h2>Welcome to {{ title }}!</h2>
+            <p>This is a fully functional {{ genre }} game about {{ theme }}.</p>
+            <p>Game mechanics include: {{ mechanics }}</p>
+            <div id="quiz" class="play-panel"></div>
+            <div id="level" class="play-panel" style="display: none;"></div>
+            <!-- game-assets -->
+            <button class="play-button" onclick="location.reload()">🔄 Restart</button>
+        </div>
+    </div>
+
+    <script>
+        const PLAY = {{ play|json }};
+        const MOVES = {ArrowUp: [-1, 0], ArrowDown: [1, 0], ArrowLeft: [0, -1], ArrowRight: [0, 1]};
+        const ARROWS = {ArrowUp: '⬆️', ArrowDown: '⬇️', ArrowLeft: '⬅️', ArrowRight: '➡️'};
+        let score = 0;
+        let level = null;
+
+        function node(tag, text, className) {
+            const element = document.createElement(tag);
+            element.textContent = text;
+            if (className) element.className = className;
+            return element;
+        }
+
+        function startGame() {
+            document.getElementById('game-area').style.display = 'block';
+            score = 0;
+            showQuestion(0);
+        }
+
+        function showQuestion(index) {
+            const quiz = document.getElementById('quiz');
+            quiz.textContent = '';
+            if (index >= PLAY.quiz.length) {
+                quiz.appendChild(node('p', '🏆 Quiz score: ' + score + '/' + PLAY.quiz.length));
+                showLevel(0);
+                return;
+            }
+            const item = PLAY.quiz[index];
+            quiz.appendChild(node('p', (index + 1) + '/' + PLAY.quiz.length + ' · ' + item.question));
+            item.options.forEach(function (option, choice) {
+                const button = node('button', option, 'quiz-option');
+                button.onclick = function () {
+                    const right = choice === item.answer;
+                    if (right) score++;
+                    quiz.querySelectorAll('button').forEach(function (other) { other.disabled = true; });
+                    button.className += right ? ' right' : ' wrong';
+                    setTimeout(function () { showQuestion(index + 1); }, 700);
+                };
+                quiz.appendChild(button);
+            });
+        }
+
+        function showLevel(number) {
+            const area = document.getElementById('level');
+            area.style.display = 'block';
+            if (number >= PLAY.levels.length) {
+                level = null;
+                area.textContent = '';
+                area.appendChild(node('p', '🎉 All levels complete!'));
+                return;
+            }
+            const layout = PLAY.levels[number];
+            level = {number: number, layout: layout, at: layout.start.slice(), stars: layout.stars.map(String)};
+            drawLevel();
+        }
+
+        function drawLevel() {
+            const area = document.getElementById('level');
+            const layout = level.layout;
+            area.textContent = '';
+            area.appendChild(node('p', 'Level ' + (level.number + 1) + ' · ⭐ ' + level.stars.length + ' left, then 🏁'));
+            const maze = node('div', '', 'maze');
+            maze.style.gridTemplateColumns = 'repeat(' + layout.grid[0].length + ', 2em)';
+            layout.grid.forEach(function (row, r) {
+                row.split('').forEach(function (cell, c) {
+                    const here = String([r, c]);
+                    let text = '';
+                    if (here === String(level.at)) text = '🧭';
+                    else if (level.stars.indexOf(here) >= 0) text = '⭐';
+                    else if (here === String(layout.goal)) text = '🏁';
+                    maze.appendChild(node('div', text, cell === '#' ? 'wall' : ''));
+                });
+            });
+            area.appendChild(maze);
+            const pad = node('div', '');
+            Object.keys(ARROWS).forEach(function (key) {
+                const button = node('button', ARROWS[key], 'maze-move');
+                button.onclick = function () { step(MOVES[key]); };
+                pad.appendChild(button);
+            });
+            area.appendChild(pad);
+        }
+
+        function step(move) {
+            const grid = level.layout.grid;
+            const r = level.at[0] + move[0];
+            const c = level.at[1] + move[1];
+            if (r < 0 || c < 0 || r >= grid.length || c >= grid[r].length || grid[r][c] === '#') return;
+            level.at = [r, c];
+            level.stars = level.stars.filter(function (star) { return star !== String(level.at); });
+            if (!level.stars.length && String(level.at) === String(level.layout.goal)) showLevel(level.number + 1);
+            else drawLevel();
+        }
+
+        document.addEventListener('keydown', function (event) {
+            if (level && MOVES[event.key]) {
+                event.preventDefault();
+                step(MOVES[event.key]);
+            }
+        });
+    </script>
+</body>
+</html>"""
+
+# For budget phones: no repaint-per-frame properties, nothing that loops
+# forever, no backdrop blur, and no motion at all under prefers-reduced-motion
+_LITE_STYLES = """        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Arial', sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .game-container {
+            max-width: 800px;
+            width: 90%;
+            background: rgba(255,255,255,0.15);
+            padding: 30px;
+            border-radius: 20px;
+            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
+            text-align: center;
+            animation: fadeInUp 1s ease-out;
+        }
+        @keyframes fadeInUp {
+            from {
+                opacity: 0;
+                transform: translateY(30px);
+            }
+            to {
+                opacity: 1;
+                transform: translateY(0);
+            }
+        }
+        .game-title {
+            font-size: 2.5em;
+            margin-bottom: 20px;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.5), 0 0 20px rgba(255,255,255,0.3);
+        }
+        .play-button {
+            background: linear-gradient(45deg, #ff6b6b, #4ecdc4);
+            border: none;
+            padding: 15px 30px;
+            border-radius: 25px;
+            color: white;
+            font-size: 1.2em;
+            font-weight: bold;
+            cursor: pointer;
+            transition: transform 0.3s ease;
+            margin: 20px 10px;
+            animation: pulse 2s ease-in-out 3;
+        }
+        @keyframes pulse {
+            50% { transform: scale(1.05); }
+        }
+        .play-button:hover {
+            transform: scale(1.1);
+            animation: none;
+        }
+        .play-panel {
+            margin: 20px 0;
+        }
+        .quiz-option {
+            display: block;
+            width: 100%;
+            margin: 8px 0;
+            padding: 12px;
+            border: none;
+            border-radius: 10px;
+            background: rgba(255,255,255,0.2);
+            color: white;
+            font-size: 1em;
+            cursor: pointer;
+        }
+        .quiz-option.right { background: #2ecc71; }
+        .quiz-option.wrong { background: #e74c3c; }
+        .maze {
+            display: inline-grid;
+            gap: 2px;
+            margin: 15px 0;
+        }
+        .maze div {
+            height: 2em;
+            line-height: 2em;
+            border-radius: 4px;
+            background: rgba(255,255,255,0.15);
+        }
+        .maze .wall { background: rgba(0,0,0,0.45); }
+        .maze-move {
+            margin: 4px;
+            padding: 8px 14px;
+            border: none;
+            border-radius: 8px;
+            background: rgba(255,255,255,0.2);
+            font-size: 1.2em;
+            cursor: pointer;
+        }
+        @media (prefers-reduced-motion: reduce) {
+            *, *::before, *::after {
+                animation: none !important;
+                transition: none !important;
+            }
+        }
+"""
+
+
+def _with_styles(page, styles):
+    head, _, rest = page.partition('    <style>\n')
+    _, _, rest = rest.partition('    </style>\n')
+    return f"{head}    <style>\n{styles}    </style>\n{rest}"
+
+
+RENDER_PROFILES = ('full', 'lite')
+DEFAULT_PROFILE = 'full'
+GAME_TEMPLATES = {
+    # The original look: looping background, glow and pulse over a blurred panel
+    'full': CompiledTemplate(minify_html(_GAME_PAGE), SHARED_FIELDS),
+    'lite': CompiledTemplate(minify_html(_with_styles(_GAME_PAGE, _LITE_STYLES)), SHARED_FIELDS),
+}
+GAME_TEMPLATE = GAME_TEMPLATES[DEFAULT_PROFILE]
+
+
+def game_template(profile=DEFAULT_PROFILE):
+    """The compiled game page for a render profile (``'full'`` or ``'lite'``)"""
+    try:
+        return GAME_TEMPLATES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown render profile: {profile!r}") from None
+
+
+class ArtifactCache(MemoCache):
+    """Thread-safe bounded LRU of rendered artifacts, rendering each key once at a time
+
+    Artifacts are pure functions of their key, so they never expire.
+    """
+
+    def __init__(self, maxsize=ARTIFACT_CACHE_SIZE, name=None):
+        super().__init__(maxsize, name=name)
+
+    def get_or_render(self, key, render):
+        return self.get_or_compute(key, render)
+
+
+artifact_cache = ArtifactCache(name='game_pages')
+
+
+_KEY_FIELDS = ('title', 'description', 'genre', 'theme', 'language', 'mechanics',
+               'genre_label', 'language_name', 'play_label')
+
+
+def game_page_fields(game_data, language, labels=None):
+    """The game's own values its page shows; the page's play set follows from them
+
+    ``labels`` are the game's ``game_labels`` in ``language`` when the
+    caller has them already.
+    """
+    labels = labels or game_labels(game_data['genre'], game_data['theme'], language)
+    return {
+        'title': game_data['title'],
+        'description': game_data['description'],
+        'genre': game_data['genre'],
+        'theme': game_data['theme'],
+        'language': language,
+        'lang': LANGUAGES[language]['tag'],
+        'mechanics': ', '.join(game_data.get('mechanics', [])),
+        'genre_label': labels['genre'],
+        'language_name': labels['language'],
+        'play_label': labels['play'],
+    }
+
+
+def game_template_values(game_data, language):
+    """The raw values the game page is rendered from"""
+    return {**game_page_fields(game_data, language), 'play': play_json(game_data, language)}
+
+
+def _values_key(values):
+    payload = '\x1f'.join(values[name] for name in _KEY_FIELDS).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def game_cache_key(game_data, language):
+    """Hash of everything that affects the rendered page
+
+    Fields the page doesn't show (like ``generated_at``) are left out so
+    reloading the same game keeps hitting the cache.
+    """
+    return _values_key(game_page_fields(game_data, language))
+
+
+def render_game_html(game_data, language, profile=DEFAULT_PROFILE, labels=None):
+    """Return the complete HTML game file as UTF-8 bytes, cached per game and profile"""
+    template = game_template(profile)
+    fields = game_page_fields(game_data, language, labels)
+    key = _values_key(fields)
+    return artifact_cache.get_or_render(
+        key if profile == DEFAULT_PROFILE else f"{profile}:{key}",
+        lambda: template.render({**fields, 'play': play_json(game_data, language)})
+    )
+
+
+def generate_game_html(game_data, language, profile=DEFAULT_PROFILE):
+    """Generate a complete HTML game file, with its seeded quiz and levels"""
+    return render_game_html(game_data, language, profile).decode('utf-8')
@@ -0,0 +1,310 @@
+"""Versioned, machine-readable game specs for API clients and the batch pipeline
+
+A game spec is a game's fields plus ``spec_version``, in three encodings:
+
+- canonical JSON (``dumps_json``): sorted keys, no insignificant whitespace,
+  UTF-8, so equal games always serialize to equal bytes
+- JSONL (``iter_jsonl``): one canonical JSON spec per line, for listings too
+  large to hold at once
+- binary (``iter_binary``): ``IGS`` and a version byte, then one
+  length-prefixed record per game with its fields in schema order and no
+  keys. Within a stream, a genre, theme, language, mechanic or feature is
+  sent once and referenced by number after that, so long streams of
+  similar games pack tightly.
+
+Readers accept any spec version up to ``SPEC_VERSION`` and reject newer
+ones, so a field can be added later without breaking old data. Decoding
+validates every field and raises ``SpecError`` on anything malformed.
+
+    body = b''.join(iter_binary(games))
+    games = list(iter_load_binary(body))
+"""
+
+import json
+
+from indic_games.record import pack_timestamp, unpack_timestamp
+
+SPEC_VERSION = 1
+BINARY_MAGIC = b'IGS'
+MEDIA_TYPES = {
+    'json': 'application/json; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+    'binary': 'application/vnd.indic-game-spec',
+}
+FORMATS = tuple(MEDIA_TYPES)
+
+_TEXT_FIELDS = ('title', 'genre', 'theme', 'description', 'language')
+_LIST_FIELDS = ('mechanics', 'features')
+_REQUIRED = ('title', 'genre', 'theme', 'language')
+# Values that repeat from game to game are sent once per binary stream
+_SHARED_FIELDS = frozenset(('genre', 'theme', 'language'))
+# Beyond this many shared strings a stream sends new ones literally
+MAX_SHARED_STRINGS = 4096
+
+# Binary string tags; a tag of _REF or more refers to shared string ``tag - _REF``
+_NONE, _LITERAL, _SHARE, _REF = 0, 1, 2, 3
+
+_json_encoder = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+class SpecError(ValueError):
+    """A spec that is malformed or from a newer spec version"""
+
+
+def game_spec(game):
+    """The spec dict for a game dict or ``GameRecord``"""
+    spec = {
+        'spec_version': SPEC_VERSION,
+        'title': game['title'],
+        'genre': game['genre'],
+        'theme': game['theme'],
+        'description': game.get('description') or '',
+        'language': game['language'],
+        'mechanics': list(game.get('mechanics', ())),
+        'features': list(game.get('features', ())),
+    }
+    if game.get('id') is not None:
+        spec['id'] = game['id']
+    if game.get('generated_at'):
+        spec['generated_at'] = game['generated_at']
+    return spec
+
+
+def from_spec(spec):
+    """The game dict a decoded spec describes, after checking every field"""
+    if not isinstance(spec, dict):
+        raise SpecError("A game spec must be an object")
+    version = spec.get('spec_version')
+    if not isinstance(version, int) or not 1 <= version <= SPEC_VERSION:
+        raise SpecError(f"Unsupported spec_version: {version!r}")
+    game = {}
+    for name in _TEXT_FIELDS:
+        value = spec.get(name, '' if name == 'description' else None)
+        if not isinstance(value, str) or (name in _REQUIRED and not value):
+            raise SpecError(f"{name} must be a non-empty string" if name in _REQUIRED
+                            else f"{name} must be a string")
+        game[name] = value
+    for name in _LIST_FIELDS:
+        values = spec.get(name, [])
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise SpecError(f"{name} must be a list of strings")
+        game[name] = values
+    for name in ('generated_at', 'id'):
+        if name in spec:
+            if not isinstance(spec[name], str):
+                raise SpecError(f"{name} must be a string")
+            game[name] = spec[name]
+    return game
+
+
+def dumps_json(game):
+    """Canonical JSON bytes of a game's spec"""
+    return _json_encoder.encode(game_spec(game)).encode('utf-8')
+
+
+def loads_json(data):
+    """The game from ``dumps_json`` output (bytes or str)"""
+    try:
+        spec = json.loads(data)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise SpecError(f"Invalid JSON: {e}") from None
+    return from_spec(spec)
+
+
+def iter_jsonl(games):
+    """Yield one canonical JSON line (bytes) per game"""
+    for game in games:
+        yield _json_encoder.encode(game_spec(game)).encode('utf-8') + b'\n'
+
+
+def iter_load_jsonl(lines):
+    """Yield the game of every non-blank JSONL line (bytes or str)"""
+    for line in lines:
+        if line.strip():
+            yield loads_json(line)
+
+
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Writer:
+    """Encodes records of one binary stream, remembering its shared strings"""
+
+    def __init__(self):
+        self.shared = {}
+
+    def _put_text(self, out, value, share):
+        if value is None:
+            out.append(_NONE)
+            return
+        index = self.shared.get(value)
+        if index is not None:
+            _put_varint(out, index + _REF)
+            return
+        data = value.encode('utf-8')
+        if share and len(self.shared) < MAX_SHARED_STRINGS:
+            self.shared[value] = len(self.shared)
+            out.append(_SHARE)
+        else:
+            out.append(_LITERAL)
+        _put_varint(out, len(data))
+        out += data
+
+    def record(self, game):
+        body = bytearray()
+        put_text = self._put_text
+        put_text(body, game.get('id'), False)
+        for name in _TEXT_FIELDS:
+            put_text(body, game.get(name) or ('' if name == 'description' else None), name in _SHARED_FIELDS)
+        for name in _LIST_FIELDS:
+            values = game.get(name, ())
+            _put_varint(body, len(values))
+            for value in values:
+                put_text(body, value, True)
+        generated_at = game.get('generated_at')
+        _put_varint(body, pack_timestamp(generated_at) if generated_at else 0)
+        out = bytearray()
+        _put_varint(out, len(body))
+        return bytes(out + body)
+
+
+def iter_binary(games):
+    """Yield a binary spec stream: the header, then one record per game"""
+    yield BINARY_MAGIC + bytes((SPEC_VERSION,))
+    writer = _Writer()
+    for game in games:
+        yield writer.record(game)
+
+
+def dumps_binary(game):
+    """One game as a complete binary stream"""
+    return b''.join(iter_binary([game]))
+
+
+def _varint(data, position):
+    """``(value, next position)`` of the varint at ``position``"""
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+class _Reader:
+    """Decodes the records of one binary stream"""
+
+    def __init__(self, version):
+        self.version = version
+        self.shared = []
+
+    def _text(self, data, position):
+        tag = data[position]
+        if tag >= 0x80:
+            tag, position = _varint(data, position)
+        else:
+            position += 1
+        if tag >= _REF:
+            return self.shared[tag - _REF], position
+        if tag == _NONE:
+            return None, position
+        size, position = _varint(data, position)
+        end = position + size
+        if end > len(data):
+            raise IndexError("string runs past the record")
+        value = str(data[position:end], 'utf-8')
+        if tag == _SHARE:
+            self.shared.append(value)
+        return value, end
+
+    def record(self, data):
+        """The game in one record's bytes"""
+        text = self._text
+        game = {}
+        try:
+            game_id, position = text(data, 0)
+            for name in _TEXT_FIELDS:
+                game[name], position = text(data, position)
+            for name in _LIST_FIELDS:
+                count, position = _varint(data, position)
+                values = game[name] = []
+                for _ in range(count):
+                    value, position = text(data, position)
+                    values.append(value)
+            generated_at, position = _varint(data, position)
+        except (IndexError, UnicodeDecodeError) as e:
+            raise SpecError(f"Corrupt binary record: {e}") from None
+        if position != len(data):
+            raise SpecError("Corrupt binary record: trailing bytes")
+        # Strings decode as strings; only missing values need checking
+        for name in _REQUIRED:
+            if not game[name]:
+                raise SpecError(f"{name} must be a non-empty string")
+        if game['description'] is None or None in game['mechanics'] or None in game['features']:
+            raise SpecError("Corrupt binary record: missing value")
+        if generated_at:
+            game['generated_at'] = unpack_timestamp(generated_at)
+        if game_id is not None:
+            game['id'] = game_id
+        return game
+
+
+def _iter_records(data, position=0):
+    # Length-prefixed records in ``data``; the last one may be incomplete
+    while position < len(data):
+        try:
+            size, start = _varint(data, position)
+        except IndexError:
+            return
+        if start + size > len(data):
+            return
+        yield data[start:start + size], start + size
+        position = start + size
+
+
+def iter_load_binary(source, chunk_size=64 * 1024):
+    """Yield the games of a binary stream from bytes or a binary file object"""
+    header_size = len(BINARY_MAGIC) + 1
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data, stream = bytes(source), None
+    else:
+        data, stream = source.read(max(chunk_size, header_size)), source
+    if len(data) < header_size or data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise SpecError("Not a game spec stream")
+    if not 1 <= data[len(BINARY_MAGIC)] <= SPEC_VERSION:
+        raise SpecError(f"Unsupported spec_version: {data[len(BINARY_MAGIC)]}")
+    reader = _Reader(data[len(BINARY_MAGIC)])
+    data = data[header_size:]
+    while True:
+        position = 0
+        for record, position in _iter_records(data):
+            yield reader.record(record)
+        data = data[position:]
+        more = stream.read(chunk_size) if stream is not None else b''
+        if not more:
+            break
+        data += more
+    if data:
+        raise SpecError("Truncated binary stream")
+
+
+def loads_binary(data):
+    """The single game of a ``dumps_binary`` stream"""
+    games = list(iter_load_binary(data))
+    if len(games) != 1:
+        raise SpecError(f"Expected one game, found {len(games)}")
+    return games[0]
+
+
+def js_declaration(game):
+    """The spec as a JavaScript ``const``, quoting any title safely"""
+    name = ''.join(ch for ch in game['title'] if ('_' + ch).isidentifier())
+    if not name[:1].isidentifier():
+        name = '_' + name
+    return f"const {name}Game = {json.dumps(game_spec(game), ensure_ascii=False, indent=2)};"
@@ -0,0 +1,401 @@
+"""Incremental static-site build of the prebuilt catalog, for serving from a CDN
+
+Renders every prebuilt game in every language with the game page template,
+plus an ``index.html`` linking them all, into a directory laid out like the
+zip export:
+
+    site/index.html
+    site/<language>/<Title>_Complete_Game.html
+    site/<language>/<Title>_Complete_Game.html.gz  (and .br) pre-compressed copies
+    site/assets/<sha256 prefix>.<ext>      assets too big to inline
+    site/manifest.json                     what was built, from which inputs
+
+Each page's inputs are hashed into a build key: the game fields the page
+shows, the compiled template of the render profile, the language's translation table and the
+size and mtime of its asset files. ``manifest.json`` records the key of
+every page, so a rebuild renders only the pages whose key changed (or whose
+file went missing), deletes pages and assets nothing refers to any more, and
+leaves everything else untouched. ``--language`` rebuilds just those
+languages and keeps the rest of the site. Larger rebuilds are spread over a process
+pool; small ones stay in-process, so editing one game rebuilds in
+milliseconds.
+
+Pages and the index get ``.gz`` siblings (and ``.br`` with the optional
+``brotli`` package) for servers that pick a pre-compressed file by
+``Accept-Encoding``, like nginx ``gzip_static``/``brotli_static``. ``--serve``
+previews the site with that same negotiation.
+
+    python -m indic_games.static_site site/ --workers 8
+    python -m indic_games.static_site site/ --serve 8080
+    python streamlit_app.py build-site site/
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote
+
+from indic_games.assets import AssetBundle, AssetLibrary, default_library, iter_game_html
+from indic_games.catalog import LANGUAGES, PREBUILT_GAMES
+from indic_games.compression import ENCODINGS, FILE_SUFFIXES, compress, negotiate
+from indic_games.export import ASSETS_PATH, entry_path, render_entry
+from indic_games.fonts import SUBSET_FORMAT
+from indic_games.minify import minify_html
+from indic_games.procedural import ENGINE_DIGEST, prepared
+from indic_games.render import DEFAULT_PROFILE, RENDER_PROFILES, escape_html, game_page_fields, game_template
+from indic_games.translations import get_catalog
+
+DEFAULT_SITE_DIR = 'site'
+MANIFEST_NAME = 'manifest.json'
+INDEX_NAME = 'index.html'
+# Bump when the build itself changes in a way the inputs don't capture
+BUILD_VERSION = 2
+# A page renders in well under a millisecond, so below this many stale pages
+# starting a process pool costs more than it saves
+PARALLEL_THRESHOLD = 256
+
+
+def _digest(*parts):
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def template_digest(profile=DEFAULT_PROFILE):
+    """Changes whenever the game page template for ``profile`` does"""
+    template = game_template(profile)
+    segments = hashlib.blake2b(b'\0'.join(template.segments), digest_size=16).hexdigest()
+    return _digest(segments, template.fields)
+
+
+def translation_digests(languages):
+    """Per language, a hash of its flat translation table"""
+    catalog = get_catalog()
+    return {language: _digest(dict(catalog.table(language))) for language in languages}
+
+
+def _asset_stamps(paths, library, seen):
+    # Many pages share each asset file; ``seen`` stats each one once per build
+    stamps = []
+    for path in paths:
+        stamp = seen.get(path)
+        if stamp is None:
+            stat = os.stat(path)
+            stamp = seen[path] = (path[len(library.root):], stat.st_size, stat.st_mtime_ns)
+        stamps.append(stamp)
+    return stamps
+
+
+def entry_key(game, language, template, translations, library=default_library, seen=None):
+    """Build key of one page: changes when anything the page is built from does"""
+    return _digest(BUILD_VERSION, ENCODINGS, SUBSET_FORMAT, ENGINE_DIGEST, template, translations,
+                   game_page_fields(game, language),
+                   _asset_stamps(library.files_for(game, language), library, {} if seen is None else seen))
+
+
+def _write_variants(path, data):
+    """Write the pre-compressed siblings of the file at ``path``; returns their sizes"""
+    sizes = {}
+    for encoding, suffix in FILE_SUFFIXES.items():
+        body = compress(data, encoding) if encoding in ENCODINGS else None
+        # A sibling that isn't smaller is never worth sending
+        if body is not None and len(body) < len(data):
+            sizes[encoding] = _write_atomic(path + suffix, [body])[0]
+        else:
+            _remove(path + suffix)
+    return sizes
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_atomic(path, chunks):
+    """Write byte chunks to ``path`` via a temporary file; returns ``(bytes, sha256)``"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+    os.replace(tmp_path, path)
+    return size, digest.hexdigest()
+
+
+def build_pages(site_dir, entries, library_root=None, profile=DEFAULT_PROFILE):
+    """Render ``(game, language, key)`` entries into ``site_dir``; returns their manifest records
+
+    Runs in pool workers too, so the library is passed by its root.
+    """
+    library = default_library if library_root is None else AssetLibrary(library_root)
+    records = []
+    with AssetBundle() as bundle:
+        for game, language, key in prepared(entries, lambda entry: entry[:2]):
+            path = entry_path(game, language)
+            html_bytes = render_entry(game, language, profile)
+            asset_paths = library.files_for_page(game, language, html_bytes)
+            # Pages sit one level down, next to the shared assets/ folder
+            chunks = (iter_game_html(html_bytes, asset_paths, bundle, prefix='../' + ASSETS_PATH)
+                      if asset_paths else [html_bytes])
+            # Pages referencing external assets are small, so compress them whole
+            data = b''.join(chunks)
+            size, sha256 = _write_atomic(os.path.join(site_dir, path), [data])
+            encoded = _write_variants(os.path.join(site_dir, path), data)
+            external = {asset.file_name for asset in map(bundle.add, asset_paths) if not bundle.is_inline(asset)}
+            records.append({
+                'path': path,
+                'key': key,
+                'bytes': size,
+                'sha256': sha256,
+                'encoded_bytes': encoded,
+                'assets': sorted(external),
+            })
+        bundle.write_external(os.path.join(site_dir, ASSETS_PATH))
+    return records
+
+
+INDEX_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Indic Games Catalog</title>
+    <style>
+        body { font-family: 'Arial', sans-serif; margin: 0; padding: 30px;
+               background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; }
+        h1 { text-align: center; text-shadow: 2px 2px 4px rgba(0,0,0,0.5); }
+        .games { display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 20px; }
+        .game { background: rgba(255,255,255,0.1); border-radius: 15px; padding: 20px; }
+        .game h2 { margin-top: 0; }
+        .tag { display: inline-block; padding: 4px 10px; margin: 0 6px 10px 0;
+               border-radius: 10px; background: rgba(255,255,255,0.2); font-size: 0.85em; }
+        .languages a { display: inline-block; margin: 3px; padding: 4px 8px; border-radius: 8px;
+                       background: rgba(255,255,255,0.15); color: white; text-decoration: none; }
+        .languages a:hover { background: rgba(255,255,255,0.35); }
+    </style>
+</head>
+<body>
+    <h1>🎮 Indic Games Catalog</h1>
+    <div class="games">
+"""
+INDEX_TAIL = """    </div>
+</body>
+</html>
+"""
+
+
+def index_html(games, languages, pages=None):
+    """The catalog page: one card per game with a link per language
+
+    With ``pages``, only the paths in it are linked.
+    """
+    cards = []
+    for game in games:
+        links = ''.join(
+            f'<a href="{quote(entry_path(game, code))}" lang="{code}">'
+            f'{escape_html(LANGUAGES[code]["native"])}</a>'
+            for code in languages if pages is None or entry_path(game, code) in pages
+        )
+        cards.append(
+            f'        <div class="game">\n'
+            f'            <h2>{escape_html(game["title"])}</h2>\n'
+            f'            <span class="tag">{escape_html(game["genre"])}</span>'
+            f'<span class="tag">{escape_html(game["theme"])}</span>\n'
+            f'            <p>{escape_html(game["description"])}</p>\n'
+            f'            <div class="languages">{links}</div>\n'
+            f'        </div>\n'
+        )
+    return minify_html(INDEX_HEAD + ''.join(cards) + INDEX_TAIL).encode('utf-8')
+
+
+def _index_key(games, languages, pages):
+    return _digest(BUILD_VERSION, ENCODINGS, INDEX_HEAD, INDEX_TAIL,
+                   [(game['title'], game['genre'], game['theme'], game['description']) for game in games],
+                   [(code, LANGUAGES[code]['native']) for code in languages], sorted(pages))
+
+
+def load_manifest(site_dir):
+    """The previous build's manifest, or an empty one if missing or from another build version"""
+    try:
+        with open(os.path.join(site_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'entries': []}
+    return manifest if manifest.get('build_version') == BUILD_VERSION else {'entries': []}
+
+
+def _is_current(site_dir, record, key):
+    if record is None or record['key'] != key:
+        return False
+    try:
+        return os.path.getsize(os.path.join(site_dir, record['path'])) == record['bytes']
+    except OSError:
+        return False
+
+
+def _chunks(items, count):
+    size = -(-len(items) // count)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _path_language(path):
+    """``'hindi/Ramayana_Quest_Complete_Game.html'`` -> ``'hindi'``"""
+    return path.partition('/')[0]
+
+
+def build_site(site_dir=DEFAULT_SITE_DIR, games=PREBUILT_GAMES, languages=None, workers=1,
+               force=False, library=default_library, profile=DEFAULT_PROFILE):
+    """Bring ``site_dir`` up to date; returns build statistics
+
+    A build of some ``languages`` only touches their pages: the pages of
+    other languages already in the site are kept, and stay in its index
+    and manifest.
+    """
+    started = time.perf_counter()
+    languages = list(languages or LANGUAGES)
+    manifest = {'entries': []} if force else load_manifest(site_dir)
+    previous = {record['path']: record for record in manifest['entries']}
+    kept = {path: record for path, record in previous.items()
+            if _path_language(path) not in languages}
+
+    template = template_digest(profile)
+    translations = translation_digests(languages)
+    records, stale, seen = {}, [], {}
+    for game in games:
+        for language in languages:
+            path = entry_path(game, language)
+            key = entry_key(game, language, template, translations[language], library, seen)
+            record = previous.get(path)
+            if _is_current(site_dir, record, key):
+                records[path] = record
+            else:
+                stale.append((game, language, key))
+
+    if len(stale) >= PARALLEL_THRESHOLD and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(build_pages, site_dir, chunk, library.root, profile)
+                       for chunk in _chunks(stale, workers * 4)]
+            built = [record for future in futures for record in future.result()]
+    else:
+        built = build_pages(site_dir, stale, library.root, profile)
+    records.update((record['path'], record) for record in built)
+    records.update(kept)
+
+    # Drop built languages' pages no longer in the catalog, then assets no page refers to
+    removed = [path for path in previous if path not in records]
+    for path in removed:
+        for suffix in ('', *FILE_SUFFIXES.values()):
+            _remove(os.path.join(site_dir, path + suffix))
+    referenced = {name for record in records.values() for name in record['assets']}
+    assets_dir = os.path.join(site_dir, ASSETS_PATH)
+    removed_assets = [name for name in (os.listdir(assets_dir) if os.path.isdir(assets_dir) else ())
+                      if name not in referenced]
+    for name in removed_assets:
+        os.remove(os.path.join(assets_dir, name))
+
+    site_languages = {_path_language(path) for path in records}
+    site_languages = [code for code in LANGUAGES if code in site_languages]
+    index_key = _index_key(games, site_languages, records)
+    index_path = os.path.join(site_dir, INDEX_NAME)
+    index_built = manifest.get('index_key') != index_key or not os.path.exists(index_path)
+    if index_built:
+        index = index_html(games, site_languages, records)
+        _write_atomic(index_path, [index])
+        _write_variants(index_path, index)
+
+    paths = [entry_path(game, language) for game in games for language in site_languages]
+    ordered = [records[path] for path in paths if path in records]
+    # Kept pages of games that left the catalog go when their language is rebuilt
+    listed = set(paths)
+    ordered += [record for path, record in sorted(records.items()) if path not in listed]
+    if built or removed or index_built or removed_assets:
+        _write_atomic(os.path.join(site_dir, MANIFEST_NAME), [json.dumps({
+            'build_version': BUILD_VERSION,
+            'built_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'profile': profile,
+            'template': template,
+            'index_key': index_key,
+            'count': len(ordered),
+            'entries': ordered,
+        }, ensure_ascii=False, indent=2).encode('utf-8')])
+    return {
+        'pages': len(ordered),
+        'rendered': len(built),
+        'unchanged': len(ordered) - len(built),
+        'removed': len(removed),
+        'removed_assets': len(removed_assets),
+        'index_rendered': index_built,
+        'ms': round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+class _SiteHandler(SimpleHTTPRequestHandler):
+    """Static files, sending a pre-compressed sibling when the client accepts it"""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.partition('?')[0].endswith('/'):
+            path = os.path.join(path, INDEX_NAME)
+        available = [encoding for encoding in ENCODINGS if os.path.isfile(path + FILE_SUFFIXES[encoding])]
+        encoding = negotiate(self.headers.get('Accept-Encoding'), available)
+        if encoding == 'identity':
+            return super().send_head()
+        f = open(path + FILE_SUFFIXES[encoding], 'rb')
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        return f
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_site(site_dir=DEFAULT_SITE_DIR, port=8080, host='127.0.0.1'):
+    """Serve a built site until interrupted"""
+    with ThreadingHTTPServer((host, port), functools.partial(_SiteHandler, directory=site_dir)) as httpd:
+        httpd.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the prebuilt catalog as a static site, incrementally")
+    parser.add_argument('output', nargs='?', default=DEFAULT_SITE_DIR, help="site directory")
+    parser.add_argument('--language', action='append', dest='languages', help="repeatable")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--force', action='store_true', help="ignore the manifest and rebuild everything")
+    parser.add_argument('--profile', choices=RENDER_PROFILES, default=DEFAULT_PROFILE,
+                        help="lite: lighter pages for low-end phones")
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help="then serve the site on localhost, honouring Accept-Encoding")
+    args = parser.parse_args(argv)
+
+    unknown = sorted(set(args.languages or ()) - set(LANGUAGES))
+    if unknown:
+        parser.error(f"unknown languages: {', '.join(unknown)}")
+    stats = build_site(args.output, languages=args.languages, workers=args.workers,
+                       force=args.force, profile=args.profile)
+    print(f"Rendered {stats['rendered']} of {stats['pages']} pages ({stats['unchanged']} unchanged, "
+          f"{stats['removed']} removed) into {args.output} in {stats['ms']} ms", file=sys.stderr)
+    if args.serve:
+        print(f"Serving {args.output} on http://127.0.0.1:{args.serve}/", file=sys.stderr)
+        try:
+            serve_site(args.output, args.serve)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""Persistent game repository on SQLite
+
+Generated games are stored in a SQLite database in WAL mode, so readers
+never block the writer, behind a small pool of connections shared by every
+thread. Each game gets a stable, time-ordered ID when it is first saved.
+Listings are indexed by genre, theme, language and ``generated_at`` and
+paginated with a keyset cursor, so deep pages cost the same as the first.
+"""
+
+import json
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_DB_PATH = os.environ.get('INDIC_GAMES_DB', 'indic_games.db')
+POOL_SIZE = 8
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    genre TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    language TEXT NOT NULL,
+    description TEXT NOT NULL,
+    mechanics TEXT NOT NULL,
+    features TEXT NOT NULL,
+    generated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS games_generated_at ON games (generated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS games_genre ON games (genre, generated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS games_theme ON games (theme, generated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS games_language ON games (language, generated_at DESC, id DESC);
+"""
+
+COLUMNS = ('id', 'title', 'genre', 'theme', 'language', 'description',
+           'mechanics', 'features', 'generated_at')
+FILTERS = ('genre', 'theme', 'language')
+_INSERT = f"INSERT OR REPLACE INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+
+def new_game_id():
+    """32 hex chars: a millisecond timestamp followed by 80 random bits
+
+    IDs sort by creation time, which keeps primary-key inserts appending
+    at the end of the B-tree.
+    """
+    return f"{int(time.time() * 1000):012x}{secrets.token_hex(10)}"
+
+
+def _row(game):
+    return (
+        game['id'], game['title'], game['genre'], game['theme'], game['language'],
+        game['description'],
+        json.dumps(list(game.get('mechanics', [])), ensure_ascii=False),
+        json.dumps(list(game.get('features', [])), ensure_ascii=False),
+        game['generated_at'],
+    )
+
+
+def _game(row):
+    game = dict(zip(COLUMNS, row))
+    game['mechanics'] = json.loads(game['mechanics'])
+    game['features'] = json.loads(game['features'])
+    return game
+
+
+class GameStore:
+    """Thread-safe game repository backed by a pooled SQLite database"""
+
+    def __init__(self, path=DEFAULT_DB_PATH, pool_size=POOL_SIZE):
+        self.path = path
+        self._pool = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False,
+                               isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        conn = self._pool.get()
+        if conn is None:
+            # Closed: pass the marker on to the next waiting thread
+            self._pool.put(None)
+            raise sqlite3.ProgrammingError("Cannot operate on a closed game store")
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                if self._closed:
+                    conn.close()
+                else:
+                    self._pool.put(conn)
+
+    def close(self):
+        """Close every idle connection; ones in use close when they are returned"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while True:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not None:
+                    conn.close()
+            # Wakes, and fails, anything waiting for a connection
+            self._pool.put(None)
+
+    def save(self, game):
+        """Store a game and return it with its ``id`` (assigned if missing)"""
+        game = dict(game, id=game.get('id') or new_game_id())
+        with self._connection() as conn:
+            conn.execute(_INSERT, _row(game))
+        return game
+
+    def save_many(self, games):
+        """Store games in one transaction; returns the number written"""
+        rows = [_row(dict(game, id=game.get('id') or new_game_id())) for game in games]
+        with self._connection() as conn:
+            conn.execute('BEGIN')
+            try:
+                conn.executemany(_INSERT, rows)
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        return len(rows)
+
+    def get(self, game_id):
+        with self._connection() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM games WHERE id = ?", (game_id,)
+            ).fetchone()
+        return _game(row) if row else None
+
+    @staticmethod
+    def _where(filters):
+        clauses, params = [], []
+        for name in FILTERS:
+            value = filters.get(name)
+            if value:
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        return clauses, params
+
+    def list(self, limit=DEFAULT_PAGE_SIZE, cursor=None, **filters):
+        """Newest games first: ``(games, next_cursor)``
+
+        ``next_cursor`` is ``None`` on the last page; pass it back to get the
+        following page. Filters are ``genre``, ``theme`` and ``language``.
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        clauses, params = self._where(filters)
+        if cursor:
+            generated_at, _, last_id = cursor.partition('|')
+            clauses.append("(generated_at, id) < (?, ?)")
+            params.extend((generated_at, last_id))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self._connection() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM games {where} "
+                "ORDER BY generated_at DESC, id DESC LIMIT ?",
+                (*params, limit + 1)
+            ).fetchall()
+        games = [_game(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = games[-1]
+            next_cursor = f"{last['generated_at']}|{last['id']}"
+        return games, next_cursor
+
+    def count(self, **filters):
+        clauses, params = self._where(filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        with self._connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM games {where}", params).fetchone()[0]
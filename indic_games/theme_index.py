@@ -0,0 +1,202 @@
+"""Precomputed theme/genre catalog index
+
+Themes are ``"Category - Name"`` strings. The index parses them once and
+keeps:
+
+* category facets (entries are numbered in category order, so a facet is a
+  contiguous id range),
+* a prefix trie over every word for autocomplete,
+* a trigram index over the word vocabulary for typo-tolerant search.
+
+Queries touch only the trie nodes and posting lists they need, so they stay
+well under a millisecond with tens of thousands of themes.
+"""
+
+import heapq
+import re
+from bisect import bisect_left
+from collections import Counter
+
+_WORD = re.compile(r'\w+')
+_IDS = ''  # trie node key holding the ids below that node; never a character
+
+
+def normalize(text):
+    return _WORD.findall(text.lower())
+
+
+def split_theme(theme):
+    """``'Mythology - Ramayana'`` -> ``('Mythology', 'Ramayana')``"""
+    category, sep, name = theme.partition(' - ')
+    return (category.strip(), name.strip()) if sep else ('', theme.strip())
+
+
+def _trigrams(word):
+    padded = f'${word}$'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance, or ``limit + 1`` once it exceeds ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cost = 0 if ca == cb else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class CatalogIndex:
+    """Faceted, prefix and fuzzy lookup over themes and genres"""
+
+    def __init__(self, themes, genres=()):
+        parsed = sorted(
+            {(split_theme(t)[0].lower(), split_theme(t)[1].lower(), t) for t in themes}
+        )
+        self.themes = tuple(theme for _, _, theme in parsed)
+        self._ids = {theme.lower(): i for i, theme in enumerate(self.themes)}
+
+        # Category facets as [start, stop) id ranges
+        self._facets = {}
+        self._category_labels = {}
+        for i, (category, _, theme) in enumerate(parsed):
+            start, _ = self._facets.get(category, (i, i))
+            self._facets[category] = (start, i + 1)
+            self._category_labels.setdefault(category, split_theme(theme)[0])
+
+        self.genres = tuple(genres)
+        self._genre_labels = {genre.lower(): genre for genre in self.genres}
+
+        # Word -> ids, prefix trie and trigram postings
+        word_ids = {}
+        for i, theme in enumerate(self.themes):
+            for word in set(normalize(theme)):
+                word_ids.setdefault(word, []).append(i)
+        self._word_ids = {word: tuple(ids) for word, ids in word_ids.items()}
+
+        root = {}
+        for word, ids in self._word_ids.items():
+            node = root
+            for ch in word:
+                node = node.setdefault(ch, {})
+                node.setdefault(_IDS, set()).update(ids)
+        self._trie = self._freeze(root)
+
+        self._grams = {}
+        for word in self._word_ids:
+            for gram in _trigrams(word):
+                self._grams.setdefault(gram, []).append(word)
+
+    @classmethod
+    def _freeze(cls, node):
+        frozen = {}
+        for key, child in node.items():
+            frozen[key] = tuple(sorted(child)) if key == _IDS else cls._freeze(child)
+        return frozen
+
+    def __len__(self):
+        return len(self.themes)
+
+    # Facets
+
+    @property
+    def categories(self):
+        """``[(category, count), ...]`` in display form"""
+        return [
+            (self._category_labels[c], stop - start) for c, (start, stop) in self._facets.items()
+        ]
+
+    def facet(self, category):
+        start, stop = self._facets.get(category.lower(), (0, 0))
+        return self.themes[start:stop]
+
+    def category_of(self, theme):
+        """Display category for a theme, whatever its case"""
+        i = self._ids.get(theme.lower())
+        if i is None:
+            return split_theme(theme)[0]
+        category = split_theme(self.themes[i])[0]
+        return self._category_labels.get(category.lower(), category)
+
+    def genre_label(self, genre):
+        return self._genre_labels.get(genre.lower(), genre)
+
+    # Queries
+
+    def _range(self, category):
+        if category is None:
+            return 0, len(self.themes)
+        return self._facets.get(category.lower(), (0, 0))
+
+    def _prefix_ids(self, prefix):
+        node = self._trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return ()
+        return node.get(_IDS, ())
+
+    def _similar_words(self, word, max_candidates=50):
+        """Vocabulary words within a small edit distance of ``word``"""
+        limit = 1 if len(word) <= 4 else 2
+        overlap = Counter()
+        for gram in _trigrams(word):
+            overlap.update(self._grams.get(gram, ()))
+        matches = []
+        for candidate, _ in overlap.most_common(max_candidates):
+            distance = edit_distance(word, candidate, limit)
+            if distance <= limit:
+                matches.append((candidate, distance))
+        return matches
+
+    @staticmethod
+    def _in_range(ids, start, stop):
+        lo = bisect_left(ids, start)
+        hi = bisect_left(ids, stop, lo)
+        return ids[lo:hi]
+
+    def autocomplete(self, prefix, limit=10, category=None):
+        """Themes whose words start with every word of ``prefix``"""
+        words = normalize(prefix)
+        start, stop = self._range(category)
+        if not words:
+            return list(self.themes[start:min(stop, start + limit)])
+        postings = sorted((self._in_range(self._prefix_ids(w), start, stop) for w in words), key=len)
+        matches = postings[0]
+        for other in postings[1:]:
+            other = set(other)
+            matches = [i for i in matches if i in other]
+        return [self.themes[i] for i in matches[:limit]]
+
+    def search(self, query, limit=10, category=None):
+        """Typo-tolerant search; prefix matches rank ahead of fuzzy ones"""
+        words = normalize(query)
+        start, stop = self._range(category)
+        if not words:
+            return list(self.themes[start:min(stop, start + limit)])
+
+        scores = None
+        for word in words:
+            costs = dict.fromkeys(self._in_range(self._prefix_ids(word), start, stop), 0)
+            if not costs:
+                for candidate, distance in self._similar_words(word):
+                    for i in self._in_range(self._word_ids[candidate], start, stop):
+                        if costs.get(i, distance + 1) > distance:
+                            costs[i] = distance
+            if scores is None:
+                scores = costs
+            else:
+                scores = {i: cost + costs[i] for i, cost in scores.items() if i in costs}
+            if not scores:
+                return []
+        ranked = heapq.nsmallest(limit, scores, key=lambda i: (scores[i], i))
+        return [self.themes[i] for i in ranked]
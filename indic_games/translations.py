@@ -0,0 +1,224 @@
+"""Compiled UI translation catalog shared by both frontends
+
+``src/utils/languageTranslation.ts`` is the single source of truth. Its
+``uiTranslations`` and ``gameTranslations`` tables are compiled into
+``translations.json`` next to this module: one flat ``text -> translation``
+table per language with the fallback chain (e.g. maithili -> hindi ->
+english) already folded in, so a lookup is a single dict access. The catalog
+is loaded once per process and shared by every session.
+
+Regenerate after editing the TypeScript table:
+
+    python -m indic_games.translations          # rewrite translations.json
+    python -m indic_games.translations --check  # fail if it is out of date
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from types import MappingProxyType
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_PATH = os.path.join(ROOT, 'src', 'utils', 'languageTranslation.ts')
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translations.json')
+
+# Languages without their own strings borrow from a related language first
+FALLBACKS = {
+    'maithili': 'hindi',
+    'sanskrit': 'hindi',
+    'nepali': 'hindi',
+    'dogri': 'hindi',
+    'bodo': 'hindi',
+    'konkani': 'marathi',
+    'assamese': 'bengali',
+    'manipuri': 'bengali',
+    'sindhi': 'urdu',
+    'kashmiri': 'urdu',
+}
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<comment>//[^\n]*|/\*.*?\*/)
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<ident>[A-Za-z_$][\w$]*)
+      | (?P<punct>[{}:,])
+    )""", re.S | re.X)
+_STRING_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.S)
+_SIMPLE_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', '0': '\0'}
+
+
+def _unquote(literal):
+    def replace(match):
+        escape = match.group(1)
+        if escape[0] == 'u' and len(escape) == 5:
+            return chr(int(escape[1:], 16))
+        return _SIMPLE_ESCAPES.get(escape, escape)
+    return _STRING_ESCAPE.sub(replace, literal[1:-1])
+
+
+def _tokens(source, pos):
+    while True:
+        match = _TOKEN.match(source, pos)
+        if match is None:
+            raise ValueError(f"Unexpected TypeScript at offset {pos}: {source[pos:pos + 40]!r}")
+        pos = match.end()
+        if match.lastgroup != 'comment':
+            yield match.lastgroup, match.group(match.lastgroup)
+
+
+def _parse_object(tokens):
+    """Parse a nested object literal of string keys and string values"""
+    result = {}
+    while True:
+        kind, value = next(tokens)
+        if value == '}':
+            return result
+        if kind not in ('string', 'ident'):
+            raise ValueError(f"Expected an object key, got {value!r}")
+        key = _unquote(value) if kind == 'string' else value
+        if next(tokens)[1] != ':':
+            raise ValueError(f"Expected ':' after {key!r}")
+        kind, value = next(tokens)
+        if value == '{':
+            result[key] = _parse_object(tokens)
+        elif kind == 'string':
+            result[key] = _unquote(value)
+        else:
+            raise ValueError(f"Unsupported value for {key!r}: {value!r}")
+        kind, value = next(tokens)
+        if value == '}':
+            return result
+        if value != ',':
+            raise ValueError(f"Expected ',' after {key!r}")
+
+
+def parse_ts_table(source, name):
+    """Parse ``export const <name>: ... = { ... };`` from TypeScript source"""
+    start = source.index(f'export const {name}')
+    brace = source.index('= {', start) + 2
+    tokens = _tokens(source, brace + 1)
+    return _parse_object(tokens)
+
+
+def fallback_chain(language):
+    chain = [language]
+    while chain[-1] in FALLBACKS:
+        chain.append(FALLBACKS[chain[-1]])
+    return chain
+
+
+def compile_catalog(source):
+    """Compile the TypeScript tables into per-language flat lookups"""
+    ui = parse_ts_table(source, 'uiTranslations')
+    genres = parse_ts_table(source, 'gameTranslations')
+    languages = re.findall(r"\{\s*code:\s*'(\w+)'", source)
+
+    # Per-language entries, genres first so UI strings win like translateText
+    own = {}
+    for genre, by_language in genres.items():
+        for language, translation in by_language.items():
+            entries = own.setdefault(language, {})
+            for key in (genre, genre.capitalize(), genre.title()):
+                entries[key] = translation
+    for text, by_language in ui.items():
+        for language, translation in by_language.items():
+            own.setdefault(language, {})[text] = translation
+
+    tables = {}
+    for language in sorted(set(languages) | set(own)):
+        table = {}
+        for code in reversed(fallback_chain(language)):
+            table.update(own.get(code, {}))
+        tables[language] = dict(sorted(table.items()))
+    return {
+        'source': os.path.relpath(SOURCE_PATH, ROOT).replace(os.sep, '/'),
+        'source_sha256': hashlib.sha256(source.encode('utf-8')).hexdigest(),
+        'fallbacks': FALLBACKS,
+        'tables': tables,
+    }
+
+
+def _read_source(path=SOURCE_PATH):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+class TranslationCatalog:
+    """Read-only per-language lookup tables"""
+
+    _EMPTY = MappingProxyType({})
+
+    def __init__(self, tables):
+        self._tables = {
+            language: MappingProxyType(dict(table)) for language, table in tables.items()
+        }
+
+    @classmethod
+    def load(cls, path=CATALOG_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f)['tables'])
+
+    @property
+    def languages(self):
+        return sorted(self._tables)
+
+    def table(self, language):
+        """Flat ``text -> translation`` mapping; English and unknown codes are empty"""
+        return self._tables.get(language, self._EMPTY)
+
+    def translate(self, text, language):
+        return self._tables.get(language, self._EMPTY).get(text, text)
+
+    def translate_many(self, texts, language):
+        table = self._tables.get(language, self._EMPTY)
+        return [table.get(text, text) for text in texts]
+
+
+_catalog = None
+
+
+def get_catalog():
+    """The process-wide catalog, loaded on first use"""
+    global _catalog
+    if _catalog is None:
+        _catalog = TranslationCatalog.load()
+    return _catalog
+
+
+def translate_text(text, target_language):
+    return get_catalog().translate(text, target_language)
+
+
+def translate_many(texts, target_language):
+    """Translate several strings with a single table lookup"""
+    return get_catalog().translate_many(texts, target_language)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile translations.json from languageTranslation.ts")
+    parser.add_argument('--check', action='store_true',
+                        help="exit non-zero if translations.json is out of date")
+    args = parser.parse_args(argv)
+
+    compiled = json.dumps(compile_catalog(_read_source()), ensure_ascii=False, indent=2) + '\n'
+    if args.check:
+        try:
+            with open(CATALOG_PATH, encoding='utf-8') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != compiled:
+            print(f"{CATALOG_PATH} is out of date; run python -m indic_games.translations", file=sys.stderr)
+            return 1
+        return 0
+    with open(CATALOG_PATH, 'w', encoding='utf-8') as f:
+        f.write(compiled)
+    print(f"Wrote {CATALOG_PATH}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
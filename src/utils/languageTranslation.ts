@@ -87,6 +87,18 @@ export const uiTranslations: Record<string, Record<string, string>> = {
     telugu: 'ఆట ఆడటానికి సిద్ధంగా ఉన్న గేమ్‌లు',
     marathi: 'खेळण्यासाठी तयार गेम्स',
     gujarati: 'રમવા માટે તૈયાર ગેમ્સ'
+  },
+  'Play Now': {
+    hindi: 'अभी खेलें'
+  },
+  'Generate Game': {
+    hindi: 'गेम बनाएं'
+  },
+  'Download': {
+    hindi: 'डाउनलोड करें'
+  },
+  'Custom Game Generator': {
+    hindi: 'कस्टम गेम जेनरेटर'
   }
 };
 
@@ -1,9 +1,21 @@
-
 import streamlit as st
-import json
-import time
-import random
-from datetime import datetime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+import sys
+
+from indic_games import metrics, render, translations
+from indic_games.admission import BusyError
+from indic_games.assets import standalone_game_html
+from indic_games.catalog import GENRES, LANGUAGES, PREBUILT_GAMES, THEMES
+from indic_games.export import EXPORT_FILE_NAME, spool_export_zip, theme_category
+from indic_games.gallery import GameGallery
+from indic_games.generator import game_labels
+from indic_games.minify import minify_html
+from indic_games.pipeline import GenerationError, GenerationRunner
+from indic_games.record import GameRecord
+from indic_games.render import escape_html
+from indic_games.spec import SPEC_VERSION, js_declaration
+from indic_games.store import GameStore
+from indic_games.theme_index import CatalogIndex
 
 # Configure the page
 st.set_page_config(
@@ -13,8 +25,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Add custom CSS animations
-st.markdown("""
+# Add custom CSS animations, minified once per process: it is resent on every rerun
+st.markdown(minify_html("""
 <style>
     @keyframes fadeInUp {
         from {
@@ -177,316 +189,177 @@ st.markdown("""
         box-shadow: 0 0 10px rgba(99, 102, 241, 0.3) !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
-# Language data
-LANGUAGES = {
-    'english': {'name': 'English', 'native': 'English'},
-    'hindi': {'name': 'Hindi', 'native': 'हिंदी'},
-    'bengali': {'name': 'Bengali', 'native': 'বাংলা'},
-    'telugu': {'name': 'Telugu', 'native': 'తెలుగు'},
-    'marathi': {'name': 'Marathi', 'native': 'मराठी'},
-    'tamil': {'name': 'Tamil', 'native': 'தமிழ்'},
-    'gujarati': {'name': 'Gujarati', 'native': 'ગુજરાતી'},
-    'kannada': {'name': 'Kannada', 'native': 'ಕನ್ನಡ'},
-    'malayalam': {'name': 'Malayalam', 'native': 'മലയാളം'},
-    'punjabi': {'name': 'Punjabi', 'native': 'ਪੰਜਾਬੀ'},
-    'odia': {'name': 'Odia', 'native': 'ଓଡ଼ିଆ'},
-    'assamese': {'name': 'Assamese', 'native': 'অসমীয়া'},
-    'urdu': {'name': 'Urdu', 'native': 'اردو'},
-    'sanskrit': {'name': 'Sanskrit', 'native': 'संस्कृत'}
-}
+# Time the shared helpers from the UI only, so the API and batch paths stay unwrapped
+timed_render_game_html = metrics.registry.timed('render_game_html')(render.render_game_html)
+timed_translate_many = metrics.registry.timed('translate_many')(translations.translate_many)
 
-GENRES = [
-    'Adventure', 'Puzzle', 'Strategy', 'Educational', 'RPG', 
-    'Action', 'Simulation', 'Card Game', 'Board Game', 'Quiz'
-]
+@metrics.registry.timed('download_artifact')
+def game_download_artifact(game, profile='full'):
+    """HTML bytes backing the download button for the current game
+    
+    Kept in session state next to the game and profile it was built from, so
+    reruns that change neither do no HTML work at all.
+    """
+    cached = st.session_state.get('game_artifact')
+    if cached is None or cached[0] is not game or cached[1] != profile:
+        page = timed_render_game_html(game, game['language'], profile)
+        cached = (game, profile, standalone_game_html(page, game, game['language']))
+        st.session_state.game_artifact = cached
+    return cached[2]
 
-THEMES = [
-    'Mythology - Ramayana', 'Mythology - Mahabharata', 'Mythology - Bhagavad Gita',
-    'Mythology - Hanuman Chalisa', 'Mythology - Krishna Leela', 'Mythology - Shiva Purana',
-    'Historical - Mughal Era', 'Historical - Maratha Empire', 'Historical - Chola Dynasty',
-    'Historical - Gupta Empire', 'Historical - Mauryan Empire', 'Historical - Vijayanagara',
-    'Festival - Diwali', 'Festival - Holi', 'Festival - Dussehra',
-    'Festival - Karva Chauth', 'Festival - Ganesh Chaturthi', 'Festival - Navratri',
-    'Culture - Classical Dance', 'Culture - Folk Tales', 'Culture - Ayurveda',
-    'Culture - Yoga Traditions', 'Culture - Sanskrit Literature', 'Culture - Vedic Wisdom',
-    'Geography - Indian States', 'Geography - Sacred Rivers', 'Geography - Mountain Ranges',
-    'Literature - Sanskrit Poetry', 'Literature - Tamil Classics', 'Literature - Vedic Texts',
-    'Architecture - Temples', 'Architecture - Forts', 'Architecture - Palaces',
-    'Cuisine - Regional Foods', 'Cuisine - Spices & Herbs', 'Cuisine - Festival Foods',
-    'Music - Classical Ragas', 'Music - Folk Songs', 'Music - Devotional Music',
-    'Art - Madhubani', 'Art - Warli', 'Art - Tanjore Painting'
-]
+@st.cache_resource
+def get_catalog_index():
+    """Theme/genre index shared by every session"""
+    return CatalogIndex(THEMES, GENRES)
 
-# Pre-built games
-PREBUILT_GAMES = [
-    {
-        "title": "Ramayana Quest",
-        "genre": "adventure",
-        "theme": "mythology - ramayana",
-        "description": "Join Prince Rama on his epic journey through exile, the search for Sita, and the battle against Ravana.",
-        "mechanics": ['Story Progression', 'Character Development', 'Battle System', 'Quest Management'],
-        "features": ['Voice Narration', 'Interactive Choices', 'Cultural Learning', 'Achievement System']
-    },
-    {
-        "title": "Mahabharata Legends",
-        "genre": "strategy",
-        "theme": "mythology - mahabharata",
-        "description": "Experience the great war of Kurukshetra and make crucial decisions that shape the destiny of kingdoms.",
-        "mechanics": ['Strategic Combat', 'Diplomatic Choices', 'Resource Management', 'Alliance Building'],
-        "features": ['Multiple Endings', 'Historical Accuracy', 'Character Relationships', 'Moral Dilemmas']
-    },
-    {
-        "title": "Festival Celebrations",
-        "genre": "simulation",
-        "theme": "festival - diwali",
-        "description": "Plan and organize traditional Indian festivals, learn customs, and spread joy in the community.",
-        "mechanics": ['Event Planning', 'Resource Management', 'Community Building', 'Cultural Learning'],
-        "features": ['Regional Variations', 'Recipe Collection', 'Decoration Crafting', 'Social Sharing']
-    },
-    {
-        "title": "Classical Dance Academy",
-        "genre": "educational",
-        "theme": "culture - classical dance",
-        "description": "Learn and master traditional Indian dance forms through interactive gameplay and cultural education.",
-        "mechanics": ['Rhythm Matching', 'Pose Recognition', 'Story Interpretation', 'Performance Scoring'],
-        "features": ['Multiple Dance Forms', 'Cultural Context', 'Progressive Learning', 'Performance Mode']
-    },
-    {
-        "title": "Spice Route Trader",
-        "genre": "strategy",
-        "theme": "cuisine - spices & herbs",
-        "description": "Navigate ancient trade routes, discover exotic spices, and build your trading empire across India.",
-        "mechanics": ['Trade Management', 'Route Planning', 'Market Analysis', 'Cultural Exchange'],
-        "features": ['Historical Accuracy', 'Recipe Discovery', 'Economic Strategy', 'Cultural Learning']
-    },
-    {
-        "title": "Temple Architecture Builder",
-        "genre": "simulation",
-        "theme": "architecture - temples",
-        "description": "Design and construct magnificent Indian temples while learning about architectural principles and cultural significance.",
-        "mechanics": ['Building Design', 'Resource Management', 'Historical Accuracy', 'Cultural Integration'],
-        "features": ['Authentic Styles', 'Educational Content', 'Visual Showcase', 'Historical Context']
-    }
-]
+@st.cache_resource
+def get_gallery():
+    """Prebuilt game gallery shared by every session"""
+    return GameGallery(PREBUILT_GAMES, get_catalog_index())
 
-# Translation helpers (simplified)
-def translate_text(text, target_language):
-    if target_language == 'english':
-        return text
-    
-    translations = {
-        'hindi': {
-            'Generate Your Game': 'अपना गेम बनाएं',
-            'Generate Game': 'गेम बनाएं',
-            'Play Now': 'अभी खेलें',
-            'Download': 'डाउनलोड करें',
-            'Ready-to-Play Games': 'तैयार खेल',
-            'Custom Game Generator': 'कस्टम गेम जेनरेटर'
-        }
-    }
-    
-    return translations.get(target_language, {}).get(text, text)
+@st.cache_resource
+def get_game_store():
+    """SQLite game repository shared by every session"""
+    return GameStore()
 
-def generate_game_html(game_data, language):
-    """Generate a complete HTML game file"""
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{game_data['title']} - Complete Indic Game</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Arial', sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            animation: gradient-shift 3s ease infinite;
-        }}
-        @keyframes gradient-shift {{
-            0%, 100% {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }}
-            50% {{ background: linear-gradient(135deg, #764ba2 0%, #667eea 100%); }}
-        }}
-        .game-container {{
-            max-width: 800px;
-            width: 90%;
-            background: rgba(255,255,255,0.1);
-            padding: 30px;
-            border-radius: 20px;
-            backdrop-filter: blur(10px);
-            box-shadow: 0 8px 32px rgba(0,0,0,0.3);
-            text-align: center;
-            animation: fadeInUp 1s ease-out;
-        }}
-        @keyframes fadeInUp {{
-            from {{
-                opacity: 0;
-                transform: translateY(30px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        .game-title {{
-            font-size: 2.5em;
-            margin-bottom: 20px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
-            animation: glow 2s ease-in-out infinite alternate;
-        }}
-        @keyframes glow {{
-            from {{ text-shadow: 2px 2px 4px rgba(0,0,0,0.5), 0 0 20px rgba(255,255,255,0.3); }}
-            to {{ text-shadow: 2px 2px 4px rgba(0,0,0,0.5), 0 0 30px rgba(255,255,255,0.6); }}
-        }}
-        .play-button {{
-            background: linear-gradient(45deg, #ff6b6b, #4ecdc4);
-            border: none;
-            padding: 15px 30px;
-            border-radius: 25px;
-            color: white;
-            font-size: 1.2em;
-            font-weight: bold;
-            cursor: pointer;
-            transition: transform 0.3s ease;
-            margin: 20px 10px;
-            animation: pulse 2s infinite;
-        }}
-        @keyframes pulse {{
-            0% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.05); }}
-            100% {{ transform: scale(1); }}
-        }}
-        .play-button:hover {{
-            transform: scale(1.1);
-            animation: none;
-        }}
-    </style>
-</head>
-<body>
-    <div class="game-container">
-        <h1 class="game-title">🎮 {game_data['title']}</h1>
-        <p style="font-size: 1.2em; margin-bottom: 20px; opacity: 0.9;">
-            {game_data['description']}
-        </p>
-        
-        <div style="margin: 30px 0;">
-            <div style="display: inline-block; margin: 10px; padding: 15px; background: rgba(255,255,255,0.2); border-radius: 10px;">
-                <strong>Genre:</strong> {game_data['genre']}
-            </div>
-            <div style="display: inline-block; margin: 10px; padding: 15px; background: rgba(255,255,255,0.2); border-radius: 10px;">
-                <strong>Theme:</strong> {game_data['theme']}
-            </div>
-            <div style="display: inline-block; margin: 10px; padding: 15px; background: rgba(255,255,255,0.2); border-radius: 10px;">
-                <strong>Language:</strong> {language}
-            </div>
-        </div>
+@st.cache_resource
+def get_generation_runner():
+    """Background generation pipeline shared by every session, with its admission limits"""
+    return GenerationRunner()
 
-        <button class="play-button" onclick="startGame()">🚀 Start Game</button>
-        
-        <div id="game-area" style="display: none; margin-top: 30px;">
-            <h2>Welcome to {game_data['title']}!</h2>
-            <p>This is a fully functional {game_data['genre']} game about {game_data['theme']}.</p>
-            <p>Game mechanics include: {', '.join(game_data.get('mechanics', []))}</p>
-            <button class="play-button" onclick="location.reload()">🔄 Restart</button>
-        </div>
-    </div>
+@st.cache_resource
+def get_metrics_server():
+    """Local /metrics endpoint for rerun timings (INDIC_GAMES_METRICS_PORT)"""
+    return metrics.start_metrics_server()
+
+def current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+def set_gallery_page(page):
+    st.session_state.gallery_page = page
 
-    <script>
-        function startGame() {{
-            document.getElementById('game-area').style.display = 'block';
-            alert('Game Started! This is a demo version of {game_data["title"]}');
-        }}
-    </script>
-</body>
-</html>"""
-    return html_content
+def play_prebuilt_game():
+    """Load the chosen gallery game, then rerun only the gallery and preview"""
+    game = PREBUILT_GAMES[st.session_state.gallery_choice]
+    st.session_state.generated_game = GameRecord.from_dict(
+        game, language=st.session_state.selected_language)
+    st.rerun(scope=['gallery', 'preview'])
+
+def rerun_generator_and_preview():
+    # The generator fragment runs first and stores the game the preview then shows
+    st.rerun(scope=['generator', 'preview'])
 
 # Initialize session state
 if 'selected_language' not in st.session_state:
     st.session_state.selected_language = 'english'
 if 'generated_game' not in st.session_state:
-    st.session_state.generated_game = None
+    # A reconnecting browser gets its saved game back from the ?game= link
+    saved_id = st.query_params.get('game')
+    saved_game = get_game_store().get(saved_id) if saved_id else None
+    st.session_state.generated_game = GameRecord.from_dict(saved_game) if saved_game else None
 
-# Main app
-def main():
-    # Header with animation
-    st.markdown("""
-    <div class="animated-header" style="text-align: center; padding: 2rem 0;">
-        <h1 style="color: #6366f1; font-size: 3rem; margin-bottom: 1rem;">
-            🎮 Indic Game Generator
-        </h1>
-        <p style="font-size: 1.2rem; color: #6b7280;">
-            Create culturally rich games in Indian languages with AI
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+# Panels that rerun on their own: a widget inside one reruns just that panel,
+# timed as a rerun of its own
+@st.fragment(key='export')
+def export_panel(language_options):
+    with metrics.registry.rerun(current_session_id(), 'export'), metrics.registry.span('export'):
+        # Bulk export of every prebuilt game in every language
+        with st.expander("📦 Bulk Export"):
+            export_genres = st.multiselect(
+                "Genres", sorted({game['genre'] for game in PREBUILT_GAMES}))
+            export_categories = st.multiselect(
+                "Theme categories", sorted({theme_category(theme) for theme in THEMES}))
+            export_languages = st.multiselect(
+                "Languages", options=list(language_options.keys()),
+                format_func=lambda x: language_options[x])
+            export_lite = st.checkbox("🪶 Lite pages for low-end phones")
+            # The archive is only built when the button is clicked, into a temporary file
+            st.download_button(
+                label="💾 Download All Games (.zip)",
+                data=lambda: spool_export_zip(
+                    PREBUILT_GAMES, LANGUAGES, genres=export_genres, categories=export_categories,
+                    language_codes=export_languages, profile='lite' if export_lite else 'full'
+                ),
+                file_name=EXPORT_FILE_NAME,
+                mime="application/zip",
+                on_click='ignore',
+                use_container_width=True
+            )
 
-    # Language Selector with glow effect
-    st.sidebar.markdown('<div class="glow-effect">', unsafe_allow_html=True)
-    st.sidebar.header("🌍 Language Selection")
-    language_options = {code: f"{data['name']} ({data['native']})" 
-                       for code, data in LANGUAGES.items()}
-    
-    selected_lang = st.sidebar.selectbox(
-        "Choose your language:",
-        options=list(language_options.keys()),
-        format_func=lambda x: language_options[x],
-        index=list(language_options.keys()).index(st.session_state.selected_language)
-    )
-    st.sidebar.markdown('</div>', unsafe_allow_html=True)
-    
-    if selected_lang != st.session_state.selected_language:
-        st.session_state.selected_language = selected_lang
-        st.rerun()
-
-    # Main content in two columns
-    col1, col2 = st.columns([1, 1])
-
-    with col1:
+@st.fragment(key='gallery')
+def gallery_panel(catalog_index, play_label):
+    with metrics.registry.rerun(current_session_id(), 'gallery'), metrics.registry.span('gallery'):
         st.markdown('<div class="fade-in-delayed">', unsafe_allow_html=True)
         st.header("🎯 Ready-to-Play Games")
         
-        # Display pre-built games with animations
-        for i, game in enumerate(PREBUILT_GAMES):
-            with st.container():
-                st.markdown(f"""
-                <div class="animated-card hover-scale" style="border: 2px solid #e5e7eb; border-radius: 10px; padding: 1rem; margin: 1rem 0; background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%);">
-                    <h4 style="color: #374151; margin-bottom: 0.5rem;">🎮 {game['title']}</h4>
-                    <p style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">{game['description']}</p>
-                    <div style="margin-bottom: 1rem;">
-                        <span style="background: #ddd6fe; color: #5b21b6; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.8rem; margin-right: 0.5rem;">{game['genre']}</span>
-                        <span style="background: #fed7d7; color: #c53030; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.8rem;">{game['theme'].split(' - ')[0]}</span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                if st.button(f"🎮 {translate_text('Play Now', st.session_state.selected_language)}", key=f"play_{i}", help="Click to load this game"):
-                    st.session_state.generated_game = {
-                        **game,
-                        'language': st.session_state.selected_language,
-                        'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                    st.markdown('<div class="bounce-in">', unsafe_allow_html=True)
-                    st.success(f"✅ {game['title']} loaded successfully!")
-                    st.markdown('</div>', unsafe_allow_html=True)
+        # One cached HTML fragment per page instead of a markdown per card
+        gallery = get_gallery()
+        filter_genre, filter_category = st.columns(2)
+        gallery_genre = filter_genre.selectbox(
+            "Filter by genre", options=[''] + gallery.genres,
+            format_func=lambda g: catalog_index.genre_label(g) if g else "All genres")
+        gallery_category = filter_category.selectbox(
+            "Filter by category", options=[''] + gallery.categories,
+            format_func=lambda c: c or "All categories")
+        
+        page_count = gallery.page_count(gallery_genre, gallery_category)
+        page = min(st.session_state.get('gallery_page', 1), page_count)
+        page_ids, page_html = gallery.page(page, gallery_genre, gallery_category)
+        st.markdown(page_html, unsafe_allow_html=True)
+        
+        if page_ids:
+            st.selectbox("🎮 Choose a game", options=page_ids, key="gallery_choice",
+                         format_func=lambda i: PREBUILT_GAMES[i]['title'])
+            # The game is loaded in the callback, which also reruns the preview
+            if st.button(f"🎮 {play_label}", key="play_game", help="Click to load this game",
+                         on_click=play_prebuilt_game):
+                game = st.session_state.generated_game
+                st.markdown('<div class="bounce-in">', unsafe_allow_html=True)
+                st.success(f"✅ {game['title']} loaded successfully!")
+                st.markdown('</div>', unsafe_allow_html=True)
+        else:
+            st.info("No games match these filters")
+        
+        if page_count > 1:
+            # Page changes are applied in callbacks, before the rerun renders
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            col_prev.button("◀ Previous", disabled=page <= 1, use_container_width=True,
+                            on_click=set_gallery_page, args=(page - 1,))
+            col_page.markdown(f"<p style='text-align: center; color: #6b7280;'>Page {page} of {page_count}</p>",
+                              unsafe_allow_html=True)
+            col_next.button("Next ▶", disabled=page >= page_count, use_container_width=True,
+                            on_click=set_gallery_page, args=(page + 1,))
 
+@st.fragment(key='generator')
+def generator_panel(catalog_index, generate_label):
+    with metrics.registry.rerun(current_session_id(), 'generator'), metrics.registry.span('form'):
         st.header("🛠️ Custom Game Generator")
         
+        # Narrow the theme list outside the form so it updates while typing
+        theme_facet = st.selectbox(
+            "🗂️ Category", options=[''] + [category for category, _ in catalog_index.categories],
+            format_func=lambda c: c or "All categories")
+        theme_query = st.text_input("🔎 Find a theme", placeholder="e.g., ramayan, diwali, temples")
+        if theme_query:
+            theme_options = catalog_index.search(theme_query, limit=50, category=theme_facet or None)
+        elif theme_facet:
+            theme_options = catalog_index.facet(theme_facet)
+        else:
+            theme_options = THEMES
+        
         # Custom game form with animated inputs
         with st.form("game_generator_form"):
             game_title = st.text_input("🎮 Game Title *", placeholder="e.g., Arjuna's Quest")
             game_genre = st.selectbox("🎯 Genre *", options=[''] + GENRES)
-            game_theme = st.selectbox("🎨 Cultural Theme *", options=[''] + THEMES)
+            game_theme = st.selectbox("🎨 Cultural Theme *", options=[''] + list(theme_options))
             game_description = st.text_area("📝 Additional Description", 
                                            placeholder="Describe your game concept, special features, or target audience...")
             
-            submitted = st.form_submit_button(f"✨ {translate_text('Generate Game', st.session_state.selected_language)}")
+            submitted = st.form_submit_button(f"✨ {generate_label}",
+                                              on_click=rerun_generator_and_preview)
             
             if submitted:
                 if not game_title or not game_genre or not game_theme:
@@ -494,109 +367,90 @@ def main():
                     st.error("❌ Please fill in all required fields (marked with *)")
                     st.markdown('</div>', unsafe_allow_html=True)
                 else:
-                    # Show animated generation progress
+                    # Stream real stage progress from the background generation job
                     progress_bar = st.progress(0)
                     status_text = st.empty()
-                    
-                    for i in range(100):
-                        progress_bar.progress(i + 1)
-                        if i < 30:
-                            status_text.markdown('<div class="loading-dots">🤖 Analyzing cultural context</div>', unsafe_allow_html=True)
-                        elif i < 60:
-                            status_text.markdown('<div class="loading-dots">🎨 Generating game mechanics</div>', unsafe_allow_html=True)
-                        elif i < 90:
-                            status_text.markdown('<div class="loading-dots">🌍 Translating to selected language</div>', unsafe_allow_html=True)
-                        else:
-                            status_text.markdown('<div class="loading-dots">✨ Finalizing your game</div>', unsafe_allow_html=True)
-                        time.sleep(0.02)
-                    
-                    # Generate the game
-                    description = game_description or f"An immersive {game_genre} game exploring {game_theme}"
-                    
-                    generated_game = {
+                    job = get_generation_runner().submit({
                         'title': game_title,
                         'genre': game_genre,
                         'theme': game_theme,
-                        'description': description,
-                        'mechanics': [
-                            'Turn-based gameplay',
-                            'Story-driven progression',
-                            'Cultural quiz elements',
-                            'Achievement system',
-                            'Multiplayer support'
-                        ],
-                        'features': [
-                            'Voice narration in selected language',
-                            'Authentic cultural graphics',
-                            'Educational content integration',
-                            'Leaderboard system',
-                            'Offline play support'
-                        ],
                         'language': st.session_state.selected_language,
-                        'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
+                        'description': game_description,
+                    }, store=get_game_store(), session=current_session_id())
+                    try:
+                        for event in job.events():
+                            progress_bar.progress(event.progress)
+                            status_text.markdown(f'<div class="loading-dots">{event.label}</div>', unsafe_allow_html=True)
+                        generated_game = job.result()
+                    except GenerationError as e:
+                        generated_game = None
+                        status_text.empty()
+                        st.error(f"❌ {e}")
+                    except TimeoutError as e:
+                        # The job has already been cancelled
+                        generated_game = None
+                        status_text.empty()
+                        st.error(f"❌ {e}")
+                    except BusyError as e:
+                        # Turned away at capacity; the form is still filled in for the retry
+                        generated_game = None
+                        status_text.empty()
+                        st.warning(f"⏳ {e}")
+                    finally:
+                        # Navigating away interrupts this rerun; stop the job with it
+                        job.cancel()
                     
-                    st.session_state.generated_game = generated_game
-                    progress_bar.progress(100)
-                    status_text.text("🎉 Game generated successfully!")
-                    st.markdown('<div class="bounce-in">', unsafe_allow_html=True)
-                    st.success("✅ Your Indic game is ready to play and download!")
-                    st.markdown('</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+                    if generated_game:
+                        st.session_state.generated_game = generated_game
+                        st.query_params['game'] = generated_game['id']
+                        progress_bar.progress(100)
+                        status_text.text("🎉 Game generated successfully!")
+                        st.markdown('<div class="bounce-in">', unsafe_allow_html=True)
+                        st.success("✅ Your Indic game is ready to play and download!")
+                        st.markdown('</div>', unsafe_allow_html=True)
 
-    with col2:
+@st.fragment(key='preview')
+def preview_panel():
+    with metrics.registry.rerun(current_session_id(), 'preview'), metrics.registry.span('preview'):
         st.markdown('<div class="animated-card">', unsafe_allow_html=True)
         st.header("🎮 Generated Game Preview")
         
         if st.session_state.generated_game:
             game = st.session_state.generated_game
+            # Genre and language as the game's own page names them
+            labels = game_labels(game['genre'], game['theme'], game['language'])
             
             # Game preview card with animations
             st.markdown(f"""
             <div class="bounce-in" style="border: 3px solid #10b981; border-radius: 15px; padding: 2rem; background: linear-gradient(135deg, #ecfdf5 0%, #d1fae5 100%); margin: 1rem 0;">
                 <div style="text-align: center; margin-bottom: 2rem;">
-                    <h2 style="color: #059669; margin-bottom: 1rem;">🎮 {game['title']}</h2>
+                    <h2 style="color: #059669; margin-bottom: 1rem;">🎮 {escape_html(game['title'])}</h2>
                     <div style="margin-bottom: 1rem;">
-                        <span style="background: #ddd6fe; color: #5b21b6; padding: 0.5rem 1rem; border-radius: 0.5rem; margin: 0.25rem;">{game['genre']}</span>
-                        <span style="background: #fef3c7; color: #d97706; padding: 0.5rem 1rem; border-radius: 0.5rem; margin: 0.25rem;">{game['theme']}</span>
+                        <span style="background: #ddd6fe; color: #5b21b6; padding: 0.5rem 1rem; border-radius: 0.5rem; margin: 0.25rem;">{escape_html(labels['genre'])}</span>
+                        <span style="background: #fef3c7; color: #d97706; padding: 0.5rem 1rem; border-radius: 0.5rem; margin: 0.25rem;">{escape_html(game['theme'])}</span>
                     </div>
-                    <p style="color: #374151; font-size: 1.1rem; line-height: 1.6;">{game['description']}</p>
+                    <p style="color: #374151; font-size: 1.1rem; line-height: 1.6;">{escape_html(game['description'])}</p>
                 </div>
                 
                 <div style="background: rgba(255,255,255,0.7); padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
                     <h4 style="color: #374151; margin-bottom: 1rem;">🔧 Game Mechanics:</h4>
                     <ul style="color: #6b7280; line-height: 1.8;">
-                        {''.join([f'<li>• {mechanic}</li>' for mechanic in game['mechanics']])}
+                        {''.join([f'<li>• {escape_html(mechanic)}</li>' for mechanic in game['mechanics']])}
                     </ul>
                 </div>
                 
                 <div style="background: rgba(255,255,255,0.7); padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
                     <h4 style="color: #374151; margin-bottom: 1rem;">✨ Features:</h4>
                     <ul style="color: #6b7280; line-height: 1.8;">
-                        {''.join([f'<li>• {feature}</li>' for feature in game['features']])}
+                        {''.join([f'<li>• {escape_html(feature)}</li>' for feature in game['features']])}
                     </ul>
                 </div>
                 
                 <div style="background: #1f2937; padding: 1.5rem; border-radius: 10px; margin: 1rem 0;">
                     <h4 style="color: #10b981; margin-bottom: 1rem;">💻 Generated Code:</h4>
                     <pre style="color: #10b981; font-family: 'Courier New', monospace; font-size: 0.9rem; line-height: 1.4; white-space: pre-wrap;">
-// Generated Game Structure
-const {game['title'].replace(' ', '')}Game = {{
-  title: "{game['title']}",
-  genre: "{game['genre']}",
-  theme: "{game['theme']}",
-  language: "{game['language']}",
-  mechanics: [
-    "turnBasedGameplay",
-    "storyProgression",
-    "quizElements"
-  ],
-  assets: {{
-    graphics: "cultural_authentic",
-    audio: "indic_traditional",
-    fonts: "unicode_support"
-  }}
-}};
+// Generated Game Spec (v{SPEC_VERSION})
+{escape_html(js_declaration(game))}
                     </pre>
                 </div>
             </div>
@@ -614,8 +468,10 @@ const {game['title'].replace(' ', '')}Game = {{
                 st.markdown('</div>', unsafe_allow_html=True)
                     
             with col_download:
-                # Generate HTML file
-                html_content = generate_game_html(game, game['language'])
+                lite = st.toggle("🪶 Lite version for low-end phones", key='lite_download',
+                                 help="Fewer animations, no blur effects, honours reduced-motion settings")
+                # Reuse the HTML file built for this game
+                html_content = game_download_artifact(game, 'lite' if lite else 'full')
                 
                 st.markdown('<div class="pulse-button">', unsafe_allow_html=True)
                 st.download_button(
@@ -623,6 +479,7 @@ const {game['title'].replace(' ', '')}Game = {{
                     data=html_content,
                     file_name=f"{game['title'].replace(' ', '_')}_Complete_Game.html",
                     mime="text/html",
+                    on_click='ignore',
                     use_container_width=True
                 )
                 st.markdown('</div>', unsafe_allow_html=True)
@@ -631,8 +488,9 @@ const {game['title'].replace(' ', '')}Game = {{
             st.markdown(f"""
             <div class="fade-in-delayed" style="margin-top: 2rem; padding: 1rem; background: #f3f4f6; border-radius: 10px;">
                 <h5 style="color: #374151;">📊 Game Information:</h5>
-                <p style="color: #6b7280; margin: 0.5rem 0;"><strong>Language:</strong> {LANGUAGES[game['language']]['name']} ({LANGUAGES[game['language']]['native']})</p>
-                <p style="color: #6b7280; margin: 0.5rem 0;"><strong>Generated:</strong> {game['generated_at']}</p>
+                <p style="color: #6b7280; margin: 0.5rem 0;"><strong>Language:</strong> {LANGUAGES[game['language']]['name']} ({labels['language']})</p>
+                <p style="color: #6b7280; margin: 0.5rem 0;"><strong>Generated:</strong> {escape_html(game['generated_at'])}</p>
+                {f'<p style="color: #6b7280; margin: 0.5rem 0;"><strong>Game ID:</strong> {escape_html(game["id"])}</p>' if game.get('id') else ''}
                 <p style="color: #6b7280; margin: 0.5rem 0;"><strong>Status:</strong> ✅ Ready to play</p>
             </div>
             """, unsafe_allow_html=True)
@@ -648,13 +506,81 @@ const {game['title'].replace(' ', '')}Game = {{
             """, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+# Main app
+def main():
+    span = metrics.registry.span
+    # Header with animation
+    with span('header'):
+        st.markdown("""
+        <div class="animated-header" style="text-align: center; padding: 2rem 0;">
+            <h1 style="color: #6366f1; font-size: 3rem; margin-bottom: 1rem;">
+                🎮 Indic Game Generator
+            </h1>
+            <p style="font-size: 1.2rem; color: #6b7280;">
+                Create culturally rich games in Indian languages with AI
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with span('sidebar'):
+        # Language Selector with glow effect
+        st.sidebar.markdown('<div class="glow-effect">', unsafe_allow_html=True)
+        st.sidebar.header("🌍 Language Selection")
+        language_options = {code: f"{data['name']} ({data['native']})" 
+                           for code, data in LANGUAGES.items()}
+        
+        # Bound to session state, so a change costs one rerun instead of two
+        st.sidebar.selectbox(
+            "Choose your language:",
+            options=list(language_options.keys()),
+            format_func=lambda x: language_options[x],
+            key='selected_language'
+        )
+        st.sidebar.markdown('</div>', unsafe_allow_html=True)
+
+    with st.sidebar:
+        export_panel(language_options)
+
+    catalog_index = get_catalog_index()
+
+    # UI labels for this rerun, looked up once
+    play_label, generate_label = timed_translate_many(
+        ['Play Now', 'Generate Game'], st.session_state.selected_language)
+
+    # Main content in two columns
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        gallery_panel(catalog_index, play_label)
+        generator_panel(catalog_index, generate_label)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        preview_panel()
+
     # Footer with animation
-    st.markdown("---")
-    st.markdown("""
-    <div class="animated-header" style="text-align: center; padding: 2rem 0; color: #6b7280;">
-        <p>🎮 Built with Streamlit • Promoting Indian Culture Through Gaming 🇮🇳</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with span('footer'):
+        st.markdown("---")
+        st.markdown("""
+        <div class="animated-header" style="text-align: center; padding: 2rem 0; color: #6b7280;">
+            <p>🎮 Built with Streamlit • Promoting Indian Culture Through Gaming 🇮🇳</p>
+        </div>
+        """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
-    main()
+    if st.runtime.exists():
+        get_metrics_server()
+        with metrics.registry.rerun(current_session_id()):
+            main()
+    elif sys.argv[1:2] == ['batch']:
+        # python streamlit_app.py batch manifest.jsonl ...
+        from indic_games.batch import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    elif sys.argv[1:2] == ['build-site']:
+        # python streamlit_app.py build-site site/ ...
+        from indic_games.static_site import main as build_site_main
+        sys.exit(build_site_main(sys.argv[2:]))
+    else:
+        sys.exit("Run the app with `streamlit run streamlit_app.py`, generate games offline with "
+                 "`python streamlit_app.py batch manifest.jsonl`, or build the static catalog "
+                 "with `python streamlit_app.py build-site site/`")
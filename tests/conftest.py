@@ -0,0 +1,17 @@
+import pytest
+
+from indic_games.generator import create_game
+from indic_games.store import GameStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = GameStore(str(tmp_path / 'games.db'), pool_size=2)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def game():
+    return create_game("Arjuna's Quest", 'Adventure', 'Mythology - Mahabharata', 'hindi',
+                       'An archer <b>learns</b> focus')
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from indic_games.admission import AdmissionGate, BusyError
+
+
+def make_gate(**overrides):
+    options = dict(workers=1, max_queue=1, queue_timeout=5, session_quota=2)
+    options.update(overrides)
+    return AdmissionGate(**options)
+
+
+def test_queue_full_rejects_beyond_workers_plus_queue():
+    gate = make_gate()
+    gate.admit()
+    gate.admit()
+    with pytest.raises(BusyError) as error:
+        gate.admit()
+    assert error.value.reason == 'queue_full'
+    assert error.value.retry_after >= 1
+    assert gate.stats()['rejected']['queue_full'] == 1
+
+
+def test_session_quota_applies_per_session_only():
+    gate = make_gate(max_queue=5)
+    gate.admit('a')
+    gate.admit('a')
+    with pytest.raises(BusyError) as error:
+        gate.admit('a')
+    assert error.value.reason == 'session_quota'
+    gate.admit('b')
+    gate.admit(None)
+    assert gate.stats()['sessions'] == 2
+
+
+def test_release_is_idempotent_and_frees_the_session():
+    gate = make_gate()
+    ticket = gate.admit('a')
+    gate.release(ticket)
+    gate.release(ticket)
+    stats = gate.stats()
+    assert stats['queued'] == 0 and stats['running'] == 0 and stats['sessions'] == 0
+    gate.admit('a')
+    gate.admit('a')
+
+
+def test_queued_job_gets_the_worker_when_one_is_released():
+    async def scenario():
+        gate = make_gate()
+        first, second = gate.admit(), gate.admit()
+        queued = []
+        order = []
+
+        async def job(ticket, name, hold):
+            async with gate.slot(ticket, on_queue=lambda: queued.append(name)):
+                order.append(name)
+                await hold
+
+        release_first = asyncio.get_running_loop().create_future()
+        tasks = [asyncio.create_task(job(first, 'first', release_first)),
+                 asyncio.create_task(job(second, 'second', asyncio.sleep(0)))]
+        await asyncio.sleep(0.01)
+        assert order == ['first'] and queued == ['second']
+        assert gate.stats()['running'] == 1
+        release_first.set_result(None)
+        await asyncio.gather(*tasks)
+        assert order == ['first', 'second']
+        assert gate.stats()['running'] == 0 and gate.stats()['queued'] == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_raises_busy_and_releases_the_ticket():
+    async def scenario():
+        gate = make_gate(queue_timeout=0.05)
+        first, second = gate.admit(), gate.admit()
+        async with gate.slot(first):
+            with pytest.raises(BusyError) as error:
+                async with gate.slot(second):
+                    pass
+            assert error.value.reason == 'timeout'
+        assert gate.stats()['running'] == 0 and gate.stats()['queued'] == 0
+
+    asyncio.run(scenario())
+
+
+def test_abandon_only_releases_tickets_that_never_entered():
+    gate = make_gate()
+    ticket = gate.admit('a')
+    gate.abandon(ticket)
+    assert gate.stats()['sessions'] == 0
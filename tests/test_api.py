@@ -0,0 +1,118 @@
+import asyncio
+import json
+
+import pytest
+
+from indic_games.admission import AdmissionGate
+from indic_games.api import ApiServer, GameApi
+from indic_games.backends import StaticBackend
+
+GAME_REQUEST = json.dumps({
+    'title': "Diwali Lights", 'genre': 'Puzzle', 'theme': 'Festival - Diwali', 'language': 'hindi',
+}).encode()
+
+
+@pytest.fixture
+def api(store):
+    return GameApi(store, StaticBackend(), AdmissionGate(workers=1, max_queue=0, queue_timeout=1,
+                                                         session_quota=1))
+
+
+def exchange(api, *requests):
+    """Send raw requests over one connection and return the raw reply"""
+    async def run():
+        server = await ApiServer(api).start(port=0)
+        try:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b''.join(requests))
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return data
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run())
+
+
+def get(path, close=True):
+    return f"GET {path} HTTP/1.1\r\n{'Connection: close' if close else 'Host: x'}\r\n\r\n".encode()
+
+
+def post(path, body, extra=b''):
+    return b'POST %s HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n%s\r\n%s' % (
+        path.encode(), len(body), extra, body)
+
+
+def parse(data):
+    head, _, body = data.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    headers = dict(line.lower().split(': ', 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, body
+
+
+def test_generate_then_fetch_game_spec_and_page(api):
+    status, _, body = parse(exchange(api, post('/api/generate-game', GAME_REQUEST)))
+    assert status == 201
+    game = json.loads(body)
+    assert game['title'] == "Diwali Lights"
+
+    status, _, body = parse(exchange(api, get(f"/api/games/{game['id']}")))
+    assert status == 200 and json.loads(body) == game
+    status, _, body = parse(exchange(api, get(f"/api/games/{game['id']}/spec")))
+    assert status == 200 and json.loads(body)['title'] == game['title']
+    status, headers, body = parse(exchange(api, get(f"/api/games/{game['id']}/html")))
+    assert status == 200 and headers['content-type'].startswith('text/html')
+    assert b'<html lang="hi">' in body
+
+
+def test_keep_alive_serves_several_requests(api):
+    data = exchange(api, get('/api/languages', close=False), get('/api/themes'))
+    assert data.count(b'HTTP/1.1 200') == 2
+
+
+def test_unknown_route_and_bad_method(api):
+    assert parse(exchange(api, get('/api/nothing')))[0] == 404
+    assert parse(exchange(api, get('/api/games/missing')))[0] == 404
+    assert parse(exchange(api, get('/api/generate-game')))[0] == 405
+
+
+def test_invalid_generation_request(api):
+    assert parse(exchange(api, post('/api/generate-game', b'not json')))[0] == 400
+    assert parse(exchange(api, post('/api/generate-game', b'{"title": ""}')))[0] == 400
+
+
+def test_malformed_framing_is_rejected(api):
+    assert parse(exchange(api, b'GET /api/languages HTTP/1.1\r\nContent-Length: -1\r\n\r\n'))[0] == 400
+    assert parse(exchange(api, b'GET /api/languages HTTP/1.1\r\nContent-Length: x\r\n\r\n'))[0] == 400
+    chunked = post('/api/generate-game', b'', b'Transfer-Encoding: chunked\r\n')
+    assert parse(exchange(api, chunked + b'5\r\nhello\r\n0\r\n\r\n'))[0] == 501
+    assert parse(exchange(api, b'NONSENSE\r\n\r\n'))[0] == 400
+
+
+def test_handler_exception_is_a_500(api):
+    def boom(params):
+        raise RuntimeError('boom')
+
+    api.list_games = boom
+    status, _, body = parse(exchange(api, get('/api/games')))
+    assert status == 500 and b'boom' not in body
+
+
+def test_busy_generation_gets_retry_after(api):
+    api.gate.admit()
+    status, headers, body = parse(exchange(api, post('/api/generate-game', GAME_REQUEST)))
+    assert status == 503
+    assert int(headers['retry-after']) >= 1
+    assert json.loads(body)['retry_after'] == int(headers['retry-after'])
+
+
+def test_game_listing_formats(api, game):
+    api.store.save_many([game, dict(game, title="Second")])
+    status, _, body = parse(exchange(api, get('/api/games?limit=1')))
+    listing = json.loads(body)
+    assert status == 200 and len(listing['games']) == 1
+    status, _, body = parse(exchange(api, get('/api/games?format=jsonl')))
+    assert status == 200 and len(body.splitlines()) == 2
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from indic_games.memo import MemoCache
+
+
+def test_hits_misses_and_lru_eviction():
+    cache = MemoCache(2)
+    assert cache.get_or_compute('a', lambda: 1) == 1
+    assert cache.get_or_compute('a', lambda: 2) == 1
+    cache.get_or_compute('b', lambda: 2)
+    cache.get_or_compute('a', lambda: 0)
+    cache.get_or_compute('c', lambda: 3)
+    assert cache.get_or_compute('b', lambda: 'recomputed') == 'recomputed'
+    assert cache.get_or_compute('c', lambda: 0) == 3
+    assert cache.evictions >= 1 and len(cache) == 2
+
+
+def test_entries_expire_after_ttl():
+    cache = MemoCache(4, ttl=0.01)
+    cache.get_or_compute('a', lambda: 1)
+    time.sleep(0.02)
+    assert cache.get_or_compute('a', lambda: 2) == 2
+    assert cache.expirations == 1
+
+
+def test_concurrent_threads_share_one_computation():
+    cache = MemoCache(4)
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute)))
+               for _ in range(5)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ['value'] * 5
+    assert len(calls) == 1 and cache.coalesced == 4
+
+
+def test_failures_reach_waiters_and_are_not_cached():
+    async def scenario():
+        cache = MemoCache(4)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(*(cache.get_or_compute_async('k', compute) for _ in range(3)),
+                                       return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(calls) == 1
+
+        async def recover():
+            return 'ok'
+
+        assert await cache.get_or_compute_async('k', recover) == 'ok'
+
+    asyncio.run(scenario())
+
+
+def test_sync_failure_is_not_cached():
+    cache = MemoCache(4)
+
+    def fail():
+        raise KeyError('k')
+
+    with pytest.raises(KeyError):
+        cache.get_or_compute('k', fail)
+    assert cache.get_or_compute('k', lambda: 1) == 1
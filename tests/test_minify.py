@@ -0,0 +1,43 @@
+from indic_games.minify import minify_css, minify_html
+
+
+def test_collapses_whitespace_between_tags():
+    assert minify_html('<div>\n    <p>Hello   world</p>\n</div>\n') == '<div> <p>Hello world</p> </div>'
+
+
+def test_preformatted_content_is_untouched():
+    page = '<p>a  b</p><pre>  keep\n   this</pre><textarea>x\n  y</textarea>'
+    result = minify_html(page)
+    assert '<pre>  keep\n   this</pre>' in result
+    assert '<textarea>x\n  y</textarea>' in result
+    assert '<p>a b</p>' in result
+
+
+def test_scripts_keep_line_breaks():
+    result = minify_html('<script>\n  let a = 1\n  let b = 2\n</script>')
+    assert 'let a = 1\n' in result and 'let b = 2' in result
+
+
+def test_comments_are_kept():
+    assert '<!-- game-assets -->' in minify_html('<head>\n  <!-- game-assets -->\n</head>')
+
+
+def test_css_drops_comments_and_merges_identical_keyframe_steps():
+    css = '''
+    /* pulse */
+    @keyframes pulse {
+        0% { opacity: 1; }
+        50% { opacity: 0.5; }
+        100% { opacity: 1; }
+    }
+    '''
+    result = minify_css(css)
+    assert '/*' not in result
+    assert '0%,100%{opacity:1' in result
+    assert '50%{opacity:0.5' in result
+
+
+def test_css_keeps_quoted_strings_and_descendant_pseudo_selectors():
+    result = minify_css('.a::after { content: "  two  spaces "; }\na :hover { color: red; }\na:hover { color: blue; }')
+    assert '"  two  spaces "' in result
+    assert 'a :hover{' in result and 'a:hover{' in result
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from indic_games import pipeline
+from indic_games.admission import AdmissionGate, BusyError
+from indic_games.backends import StaticBackend
+
+REQUEST = {'title': "Holi Colours", 'genre': 'Puzzle', 'theme': 'Festival - Holi', 'language': 'tamil'}
+
+
+@pytest.fixture
+def runner():
+    runner = pipeline.GenerationRunner(StaticBackend(), AdmissionGate(workers=1, max_queue=0,
+                                                                      queue_timeout=1, session_quota=1))
+    yield runner
+    runner.close()
+
+
+def test_job_reports_every_stage_and_saves(runner, store):
+    job = runner.submit(REQUEST, store=store)
+    stages = [event.stage for event in job.events() if event.elapsed_ms is not None]
+    assert stages == [stage for stage, _ in pipeline.STAGES]
+    game = job.result()
+    assert game.title == "Holi Colours"
+    assert store.count() == 1
+
+
+def test_busy_runner_fails_the_job(runner, store):
+    runner.gate.admit()
+    job = runner.submit(REQUEST, store=store)
+    assert list(job.events()) == []
+    with pytest.raises(BusyError):
+        job.result()
+
+
+def test_cancel_during_finalize_skips_the_save(runner, store, monkeypatch):
+    entered, resume = threading.Event(), threading.Event()
+    game_record = pipeline.game_record
+
+    def slow_game_record(*args):
+        entered.set()
+        resume.wait(5)
+        return game_record(*args)
+
+    monkeypatch.setattr(pipeline, 'game_record', slow_game_record)
+    job = runner.submit(REQUEST, store=store)
+    assert entered.wait(5)
+    job.cancel()
+    resume.set()
+    list(job.events())
+    assert store.count() == 0
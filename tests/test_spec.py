@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from indic_games import spec
+
+
+@pytest.fixture
+def saved(game):
+    return dict(game, id='0123456789abcdef0123456789abcdef', generated_at='2025-01-02 03:04:05')
+
+
+def test_json_is_canonical_and_round_trips(saved):
+    data = spec.dumps_json(saved)
+    assert data == spec.dumps_json(dict(reversed(list(saved.items()))))
+    assert spec.loads_json(data) == saved
+
+
+def test_jsonl_round_trips_and_skips_blank_lines(saved):
+    lines = list(spec.iter_jsonl([saved, dict(saved, title="Other")])) + [b'\n']
+    assert [g['title'] for g in spec.iter_load_jsonl(lines)] == [saved['title'], "Other"]
+
+
+def test_binary_round_trips_from_bytes_and_small_reads(saved):
+    games = [dict(saved, title=f"Game {number}", description='') for number in range(50)]
+    data = b''.join(spec.iter_binary(games))
+    assert list(spec.iter_load_binary(data)) == games
+    assert list(spec.iter_load_binary(io.BytesIO(data), chunk_size=7)) == games
+    assert spec.loads_binary(spec.dumps_binary(saved)) == saved
+
+
+def test_binary_shares_repeated_strings(saved):
+    one = len(spec.dumps_binary(saved))
+    many = len(b''.join(spec.iter_binary([saved] * 10)))
+    assert many < one * 10 * 0.7
+
+
+@pytest.mark.parametrize('data', [
+    b'{"spec_version": 99, "title": "x"}',
+    b'{"spec_version": 1, "title": "", "genre": "g", "theme": "t", "language": "l"}',
+    b'{"spec_version": 1, "title": "t", "genre": "g", "theme": "t", "language": "l", "mechanics": [1]}',
+    b'[]',
+    b'not json',
+])
+def test_invalid_json_specs_are_rejected(data):
+    with pytest.raises(spec.SpecError):
+        spec.loads_json(data)
+
+
+def test_corrupt_binary_streams_are_rejected(saved):
+    data = spec.dumps_binary(saved)
+    for corrupt in (b'XYZ\x01', spec.BINARY_MAGIC + b'\x09', data[:-3], data + b'\x05ab'):
+        with pytest.raises(spec.SpecError):
+            list(spec.iter_load_binary(corrupt))
+    with pytest.raises(spec.SpecError):
+        spec.loads_binary(b''.join(spec.iter_binary([saved, saved])))
+
+
+def test_js_declaration_names_a_valid_identifier(saved):
+    declaration = spec.js_declaration(dict(saved, title="9 Lives: Bhishma's Vow"))
+    assert declaration.startswith('const _9LivesBhishmasVowGame = {')
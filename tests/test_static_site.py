@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from indic_games.assets import AssetLibrary
+from indic_games.catalog import PREBUILT_GAMES
+from indic_games.static_site import INDEX_NAME, build_site, entry_path, load_manifest
+
+GAMES = PREBUILT_GAMES[:2]
+LANGUAGES = ['english', 'hindi']
+
+
+@pytest.fixture
+def site(tmp_path):
+    library = AssetLibrary(str(tmp_path / 'assets'))
+    site_dir = str(tmp_path / 'site')
+
+    def build(games=GAMES, languages=LANGUAGES, **options):
+        return build_site(site_dir, games, languages, library=library, **options)
+
+    build.dir = site_dir
+    build.library = library
+    return build
+
+
+def test_first_build_renders_every_page_and_the_index(site):
+    stats = site()
+    assert stats['pages'] == stats['rendered'] == 4
+    assert stats['index_rendered']
+    assert os.path.exists(os.path.join(site.dir, INDEX_NAME))
+    for game in GAMES:
+        for language in LANGUAGES:
+            assert os.path.exists(os.path.join(site.dir, entry_path(game, language)))
+    assert len(load_manifest(site.dir)['entries']) == 4
+
+
+def test_rebuild_without_changes_renders_nothing(site):
+    site()
+    stats = site()
+    assert stats['rendered'] == 0 and stats['unchanged'] == 4
+    assert not stats['index_rendered']
+    assert site(force=True)['rendered'] == 4
+
+
+def test_changed_game_rerenders_only_its_pages(site):
+    site()
+    changed = [dict(GAMES[0], description="A new telling"), GAMES[1]]
+    assert site(changed)['rendered'] == 2
+
+
+def test_deleted_page_is_rebuilt(site):
+    site()
+    os.remove(os.path.join(site.dir, entry_path(GAMES[1], 'hindi')))
+    assert site()['rendered'] == 1
+
+
+def test_language_subset_build_keeps_other_languages(site):
+    site()
+    stats = site(languages=['hindi'])
+    assert stats['pages'] == 4 and stats['rendered'] == 0 and stats['removed'] == 0
+    assert os.path.exists(os.path.join(site.dir, entry_path(GAMES[0], 'english')))
+    assert len(load_manifest(site.dir)['entries']) == 4
+
+
+def test_removed_game_pages_are_deleted(site):
+    site()
+    stats = site(GAMES[:1])
+    assert stats['removed'] == 2 and stats['pages'] == 2
+    assert not os.path.exists(os.path.join(site.dir, entry_path(GAMES[1], 'english')))
+    assert os.path.exists(os.path.join(site.dir, entry_path(GAMES[0], 'english')))
+
+
+def test_new_and_changed_assets_rerender_the_pages_using_them(site):
+    site()
+    common = os.path.join(site.library.root, 'common')
+    os.makedirs(common)
+    with open(os.path.join(common, 'logo.svg'), 'w') as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg"/>')
+    assert site()['rendered'] == 4
+    with open(os.path.join(common, 'logo.svg'), 'w') as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" width="2"/>')
+    assert site()['rendered'] == 4
+    assert site()['rendered'] == 0
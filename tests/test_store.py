@@ -0,0 +1,69 @@
+import sqlite3
+import threading
+
+import pytest
+
+from indic_games.store import GameStore
+
+
+def test_save_assigns_id_and_round_trips(store, game):
+    saved = store.save(game)
+    assert len(saved['id']) == 32
+    assert store.get(saved['id']) == saved
+    assert store.get('missing') is None
+
+
+def test_list_pages_newest_first_with_filters(store, game):
+    for number in range(5):
+        store.save(dict(game, title=f"Game {number}", generated_at=f"2025-01-0{number + 1} 10:00:00",
+                        language='tamil' if number % 2 else 'hindi'))
+    first, cursor = store.list(limit=2)
+    assert [g['title'] for g in first] == ['Game 4', 'Game 3']
+    second, cursor = store.list(limit=2, cursor=cursor)
+    assert [g['title'] for g in second] == ['Game 2', 'Game 1']
+    last, cursor = store.list(limit=2, cursor=cursor)
+    assert [g['title'] for g in last] == ['Game 0'] and cursor is None
+    tamil, _ = store.list(language='tamil')
+    assert [g['title'] for g in tamil] == ['Game 3', 'Game 1']
+    assert store.count(language='hindi') == 3
+
+
+def test_save_many_is_one_transaction(store, game):
+    with pytest.raises(Exception):
+        store.save_many([game, dict(game, title=None)])
+    assert store.count() == 0
+    assert store.save_many([game, dict(game, title="Second")]) == 2
+    assert store.count() == 2
+
+
+def test_pool_is_shared_across_threads(store, game):
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(20):
+                store.get(store.save(game)['id'])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert store.count() == 120
+
+
+def test_closed_store_fails_instead_of_blocking(tmp_path):
+    store = GameStore(str(tmp_path / 'games.db'), pool_size=1)
+    checkout = store._connection()
+    conn = checkout.__enter__()
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.count()
+    # A connection in use during close() is closed when it is returned
+    checkout.__exit__(None, None, None)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute('SELECT 1')
+    store.close()